@@ -7,6 +7,10 @@ from pathlib import Path
 
 from app.analysis.api_endpoints.models.endpoint import EndpointCandidate
 
+EXTRACTOR_NAME = "api_endpoints.fastapi"
+# Bump when extraction output changes so cached results are discarded.
+EXTRACTOR_VERSION = 1
+
 HTTP_METHODS = ("get", "post", "put", "delete", "patch", "options", "head")
 DECORATOR_RE = re.compile(
     r"@(?P<target>app|router)\.(?P<method>"
@@ -22,6 +22,9 @@ class DependencyCandidate:
 class DependencyExtractor(ABC):
     """Base class for dependency extractors."""
 
+    name: str = "dependency"
+    version: int = 1
+
     @abstractmethod
     def extract(self, path: Path, root_path: Path) -> list[DependencyCandidate]:
         """Extract dependency candidates from a file."""
@@ -18,6 +18,9 @@ from app.analysis.dependency.base import (
 class RequirementsDependencyExtractor(DependencyExtractor):
     """Extract dependencies from requirements.txt files."""
 
+    name = "dependency.requirements"
+    version = 1
+
     def extract(self, path: Path, root_path: Path) -> list[DependencyCandidate]:
         try:
             content = path.read_text(encoding="utf-8", errors="ignore")
@@ -2,58 +2,257 @@ from __future__ import annotations
 
 """Project tree extraction utilities."""
 
-from pathlib import Path
-from typing import Any, Iterable
+import os
+from pathlib import Path, PurePosixPath
+from typing import AbstractSet, Any, Callable, Iterable, Iterator, NamedTuple
+
+
+class _Entry(NamedTuple):
+    name: str
+    path: str
+    relative: str
+    is_dir: bool
 
 
 def build_project_tree(
-    root_path: Path, ignored_directories: Iterable[str] | None = None
+    root_path: Path,
+    ignored_directories: Iterable[str] | None = None,
+    path: str = ".",
+    depth: int | None = None,
 ) -> dict[str, Any]:
-    """Build a nested tree representation for a project path."""
+    """Build a nested tree representation for a project path.
+
+    ``path`` selects a sub-directory relative to the root and ``depth`` limits
+    how many levels of children are listed below it. Directories cut off by
+    the limit carry ``"truncated": True`` instead of ``children``.
+    """
+    ignored = set(ignored_directories or [])
+    start = _resolve_start(root_path, path, ignored)
+    return _build_node(start, lambda entry: _list_children(entry, ignored), depth)
+
+
+def iter_project_tree(
+    root_path: Path,
+    ignored_directories: Iterable[str] | None = None,
+    path: str = ".",
+    depth: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Return a generator of flat tree nodes in depth-first pre-order.
+
+    Each node has ``name``, ``path``, ``type`` and its ``depth`` below
+    ``path``. The start path is validated before the generator is returned,
+    so errors surface before any node is produced.
+    """
+    ignored = set(ignored_directories or [])
+    start = _resolve_start(root_path, path, ignored)
+    return _walk(start, lambda entry: _list_children(entry, ignored), depth)
+
+
+class TreeIndex:
+    """Directory listings of a project tree keyed by relative directory path.
+
+    Each listing is a sorted tuple of child names with directories marked by
+    a trailing ``/``. This is much smaller than the nested node dicts and can
+    be rendered for any ``path`` and ``depth`` without touching the disk.
+    Instances are never mutated; ``refresh`` returns a new index.
+    """
+
+    def __init__(
+        self,
+        root_path: Path,
+        ignored_directories: Iterable[str],
+        listings: dict[str, tuple[str, ...]],
+    ) -> None:
+        self.root_path = Path(root_path)
+        self.ignored_directories = frozenset(ignored_directories)
+        self._listings = listings
+
+    @classmethod
+    def scan(
+        cls, root_path: Path, ignored_directories: Iterable[str] | None = None
+    ) -> TreeIndex:
+        """Walk ``root_path`` and index every directory below it."""
+        root = Path(root_path)
+        if not root.exists():
+            raise FileNotFoundError(f"Path not found: {root}")
+        index = cls(root, ignored_directories or [], {})
+        index._scan_into(index._listings, ".")
+        return index
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def refresh(self, changed_paths: Iterable[str]) -> TreeIndex:
+        """Return an index with the directories holding ``changed_paths`` re-listed.
+
+        ``changed_paths`` are relative POSIX paths of entries that were added
+        or removed. Directories that appeared are scanned in full and those
+        that disappeared are dropped with everything below them.
+        """
+        dirty: set[str] = set()
+        for changed in changed_paths:
+            parts = changed.split("/")[:-1]
+            dirty.add(".")
+            dirty.update("/".join(parts[: end + 1]) for end in range(len(parts)))
+        if not dirty:
+            return self
+
+        listings = dict(self._listings)
+        by_depth = sorted(dirty, key=lambda value: (value != ".", value.count("/")))
+        for relative in by_depth:
+            previous = listings.get(relative)
+            # New directories are scanned with their parent, removed ones dropped.
+            if previous is None:
+                continue
+            current = self._listing(relative)
+            listings[relative] = current
+            before = {name for name in previous if name.endswith("/")}
+            after = {name for name in current if name.endswith("/")}
+            for name in before - after:
+                removed = _join(relative, name[:-1])
+                prefix = f"{removed}/"
+                doomed = [
+                    key for key in listings if key == removed or key.startswith(prefix)
+                ]
+                for key in doomed:
+                    del listings[key]
+            for name in after - before:
+                self._scan_into(listings, _join(relative, name[:-1]))
+        return TreeIndex(self.root_path, self.ignored_directories, listings)
+
+    def build(self, path: str = ".", depth: int | None = None) -> dict[str, Any]:
+        """Return the nested tree below ``path``, as ``build_project_tree`` would."""
+        return _build_node(self._resolve(path), self._children, depth)
+
+    def iter_nodes(
+        self, path: str = ".", depth: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Return a generator of flat nodes, as ``iter_project_tree`` would."""
+        return _walk(self._resolve(path), self._children, depth)
+
+    def _resolve(self, path: str) -> _Entry:
+        relative = PurePosixPath(path or ".")
+        if relative.is_absolute() or ".." in relative.parts:
+            raise ValueError("invalid tree path")
+        key = relative.as_posix()
+        if key == ".":
+            name = self.root_path.name or self.root_path.as_posix()
+            return _Entry(name, "", key, True)
+        if key in self._listings:
+            return _Entry(relative.name, "", key, True)
+        if relative.name in self._listings.get(relative.parent.as_posix(), ()):
+            return _Entry(relative.name, "", key, False)
+        raise ValueError("tree path not found")
+
+    def _children(self, entry: _Entry) -> list[_Entry]:
+        children: list[_Entry] = []
+        for name in self._listings.get(entry.relative, ()):
+            is_dir = name.endswith("/")
+            if is_dir:
+                name = name[:-1]
+            children.append(_Entry(name, "", _join(entry.relative, name), is_dir))
+        return children
+
+    def _listing(self, relative: str) -> tuple[str, ...]:
+        entry = _Entry("", str(self.root_path / relative), relative, True)
+        return tuple(
+            f"{child.name}/" if child.is_dir else child.name
+            for child in _list_children(entry, self.ignored_directories)
+        )
+
+    def _scan_into(self, listings: dict[str, tuple[str, ...]], relative: str) -> None:
+        pending = [relative]
+        while pending:
+            current = pending.pop()
+            listing = self._listing(current)
+            listings[current] = listing
+            pending.extend(
+                _join(current, name[:-1]) for name in listing if name.endswith("/")
+            )
+
+
+def _resolve_start(root_path: Path, path: str, ignored: set[str]) -> _Entry:
     root = Path(root_path)
     if not root.exists():
         raise FileNotFoundError(f"Path not found: {root}")
 
-    ignored = set(ignored_directories or [])
-    return _build_node(root, root, ignored)
+    relative = PurePosixPath(path or ".")
+    if relative.is_absolute() or ".." in relative.parts:
+        raise ValueError("invalid tree path")
+    target = root.joinpath(*relative.parts)
+    if any(part in ignored for part in relative.parts) or not target.exists():
+        raise ValueError("tree path not found")
+    if not target.resolve().is_relative_to(root.resolve()):
+        raise ValueError("invalid tree path")
+    return _Entry(
+        name=target.name or target.as_posix(),
+        path=str(target),
+        relative=relative.as_posix(),
+        is_dir=target.is_dir(),
+    )
 
 
-def _build_node(root: Path, current: Path, ignored: set[str]) -> dict[str, Any]:
+def _build_node(
+    entry: _Entry, children: Callable[[_Entry], list[_Entry]], depth: int | None
+) -> dict[str, Any]:
     node: dict[str, Any] = {
-        "name": current.name or current.as_posix(),
-        "path": _relative_path(root, current),
-        "type": "dir" if current.is_dir() else "file",
+        "name": entry.name,
+        "path": entry.relative,
+        "type": "dir" if entry.is_dir else "file",
     }
-
-    if current.is_dir():
-        children = []
-        for child in _iter_children(current, ignored):
-            children.append(_build_node(root, child, ignored))
-        node["children"] = children
-
+    if entry.is_dir:
+        if depth == 0:
+            node["truncated"] = True
+        else:
+            child_depth = None if depth is None else depth - 1
+            node["children"] = [
+                _build_node(child, children, child_depth) for child in children(entry)
+            ]
     return node
 
 
-def _iter_children(path: Path, ignored: set[str]) -> Iterable[Path]:
-    for child in sorted(path.iterdir(), key=_sort_key):
-        if _should_skip(child, ignored):
+def _walk(
+    start: _Entry, children: Callable[[_Entry], list[_Entry]], depth: int | None
+) -> Iterator[dict[str, Any]]:
+    stack = [(start, 0)]
+    while stack:
+        entry, level = stack.pop()
+        node: dict[str, Any] = {
+            "name": entry.name,
+            "path": entry.relative,
+            "type": "dir" if entry.is_dir else "file",
+            "depth": level,
+        }
+        if entry.is_dir and depth is not None and level >= depth:
+            node["truncated"] = True
+            yield node
             continue
-        yield child
-
-
-def _should_skip(path: Path, ignored: set[str]) -> bool:
-    return any(part in ignored for part in path.parts)
+        yield node
+        if entry.is_dir:
+            listed = children(entry)
+            stack.extend((child, level + 1) for child in reversed(listed))
 
 
-def _sort_key(path: Path) -> tuple[bool, str]:
-    return (path.is_file(), path.name.lower())
+def _join(directory: str, name: str) -> str:
+    return name if directory == "." else f"{directory}/{name}"
 
 
-def _relative_path(root: Path, current: Path) -> str:
+def _list_children(entry: _Entry, ignored: AbstractSet[str]) -> list[_Entry]:
+    # scandir reports the entry type from the directory listing, so each child
+    # costs at most one stat (for symlinks) instead of one per check.
+    children: list[_Entry] = []
     try:
-        relative = current.relative_to(root)
-    except ValueError:
-        return current.as_posix()
-    if relative.parts:
-        return relative.as_posix()
-    return "."
+        with os.scandir(entry.path) as listing:
+            for child in listing:
+                if child.name in ignored:
+                    continue
+                try:
+                    is_dir = child.is_dir()
+                except OSError:
+                    is_dir = False
+                relative = _join(entry.relative, child.name)
+                children.append(_Entry(child.name, child.path, relative, is_dir))
+    except OSError:
+        return []
+    children.sort(key=lambda child: (not child.is_dir, child.name.lower()))
+    return children
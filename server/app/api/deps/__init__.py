@@ -6,6 +6,7 @@ exposes them to the API layer via dependency injection.
 """
 
 from app.api.deps.analysis import (
+    build_project_analysis_service,
     get_analysis_framework_rule_repository,
     get_analysis_ignored_directory_repository,
     get_analysis_infra_rule_repository,
@@ -24,6 +25,7 @@ from app.api.deps.analysis import (
 from app.api.deps.auth import get_auth_service
 from app.api.deps.core import get_current_user, require_admin_bootstrap
 from app.api.deps.git import get_git_info_service
+from app.api.deps.jobs import get_analysis_job_repository, get_analysis_job_service
 from app.api.deps.identity import (
     get_membership_repository,
     get_membership_service,
@@ -45,9 +47,12 @@ from app.api.deps.projects import (
 )
 
 __all__ = [
+    "build_project_analysis_service",
     "get_analysis_framework_rule_repository",
     "get_analysis_ignored_directory_repository",
     "get_analysis_infra_rule_repository",
+    "get_analysis_job_repository",
+    "get_analysis_job_service",
     "get_analysis_language_rule_repository",
     "get_api_endpoint_analysis_service",
     "get_api_endpoint_repository",
@@ -47,10 +47,15 @@ from app.domains.projects.services.snapshot_project_dependency_service import (
     SnapshotProjectDependencyService,
 )
 from app.api.deps.projects import (
+    get_project_repository,
     get_project_service,
+    get_snapshot_framework_repository,
     get_snapshot_framework_service,
+    get_snapshot_infrastructure_repository,
     get_snapshot_infrastructure_service,
+    get_snapshot_language_repository,
     get_snapshot_language_service,
+    get_snapshot_repository,
     get_snapshot_service,
 )
 
@@ -221,6 +226,11 @@ def get_infrastructure_analysis_service(
 
 
 def get_project_analysis_service(
+    project_service=Depends(get_project_service),
+    ignored_directory_repository: AnalysisIgnoredDirectoryRepository = Depends(
+        get_analysis_ignored_directory_repository
+    ),
+    snapshot_service=Depends(get_snapshot_service),
     language_analysis_service: LanguageAnalysisService = Depends(
         get_language_analysis_service
     ),
@@ -239,9 +249,70 @@ def get_project_analysis_service(
 ) -> ProjectAnalysisService:
     """Provide a project analysis service instance."""
     return ProjectAnalysisService(
+        project_service=project_service,
+        ignored_directory_repository=ignored_directory_repository,
+        snapshot_service=snapshot_service,
         language_analysis_service=language_analysis_service,
         framework_analysis_service=framework_analysis_service,
         infrastructure_analysis_service=infrastructure_analysis_service,
         api_endpoint_analysis_service=api_endpoint_analysis_service,
         project_dependency_analysis_service=project_dependency_analysis_service,
     )
+
+
+def build_project_analysis_service(session: AsyncSession) -> ProjectAnalysisService:
+    """Build a project analysis service bound to ``session`` outside a request."""
+    ignored_directory_repository = get_analysis_ignored_directory_repository(session)
+    project_service = get_project_service(get_project_repository(session))
+    snapshot_service = get_snapshot_service(
+        snapshot_repository=get_snapshot_repository(session),
+        project_service=project_service,
+    )
+    return get_project_analysis_service(
+        project_service=project_service,
+        ignored_directory_repository=ignored_directory_repository,
+        snapshot_service=snapshot_service,
+        language_analysis_service=get_language_analysis_service(
+            language_rule_repository=get_analysis_language_rule_repository(session),
+            ignored_directory_repository=ignored_directory_repository,
+            project_service=project_service,
+            snapshot_service=snapshot_service,
+            snapshot_language_service=get_snapshot_language_service(
+                get_snapshot_language_repository(session)
+            ),
+        ),
+        framework_analysis_service=get_framework_analysis_service(
+            framework_rule_repository=get_analysis_framework_rule_repository(session),
+            ignored_directory_repository=ignored_directory_repository,
+            project_service=project_service,
+            snapshot_service=snapshot_service,
+            snapshot_framework_service=get_snapshot_framework_service(
+                get_snapshot_framework_repository(session)
+            ),
+        ),
+        infrastructure_analysis_service=get_infrastructure_analysis_service(
+            infra_rule_repository=get_analysis_infra_rule_repository(session),
+            ignored_directory_repository=ignored_directory_repository,
+            project_service=project_service,
+            snapshot_service=snapshot_service,
+            snapshot_infrastructure_service=get_snapshot_infrastructure_service(
+                get_snapshot_infrastructure_repository(session)
+            ),
+        ),
+        api_endpoint_analysis_service=get_api_endpoint_analysis_service(
+            ignored_directory_repository=ignored_directory_repository,
+            project_service=project_service,
+            snapshot_service=snapshot_service,
+            snapshot_api_endpoint_service=get_snapshot_api_endpoint_service(
+                get_api_endpoint_repository(session)
+            ),
+        ),
+        project_dependency_analysis_service=get_project_dependency_analysis_service(
+            ignored_directory_repository=ignored_directory_repository,
+            project_service=project_service,
+            snapshot_service=snapshot_service,
+            snapshot_dependency_service=get_snapshot_project_dependency_service(
+                get_project_dependency_repository(session)
+            ),
+        ),
+    )
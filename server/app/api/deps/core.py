@@ -10,6 +10,7 @@ from app.api.deps.identity import get_user_repository
 from app.core.security import decode_access_token
 from app.core.settings import AUTH_TOKEN_ENABLED
 from app.domains.auth.services.auth_service import AuthService
+from app.domains.identity.services.user_cache import get_user_cache
 from app.infrastructure.persistence.postgres.identity.entities.user import User
 from app.domains.identity.repository.user_repository import UserRepository
 
@@ -52,7 +53,12 @@ async def get_current_user(
             detail="invalid token",
         ) from exc
 
-    user = await user_repository.get_by_id(user_id)
+    user_cache = get_user_cache()
+    user = user_cache.get(user_id)
+    if user is None:
+        user = await user_repository.get_by_id(user_id)
+        if user:
+            user_cache.set(user)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,28 @@
+"""Jobs domain dependency providers."""
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_db
+from app.domains.jobs.repository.analysis_job_repository import AnalysisJobRepository
+from app.domains.jobs.services.analysis_job_service import AnalysisJobService
+from app.domains.projects.services.project_service import ProjectService
+from app.api.deps.projects import get_project_service
+
+
+def get_analysis_job_repository(
+    session: AsyncSession = Depends(get_db),
+) -> AnalysisJobRepository:
+    """Provide an analysis job repository instance."""
+    return AnalysisJobRepository(session)
+
+
+def get_analysis_job_service(
+    job_repository: AnalysisJobRepository = Depends(get_analysis_job_repository),
+    project_service: ProjectService = Depends(get_project_service),
+) -> AnalysisJobService:
+    """Provide an analysis job service instance."""
+    return AnalysisJobService(
+        job_repository=job_repository,
+        project_service=project_service,
+    )
@@ -7,21 +7,57 @@ import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from app.api.deps import get_current_user, get_project_analysis_service
+from app.api.deps import (
+    get_analysis_job_service,
+    get_current_user,
+    get_project_analysis_service,
+)
 from app.infrastructure.persistence.postgres.identity.entities.user import User
 from app.domains.analysis.models.dto.framework import ProjectFrameworkAnalysis
 from app.domains.analysis.models.dto.infrastructure import ProjectInfrastructureAnalysis
 from app.domains.analysis.models.dto.language import ProjectLanguageAnalysis
 from app.domains.analysis.models.dto.api_endpoint import ProjectApiEndpointAnalysis
 from app.domains.analysis.models.dto.dependency import ProjectDependencyPublic
+from app.domains.analysis.models.dto.project_analysis import ProjectFullAnalysis
 from app.domains.analysis.services.project_analysis_service import (
     ProjectAnalysisService,
 )
+from app.domains.jobs.models.dto.analysis_job import AnalysisJobPublic
+from app.domains.jobs.services.analysis_job_service import AnalysisJobService
+from app.domains.projects.models.snapshot_type import SnapshotType
 
 router = APIRouter(prefix="/projects", tags=["analysis"])
 logger = logging.getLogger(__name__)
 
 
+@router.post("/{project_id}/analysis", response_model=ProjectFullAnalysis)
+async def analyze_project(
+    project_id: uuid.UUID,
+    project_analysis_service: ProjectAnalysisService = Depends(
+        get_project_analysis_service
+    ),
+    current_user: User = Depends(get_current_user),
+) -> ProjectFullAnalysis:
+    """Run and persist every analysis type for a project from one scan."""
+    logger.info(
+        "POST /projects/%s/analysis by user_id=%s",
+        project_id,
+        current_user.id,
+    )
+    try:
+        analysis = await project_analysis_service.analyze_all(project_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if not analysis:
+        raise HTTPException(status_code=404, detail="project not found")
+    logger.info(
+        "Full analysis completed project_id=%s commit_hash=%s",
+        project_id,
+        analysis.commit_hash,
+    )
+    return analysis
+
+
 @router.post(
     "/{project_id}/analysis/languages", response_model=ProjectLanguageAnalysis
 )
@@ -339,3 +375,40 @@ async def get_project_dependency_analysis(
         len(dependencies),
     )
     return dependencies
+
+
+@router.post(
+    "/{project_id}/analysis/{analysis_type}/jobs",
+    response_model=AnalysisJobPublic,
+    status_code=202,
+)
+async def enqueue_project_analysis(
+    project_id: uuid.UUID,
+    analysis_type: SnapshotType,
+    analysis_job_service: AnalysisJobService = Depends(get_analysis_job_service),
+    current_user: User = Depends(get_current_user),
+) -> AnalysisJobPublic:
+    """Queue an analysis to run in the background and return its job."""
+    logger.info(
+        "POST /projects/%s/analysis/%s/jobs by user_id=%s",
+        project_id,
+        analysis_type.value,
+        current_user.id,
+    )
+    try:
+        job = await analysis_job_service.enqueue_analysis(
+            project_id,
+            analysis_type=analysis_type.value,
+            requested_by=current_user.id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if job is None:
+        raise HTTPException(status_code=404, detail="project not found")
+    logger.info(
+        "Analysis job queued project_id=%s job_id=%s status=%s",
+        project_id,
+        job.id,
+        job.status,
+    )
+    return job
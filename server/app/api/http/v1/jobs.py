@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+"""Analysis job endpoints."""
+
+import logging
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.api.deps import get_analysis_job_service, get_current_user
+from app.infrastructure.persistence.postgres.identity.entities.user import User
+from app.domains.jobs.models.dto.analysis_job import AnalysisJobPublic
+from app.domains.jobs.services.analysis_job_service import AnalysisJobService
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+logger = logging.getLogger(__name__)
+
+
+@router.get("/{job_id}", response_model=AnalysisJobPublic)
+async def get_analysis_job(
+    job_id: uuid.UUID,
+    analysis_job_service: AnalysisJobService = Depends(get_analysis_job_service),
+    current_user: User = Depends(get_current_user),
+) -> AnalysisJobPublic:
+    """Get status and result of an analysis job."""
+    logger.info("GET /jobs/%s by user_id=%s", job_id, current_user.id)
+    job = await analysis_job_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return job
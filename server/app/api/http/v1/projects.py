@@ -2,10 +2,13 @@ from __future__ import annotations
 
 """Project endpoints."""
 
+import json
 import logging
+from typing import Any, AsyncIterator
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import (
     get_current_user,
@@ -21,8 +24,10 @@ from app.domains.projects.models.dto.project import (
     ProjectMemberPublic,
     ProjectMemberUserPublic,
     ProjectPublic,
+    ProjectSettings,
 )
 from app.domains.analysis.models.dto.api_endpoint import ApiEndpointPage
+from app.domains.analysis.models.endpoint_scope import EndpointScope
 from app.domains.identity.services.membership_service import MembershipService
 from app.domains.projects.services.project_service import ProjectService
 from app.domains.projects.services.project_tree_service import ProjectTreeService
@@ -85,6 +90,28 @@ async def get_project(
     return project
 
 
+@router.put("/{project_id}/settings", response_model=ProjectPublic)
+async def update_project_settings(
+    project_id: uuid.UUID,
+    payload: ProjectSettings,
+    project_service: ProjectService = Depends(get_project_service),
+    current_user: User = Depends(get_current_user),
+) -> ProjectPublic:
+    """Replace the settings of a project."""
+    logger.info("PUT /projects/%s/settings by user_id=%s", project_id, current_user.id)
+    try:
+        project = await project_service.update_settings(
+            project_id, payload, actor_role=current_user.role
+        )
+    except PermissionError as exc:
+        raise HTTPException(status_code=403, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if project is None:
+        raise HTTPException(status_code=404, detail="project not found")
+    return project
+
+
 @router.post(
     "/{project_id}/members",
     response_model=ProjectMemberPublic,
@@ -135,6 +162,10 @@ async def list_project_endpoints(
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
     http_method: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=True),
+    scope: EndpointScope = Query(default=EndpointScope.ALL),
+    snapshot_id: uuid.UUID | None = Query(default=None),
 ) -> ApiEndpointPage:
     """List detected API endpoints for a project."""
     logger.info("GET /projects/%s/endpoints by user_id=%s", project_id, current_user.id)
@@ -147,12 +178,19 @@ async def list_project_endpoints(
             )
     else:
         normalized_method = None
-    page = await project_analysis_service.list_project_api_endpoints(
-        project_id=project_id,
-        limit=limit,
-        offset=offset,
-        http_method=normalized_method,
-    )
+    try:
+        page = await project_analysis_service.list_project_api_endpoints(
+            project_id=project_id,
+            limit=limit,
+            offset=offset,
+            http_method=normalized_method,
+            cursor=cursor,
+            include_total=include_total,
+            scope=scope,
+            snapshot_id=snapshot_id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if page is None:
         raise HTTPException(status_code=404, detail="project not found")
     return page
@@ -161,13 +199,31 @@ async def list_project_endpoints(
 @router.get("/{project_id}/tree")
 async def get_project_tree(
     project_id: uuid.UUID,
+    response: Response,
+    path: str = Query(default="."),
+    depth: int | None = Query(default=None, ge=0),
+    stream: bool = Query(default=False),
+    if_none_match: str | None = Header(default=None),
     project_tree_service: ProjectTreeService = Depends(get_project_tree_service),
     current_user: User = Depends(get_current_user),
 ):
-    """Return the file tree for a project."""
-    logger.info("GET /projects/%s/tree by user_id=%s", project_id, current_user.id)
+    """Return the file tree for a project.
+
+    ``path`` and ``depth`` let clients expand the tree lazily; ``stream``
+    returns flat nodes as NDJSON instead of one nested document. Responses
+    carry an ETag derived from the source version, so unchanged trees can be
+    revalidated with ``If-None-Match``.
+    """
+    logger.info(
+        "GET /projects/%s/tree by user_id=%s path=%s depth=%s stream=%s",
+        project_id,
+        current_user.id,
+        path,
+        depth,
+        stream,
+    )
     try:
-        tree = await project_tree_service.get_project_tree(project_id)
+        tree = await project_tree_service.get_tree(project_id)
     except FileNotFoundError as exc:
         raise HTTPException(
             status_code=409,
@@ -175,4 +231,28 @@ async def get_project_tree(
         ) from exc
     if tree is None:
         raise HTTPException(status_code=404, detail="project not found")
-    return tree
+
+    headers = {"ETag": tree.etag(path, depth, stream), "Cache-Control": "no-cache"}
+    if if_none_match and _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    try:
+        if stream:
+            nodes = await project_tree_service.stream_tree(tree, path=path, depth=depth)
+            return StreamingResponse(
+                _ndjson(nodes), media_type="application/x-ndjson", headers=headers
+            )
+        body = await project_tree_service.render_tree(tree, path=path, depth=depth)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    response.headers.update(headers)
+    return body
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+async def _ndjson(nodes: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    async for node in nodes:
+        yield json.dumps(node, separators=(",", ":")) + "\n"
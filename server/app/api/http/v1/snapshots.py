@@ -10,14 +10,42 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 from app.api.deps import get_current_user, get_snapshot_service
 from app.infrastructure.persistence.postgres.identity.entities.user import User
-from app.domains.projects.models.dto.snapshot import SnapshotPage, SnapshotPageNoSummary
+from app.domains.projects.models.dto.snapshot import (
+    ProjectLatestSnapshots,
+    SnapshotPage,
+    SnapshotPageNoSummary,
+    SnapshotProjectionPage,
+)
 from app.domains.projects.services.snapshot_service import SnapshotService
 
 router = APIRouter(prefix="/projects", tags=["snapshots"])
 logger = logging.getLogger(__name__)
 
 
-@router.get("/{project_id}/snapshots", response_model=SnapshotPage)
+@router.get("/snapshots/latest", response_model=list[ProjectLatestSnapshots])
+async def list_latest_snapshots(
+    project_id: list[uuid.UUID] = Query(min_length=1, max_length=500),
+    analysis_type: list[str] | None = Query(default=None),
+    snapshot_service: SnapshotService = Depends(get_snapshot_service),
+    current_user: User = Depends(get_current_user),
+) -> list[ProjectLatestSnapshots]:
+    """Return the latest snapshot per analysis type for several projects."""
+    logger.info(
+        "GET /projects/snapshots/latest projects=%s by user_id=%s",
+        len(project_id),
+        current_user.id,
+    )
+    return await snapshot_service.get_latest_snapshots(
+        project_ids=list(dict.fromkeys(project_id)),
+        analysis_types=analysis_type,
+    )
+
+
+@router.get(
+    "/{project_id}/snapshots",
+    response_model=SnapshotPage | SnapshotProjectionPage,
+    response_model_exclude_unset=True,
+)
 async def list_project_snapshots(
     project_id: uuid.UUID,
     snapshot_service: SnapshotService = Depends(get_snapshot_service),
@@ -26,18 +54,34 @@ async def list_project_snapshots(
     offset: int = Query(default=0, ge=0),
     start_at: datetime | None = Query(default=None),
     end_at: datetime | None = Query(default=None),
-) -> SnapshotPage:
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=True),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated snapshot fields to return, e.g. id,created_at",
+    ),
+) -> SnapshotPage | SnapshotProjectionPage:
     """List snapshots for a project with pagination and date filters."""
     logger.info(
         "GET /projects/%s/snapshots by user_id=%s", project_id, current_user.id
     )
-    page = await snapshot_service.list_snapshots(
-        project_id=project_id,
-        limit=limit,
-        offset=offset,
-        start_at=start_at,
-        end_at=end_at,
-    )
+    try:
+        page = await snapshot_service.list_snapshots(
+            project_id=project_id,
+            limit=limit,
+            offset=offset,
+            start_at=start_at,
+            end_at=end_at,
+            cursor=cursor,
+            include_total=include_total,
+            fields=(
+                [field.strip() for field in fields.split(",") if field.strip()]
+                if fields is not None
+                else None
+            ),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if page is None:
         raise HTTPException(status_code=404, detail="project not found")
     return page
@@ -55,6 +99,8 @@ async def list_project_snapshots_compact(
     offset: int = Query(default=0, ge=0),
     start_at: datetime | None = Query(default=None),
     end_at: datetime | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=True),
 ) -> SnapshotPageNoSummary:
     """List snapshots for a project without summary_json."""
     logger.info(
@@ -62,13 +108,18 @@ async def list_project_snapshots_compact(
         project_id,
         current_user.id,
     )
-    page = await snapshot_service.list_snapshots_without_summary(
-        project_id=project_id,
-        limit=limit,
-        offset=offset,
-        start_at=start_at,
-        end_at=end_at,
-    )
+    try:
+        page = await snapshot_service.list_snapshots_without_summary(
+            project_id=project_id,
+            limit=limit,
+            offset=offset,
+            start_at=start_at,
+            end_at=end_at,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if page is None:
         raise HTTPException(status_code=404, detail="project not found")
     return page
@@ -17,4 +17,71 @@ AUTH_TOKEN_ENABLED = (
     in {"1", "true", "yes", "on"}
 )
 
+AUTH_BOOTSTRAP_RECHECK_SECONDS = float(
+    get_env("AUTH_BOOTSTRAP_RECHECK_SECONDS", default="300")
+)
+
+USER_CACHE_TTL_SECONDS = float(get_env("USER_CACHE_TTL_SECONDS", default="60"))
+USER_CACHE_SIZE = int(get_env("USER_CACHE_SIZE", default="10000"))
+
 IRAOBSERVER_REPOS_DIR = Path(get_env("IRAOBSERVER_REPOS_DIR", required=True))
+# Clone strategy for git projects that do not choose one: full, shallow or blobless.
+GIT_CLONE_DEFAULT_STRATEGY = get_env("GIT_CLONE_DEFAULT_STRATEGY", default="full").strip().lower()
+GIT_CLONE_SHALLOW_DEPTH = int(get_env("GIT_CLONE_SHALLOW_DEPTH", default="50"))
+# Analyses fetch a git source unless it was fetched within this many seconds.
+GIT_SYNC_MAX_AGE_SECONDS = float(get_env("GIT_SYNC_MAX_AGE_SECONDS", default="300"))
+
+ANALYSIS_PARSE_WORKERS = int(get_env("ANALYSIS_PARSE_WORKERS", default="0"))
+ANALYSIS_PARSE_CHUNK_SIZE = int(get_env("ANALYSIS_PARSE_CHUNK_SIZE", default="256"))
+ANALYSIS_PARSE_MIN_FILES = int(get_env("ANALYSIS_PARSE_MIN_FILES", default="2000"))
+ANALYSIS_PARSE_CACHE_MAX_MB = int(get_env("ANALYSIS_PARSE_CACHE_MAX_MB", default="128"))
+
+ANALYSIS_RULES_LISTEN_KEEPALIVE_SECONDS = float(
+    get_env("ANALYSIS_RULES_LISTEN_KEEPALIVE_SECONDS", default="30")
+)
+
+BLOCKING_IO_WORKERS = int(get_env("BLOCKING_IO_WORKERS", default="8"))
+# Threads running clone, scan and detection steps. One analysis runs several
+# steps, so this bounds concurrent steps, not concurrent analyses; background
+# jobs are additionally bounded by ANALYSIS_JOB_WORKERS.
+ANALYSIS_MAX_CONCURRENCY = int(get_env("ANALYSIS_MAX_CONCURRENCY", default="2"))
+
+ANALYSIS_JOB_WORKERS = int(get_env("ANALYSIS_JOB_WORKERS", default="2"))
+ANALYSIS_JOB_POLL_SECONDS = float(get_env("ANALYSIS_JOB_POLL_SECONDS", default="2"))
+# Running jobs are requeued when no heartbeat arrived for ANALYSIS_JOB_STALE_SECONDS;
+# keep it several heartbeats long.
+ANALYSIS_JOB_HEARTBEAT_SECONDS = float(
+    get_env("ANALYSIS_JOB_HEARTBEAT_SECONDS", default="30")
+)
+ANALYSIS_JOB_STALE_SECONDS = int(get_env("ANALYSIS_JOB_STALE_SECONDS", default="180"))
+ANALYSIS_JOB_MAX_ATTEMPTS = int(get_env("ANALYSIS_JOB_MAX_ATTEMPTS", default="3"))
+
+PAGINATION_COUNT_CACHE_SECONDS = float(
+    get_env("PAGINATION_COUNT_CACHE_SECONDS", default="30")
+)
+PAGINATION_COUNT_CACHE_SIZE = int(get_env("PAGINATION_COUNT_CACHE_SIZE", default="1024"))
+
+PROJECT_TREE_CACHE_SIZE = int(get_env("PROJECT_TREE_CACHE_SIZE", default="64"))
+PROJECT_TREE_CACHE_TTL_SECONDS = float(
+    get_env("PROJECT_TREE_CACHE_TTL_SECONDS", default="3600")
+)
+
+SNAPSHOT_SUMMARY_TOP_N = int(get_env("SNAPSHOT_SUMMARY_TOP_N", default="20"))
+
+SNAPSHOT_RETENTION_INTERVAL_SECONDS = float(
+    get_env("SNAPSHOT_RETENTION_INTERVAL_SECONDS", default="0")
+)
+SNAPSHOT_RETENTION_BATCH_SIZE = int(get_env("SNAPSHOT_RETENTION_BATCH_SIZE", default="200"))
+SNAPSHOT_RETENTION_KEEP_LAST = int(get_env("SNAPSHOT_RETENTION_KEEP_LAST", default="10"))
+SNAPSHOT_RETENTION_KEEP_DAILY_DAYS = int(
+    get_env("SNAPSHOT_RETENTION_KEEP_DAILY_DAYS", default="30")
+)
+# Empty keeps one snapshot per week forever; 0 disables weekly retention.
+_SNAPSHOT_RETENTION_KEEP_WEEKLY_WEEKS = get_env(
+    "SNAPSHOT_RETENTION_KEEP_WEEKLY_WEEKS", default=""
+).strip()
+SNAPSHOT_RETENTION_KEEP_WEEKLY_WEEKS = (
+    int(_SNAPSHOT_RETENTION_KEEP_WEEKLY_WEEKS)
+    if _SNAPSHOT_RETENTION_KEEP_WEEKLY_WEEKS
+    else None
+)
@@ -12,6 +12,7 @@ from app.domains.analysis.models.dto.dependency import (
 from app.domains.analysis.models.dto.framework import ProjectFrameworkAnalysis
 from app.domains.analysis.models.dto.infrastructure import ProjectInfrastructureAnalysis
 from app.domains.analysis.models.dto.language import ProjectLanguageAnalysis
+from app.domains.analysis.models.dto.project_analysis import ProjectFullAnalysis
 
 __all__ = [
     "ApiEndpointPage",
@@ -22,6 +23,7 @@ __all__ = [
     "ProjectDependencyPage",
     "ProjectDependencyPublic",
     "ProjectFrameworkAnalysis",
+    "ProjectFullAnalysis",
     "ProjectInfrastructureAnalysis",
     "ProjectLanguageAnalysis",
 ]
@@ -46,6 +46,7 @@ class ApiEndpointPage(SQLModel):
     """Paginated API endpoints response."""
 
     items: list[ApiEndpointPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
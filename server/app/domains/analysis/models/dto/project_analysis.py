@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+"""Combined project analysis DTOs."""
+
+from sqlmodel import SQLModel
+
+from app.domains.analysis.models.dto.api_endpoint import ProjectApiEndpointAnalysis
+from app.domains.analysis.models.dto.dependency import ProjectDependencyPublic
+from app.domains.analysis.models.dto.framework import ProjectFrameworkAnalysis
+from app.domains.analysis.models.dto.infrastructure import ProjectInfrastructureAnalysis
+from app.domains.analysis.models.dto.language import ProjectLanguageAnalysis
+
+
+class ProjectFullAnalysis(SQLModel):
+    """Results of every analysis type computed from one source scan."""
+
+    commit_hash: str | None
+    languages: ProjectLanguageAnalysis
+    frameworks: ProjectFrameworkAnalysis
+    infrastructure: ProjectInfrastructureAnalysis
+    api_endpoints: ProjectApiEndpointAnalysis
+    dependencies: list[ProjectDependencyPublic]
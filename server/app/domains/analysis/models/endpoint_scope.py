@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class EndpointScope(str, Enum):
+    ALL = "all"
+    LATEST = "latest"
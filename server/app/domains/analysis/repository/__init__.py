@@ -10,6 +10,9 @@ from app.domains.analysis.repository.analysis_infra_rule_repository import (
 from app.domains.analysis.repository.analysis_language_rule_repository import (
     AnalysisLanguageRuleRepository,
 )
+from app.domains.analysis.repository.analysis_rules_version_repository import (
+    AnalysisRulesVersionRepository,
+)
 from app.domains.analysis.repository.api_endpoint_repository import (
     ApiEndpointRepository,
 )
@@ -31,6 +34,7 @@ __all__ = [
     "AnalysisIgnoredDirectoryRepository",
     "AnalysisInfraRuleRepository",
     "AnalysisLanguageRuleRepository",
+    "AnalysisRulesVersionRepository",
     "ApiEndpointRepository",
     "ProjectDependencyRepository",
     "SnapshotFrameworkRepository",
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+"""Postgres repository for the analysis rules version counter."""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.persistence.postgres.analysis.entities.analysis_rules_version import (
+    AnalysisRulesVersion,
+)
+
+RULES_CHANGED_CHANNEL = "analysis_rules_changed"
+
+
+class AnalysisRulesVersionRepository:
+    """Data access for the counter bumped by writes to the rule tables."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_version(self) -> int:
+        """Return the current rules version, or 0 if the counter row is missing."""
+        result = await self.session.execute(select(AnalysisRulesVersion.version))
+        return result.scalar_one_or_none() or 0
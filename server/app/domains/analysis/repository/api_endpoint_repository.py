@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import func
+from sqlalchemy import func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.infrastructure.persistence.postgres.analysis.entities.api_endpoint import ApiEndpoint
+from app.infrastructure.persistence.postgres.bulk import insert_returning
 from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.shared.pagination.keyset import KeysetPosition
 
 
 class ApiEndpointRepository:
@@ -19,14 +21,13 @@ class ApiEndpointRepository:
         self.session = session
 
     async def create_many(
-        self, entries: list[ApiEndpoint]
+        self, entries: list[ApiEndpoint], commit: bool = True
     ) -> list[ApiEndpoint]:
-        """Persist API endpoint entries."""
-        self.session.add_all(entries)
-        await self.session.commit()
-        for entry in entries:
-            await self.session.refresh(entry)
-        return entries
+        """Bulk insert API endpoint entries; leave the transaction open if ``commit`` is False."""
+        created = await insert_returning(self.session, ApiEndpoint, entries)
+        if commit:
+            await self.session.commit()
+        return created
 
     async def list_by_snapshot(self, snapshot_id: uuid.UUID) -> list[ApiEndpoint]:
         """List API endpoints for a snapshot."""
@@ -41,31 +42,59 @@ class ApiEndpointRepository:
         limit: int = 100,
         offset: int = 0,
         http_method: str | None = None,
+        after: KeysetPosition | None = None,
+        snapshot_id: uuid.UUID | None = None,
     ) -> list[ApiEndpoint]:
-        """List API endpoints for a project."""
-        query = (
-            select(ApiEndpoint)
-            .join(Snapshot, ApiEndpoint.snapshot_id == Snapshot.id)
-            .where(Snapshot.project_id == project_id)
+        """List API endpoints for a project, newest first.
+
+        With ``snapshot_id`` only that snapshot's endpoints are read, without
+        joining the project's other snapshots. When ``after`` is given, rows
+        strictly older than that ``(created_at, id)`` position are returned
+        and ``offset`` is ignored.
+        """
+        query = self._filter(
+            select(ApiEndpoint), project_id, snapshot_id, http_method
         )
-        if http_method:
-            query = query.where(ApiEndpoint.http_method == http_method)
+        if after is not None:
+            query = query.where(tuple_(ApiEndpoint.created_at, ApiEndpoint.id) < after)
+        else:
+            query = query.offset(offset)
         result = await self.session.execute(
-            query.order_by(ApiEndpoint.created_at.desc()).limit(limit).offset(offset)
+            query.order_by(ApiEndpoint.created_at.desc(), ApiEndpoint.id.desc()).limit(
+                limit
+            )
         )
         return list(result.scalars().all())
 
     async def count_by_project(
-        self, project_id: uuid.UUID, http_method: str | None = None
+        self,
+        project_id: uuid.UUID,
+        http_method: str | None = None,
+        snapshot_id: uuid.UUID | None = None,
     ) -> int:
-        """Count API endpoints for a project."""
-        query = (
-            select(func.count())
-            .select_from(ApiEndpoint)
-            .join(Snapshot, ApiEndpoint.snapshot_id == Snapshot.id)
-            .where(Snapshot.project_id == project_id)
+        """Count API endpoints for a project or one of its snapshots."""
+        query = self._filter(
+            select(func.count()).select_from(ApiEndpoint),
+            project_id,
+            snapshot_id,
+            http_method,
         )
-        if http_method:
-            query = query.where(ApiEndpoint.http_method == http_method)
         result = await self.session.execute(query)
         return int(result.scalar_one())
+
+    @staticmethod
+    def _filter(
+        query,
+        project_id: uuid.UUID,
+        snapshot_id: uuid.UUID | None,
+        http_method: str | None,
+    ):
+        if snapshot_id is not None:
+            query = query.where(ApiEndpoint.snapshot_id == snapshot_id)
+        else:
+            query = query.join(Snapshot, ApiEndpoint.snapshot_id == Snapshot.id).where(
+                Snapshot.project_id == project_id
+            )
+        if http_method:
+            query = query.where(ApiEndpoint.http_method == http_method)
+        return query
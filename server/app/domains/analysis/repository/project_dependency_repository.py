@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.infrastructure.persistence.postgres.analysis.entities.project_dependency import ProjectDependency
+from app.infrastructure.persistence.postgres.bulk import insert_returning
 
 
 class ProjectDependencyRepository:
@@ -17,14 +18,13 @@ class ProjectDependencyRepository:
         self.session = session
 
     async def create_many(
-        self, entries: list[ProjectDependency]
+        self, entries: list[ProjectDependency], commit: bool = True
     ) -> list[ProjectDependency]:
-        """Persist project dependency entries."""
-        self.session.add_all(entries)
-        await self.session.commit()
-        for entry in entries:
-            await self.session.refresh(entry)
-        return entries
+        """Bulk insert project dependency entries; leave the transaction open if ``commit`` is False."""
+        created = await insert_returning(self.session, ProjectDependency, entries)
+        if commit:
+            await self.session.commit()
+        return created
 
     async def list_by_snapshot(
         self, snapshot_id: uuid.UUID
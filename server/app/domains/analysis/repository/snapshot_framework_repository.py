@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.infrastructure.persistence.postgres.analysis.entities.snapshot_framework import SnapshotFramework
+from app.infrastructure.persistence.postgres.bulk import insert_returning
 
 
 class SnapshotFrameworkRepository:
@@ -17,14 +18,13 @@ class SnapshotFrameworkRepository:
         self.session = session
 
     async def create_many(
-        self, entries: list[SnapshotFramework]
+        self, entries: list[SnapshotFramework], commit: bool = True
     ) -> list[SnapshotFramework]:
-        """Persist snapshot framework entries."""
-        self.session.add_all(entries)
-        await self.session.commit()
-        for entry in entries:
-            await self.session.refresh(entry)
-        return entries
+        """Bulk insert snapshot framework entries; leave the transaction open if ``commit`` is False."""
+        created = await insert_returning(self.session, SnapshotFramework, entries)
+        if commit:
+            await self.session.commit()
+        return created
 
     async def list_by_snapshot(
         self, snapshot_id: uuid.UUID
@@ -11,6 +11,7 @@ from sqlmodel import select
 from app.infrastructure.persistence.postgres.analysis.entities.snapshot_infrastructure import (
     SnapshotInfrastructure,
 )
+from app.infrastructure.persistence.postgres.bulk import insert_returning
 
 
 class SnapshotInfrastructureRepository:
@@ -22,15 +23,14 @@ class SnapshotInfrastructureRepository:
         self.session = session
 
     async def create_many(
-        self, entries: list[SnapshotInfrastructure]
+        self, entries: list[SnapshotInfrastructure], commit: bool = True
     ) -> list[SnapshotInfrastructure]:
-        """Persist snapshot infrastructure entries."""
+        """Bulk insert snapshot infrastructure entries; leave the transaction open if ``commit`` is False."""
         self.logger.debug("Persisting snapshot infrastructure entries=%s", len(entries))
-        self.session.add_all(entries)
-        await self.session.commit()
-        for entry in entries:
-            await self.session.refresh(entry)
-        return entries
+        created = await insert_returning(self.session, SnapshotInfrastructure, entries)
+        if commit:
+            await self.session.commit()
+        return created
 
     async def list_by_snapshot(
         self, snapshot_id: uuid.UUID
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+"""Process-wide cache of active analysis rules and the detectors built from them."""
+
+from functools import lru_cache
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.core.db import AsyncSessionLocal, engine
+from app.core.settings import ANALYSIS_RULES_LISTEN_KEEPALIVE_SECONDS
+from app.domains.analysis.repository.analysis_ignored_directory_repository import (
+    AnalysisIgnoredDirectoryRepository,
+)
+from app.domains.analysis.repository.analysis_rules_version_repository import (
+    RULES_CHANGED_CHANNEL,
+    AnalysisRulesVersionRepository,
+)
+from app.infrastructure.persistence.postgres.notifications import PostgresListener
+
+T = TypeVar("T")
+
+
+class AnalysisRuleCache:
+    """Cache values derived from the rule tables until the rules change.
+
+    Entries are tagged with a generation that moves whenever the rules may
+    have changed. While a LISTEN subscription is live, notifications from the
+    rule table triggers advance it and lookups never touch the database.
+    Otherwise every lookup compares the stored rules version counter, which is
+    a single-row read instead of reloading and recompiling every rule.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, read_version: Callable[[], Awaitable[int]]) -> None:
+        self.read_version = read_version
+        self.generation = 0
+        self._entries: dict[str, tuple[int, Any]] = {}
+        self._listening = False
+        self._seen_version: int | None = None
+
+    async def get(self, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for ``key`` or build it with ``load``."""
+        await self._sync_version()
+        generation = self.generation
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+        value = await load()
+        # A change seen while loading means the value may already be stale.
+        if generation == self.generation:
+            self._entries[key] = (generation, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every cached value."""
+        self.generation += 1
+        self._entries.clear()
+
+    def notify(self, payload: str) -> None:
+        """Handle a rules-changed notification."""
+        self.logger.info("Analysis rules changed version=%s", payload)
+        self.invalidate()
+
+    def set_listening(self, listening: bool) -> None:
+        """Record whether notifications are currently being received."""
+        self._listening = listening
+        self._seen_version = None
+        self.invalidate()
+
+    async def _sync_version(self) -> None:
+        if self._listening:
+            return
+        version = await self.read_version()
+        if version != self._seen_version:
+            if self._seen_version is not None:
+                self.logger.info("Analysis rules version changed version=%s", version)
+            self._seen_version = version
+            self.invalidate()
+
+
+async def _read_rules_version() -> int:
+    async with AsyncSessionLocal() as session:
+        return await AnalysisRulesVersionRepository(session).get_version()
+
+
+@lru_cache(maxsize=1)
+def get_analysis_rule_cache() -> AnalysisRuleCache:
+    """Return the process-wide analysis rule cache."""
+    return AnalysisRuleCache(_read_rules_version)
+
+
+@lru_cache(maxsize=1)
+def get_analysis_rules_listener() -> PostgresListener:
+    """Return the listener that invalidates the rule cache across processes."""
+    cache = get_analysis_rule_cache()
+    return PostgresListener(
+        engine,
+        RULES_CHANGED_CHANNEL,
+        on_notify=cache.notify,
+        on_state=cache.set_listening,
+        keepalive=ANALYSIS_RULES_LISTEN_KEEPALIVE_SECONDS,
+    )
+
+
+async def active_ignored_directories(
+    repository: AnalysisIgnoredDirectoryRepository,
+) -> frozenset[str]:
+    """Return the names of active ignored directories."""
+
+    async def load() -> frozenset[str]:
+        return frozenset(entry.name for entry in await repository.list_active())
+
+    return await get_analysis_rule_cache().get("ignored_directories", load)
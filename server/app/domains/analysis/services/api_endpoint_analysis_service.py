@@ -1,32 +1,56 @@
 from __future__ import annotations
 
-from app.shared.filesystem.scanner import FileSystemScanner
+from app.shared.filesystem.scan_index import ScanIndex
 
 """API endpoint analysis application service."""
 
+from dataclasses import astuple
 import logging
 from pathlib import Path
+from typing import Sequence
 import uuid
 
-from app.analysis.api_endpoints.analyzers.fastapi import extract_fastapi_endpoints
+from app.analysis.api_endpoints.analyzers.fastapi import (
+    EXTRACTOR_NAME,
+    EXTRACTOR_VERSION,
+    extract_fastapi_endpoints,
+)
 from app.analysis.api_endpoints.models.endpoint import EndpointCandidate
+from app.core.settings import SNAPSHOT_SUMMARY_TOP_N
+from app.domains.analysis.services.analysis_rule_cache import active_ignored_directories
 from app.domains.analysis.models.dto.api_endpoint import (
     ApiEndpointCreate,
     ApiEndpointPage,
     ApiEndpointPublic,
     ProjectApiEndpointAnalysis,
 )
+from app.domains.analysis.models.endpoint_scope import EndpointScope
 from app.domains.analysis.repository.analysis_ignored_directory_repository import (
     AnalysisIgnoredDirectoryRepository,
 )
 from app.domains.projects.models.snapshot_type import SnapshotType
-from app.domains.projects.models.source_type import SourceType
 from app.domains.projects.services.project_service import ProjectService
+from app.domains.projects.services.project_source import (
+    resolve_project_source,
+    source_read_lock,
+)
 from app.domains.projects.services.snapshot_api_endpoint_service import (
     SnapshotApiEndpointService,
 )
 from app.domains.projects.services.snapshot_service import SnapshotService
-from app.infrastructure.external.source.orchestartor import prepare_source
+from app.domains.analysis.services.fingerprint import result_fingerprint
+from app.domains.analysis.services.incremental import (
+    SCAN_CONFIG_KEY,
+    changes_since_snapshot,
+    scan_config_key,
+)
+from app.infrastructure.external.git.commits import get_clean_head_commit
+from app.infrastructure.external.git.diff import GitFileChanges
+from app.infrastructure.persistence.postgres.analysis.entities.api_endpoint import ApiEndpoint
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.shared.cache.parse_cache import get_parse_cache
+from app.shared.concurrency.executor import run_analysis, run_blocking
+from app.shared.pagination.keyset import cached_total, decode_cursor, encode_cursor
 
 
 class ApiEndpointAnalysisService:
@@ -53,27 +77,8 @@ class ApiEndpointAnalysisService:
         self.logger.info(
             "Analyzing and storing API endpoints for project_id=%s", project_id
         )
-        project = await self.project_service.get_project(project_id)
-        if not project:
-            return None
-
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=True,
-        )
-        ignored_directories = await self.ignored_directory_repository.list_active()
-        scanner = FileSystemScanner(
-            root_path=source_path,
-            ignored_directories={entry.name for entry in ignored_directories},
-        )
-
-        detected = self._extract_fastapi_endpoints(scanner, source_path)
-        return await self._store_detected_endpoints(
-            project_id=project_id,
-            detected=detected,
-            title="API endpoint analysis snapshot",
+        return await self._analyze_and_store(
+            project_id, title="API endpoint analysis snapshot"
         )
 
     async def analyze_and_store_fastapi_endpoints(
@@ -83,28 +88,65 @@ class ApiEndpointAnalysisService:
         self.logger.info(
             "Analyzing and storing FastAPI endpoints for project_id=%s", project_id
         )
+        return await self._analyze_and_store(
+            project_id, title="FastAPI endpoint analysis snapshot"
+        )
+
+    async def _analyze_and_store(
+        self, project_id: uuid.UUID, title: str
+    ) -> ProjectApiEndpointAnalysis | None:
         project = await self.project_service.get_project(project_id)
         if not project:
             return None
 
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=True,
+        source_path = await resolve_project_source(project, allow_clone=True, sync=True)
+        ignored_directories = await active_ignored_directories(
+            self.ignored_directory_repository
         )
-        ignored_directories = await self.ignored_directory_repository.list_active()
-        scanner = FileSystemScanner(
-            root_path=source_path,
-            ignored_directories={entry.name for entry in ignored_directories},
-        )
-
-        detected = self._extract_fastapi_endpoints(scanner, source_path)
-        return await self._store_detected_endpoints(
+        async with source_read_lock(project, source_path):
+            head_commit = await run_blocking(
+                get_clean_head_commit, source_path, ignored_directories
+            )
+            config_key = scan_config_key(ignored_directories)
+            previous = await self.snapshot_service.get_latest_snapshot(
+                project_id, analysis_type=SnapshotType.API_ENDPOINTS.value
+            )
+            changes = await changes_since_snapshot(
+                previous, source_path, head_commit, config_key, ignored_directories
+            )
+            if changes is None:
+                index = await run_analysis(
+                    ScanIndex.build,
+                    root_path=source_path,
+                    ignored_directories=ignored_directories,
+                )
+                detected = await run_analysis(
+                    self.extract_endpoints, index, source_path
+                )
+            else:
+                self.logger.info(
+                    "Updating API endpoints incrementally "
+                    "project_id=%s changed_files=%s",
+                    project_id,
+                    len(changes.touched),
+                )
+                previous_entries = (
+                    await self.snapshot_api_endpoint_service.get_snapshot_api_endpoints(
+                        previous.id
+                    )
+                )
+                detected = await run_analysis(
+                    self.merge_changes, previous_entries, changes, source_path
+                )
+        snapshot = await self.store_api_endpoints(
             project_id=project_id,
             detected=detected,
-            title="FastAPI endpoint analysis snapshot",
+            title=title,
+            commit_hash=head_commit,
+            scan_config=config_key,
+            project_checked=True,
         )
+        return await self.load_api_endpoints(snapshot.id)
 
     async def get_latest_api_endpoint_analysis(
         self, project_id: uuid.UUID
@@ -124,8 +166,14 @@ class ApiEndpointAnalysisService:
         if not snapshot:
             return ProjectApiEndpointAnalysis(endpoints=[])
 
+        return await self.load_api_endpoints(snapshot.id)
+
+    async def load_api_endpoints(
+        self, snapshot_id: uuid.UUID
+    ) -> ProjectApiEndpointAnalysis:
+        """Return the API endpoints stored for a snapshot."""
         entries = await self.snapshot_api_endpoint_service.get_snapshot_api_endpoints(
-            snapshot.id
+            snapshot_id
         )
         return ProjectApiEndpointAnalysis(
             endpoints=[
@@ -151,23 +199,72 @@ class ApiEndpointAnalysisService:
         limit: int = 100,
         offset: int = 0,
         http_method: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
+        scope: EndpointScope = EndpointScope.ALL,
+        snapshot_id: uuid.UUID | None = None,
     ) -> ApiEndpointPage | None:
-        """Return stored API endpoints for a project."""
-        self.logger.info("Listing API endpoints project_id=%s", project_id)
+        """Return stored API endpoints for a project.
+
+        ``scope=latest`` or an explicit ``snapshot_id`` restricts the listing to
+        one API endpoint snapshot instead of every historical one. Pages
+        continue from ``cursor`` when given; totals are served from a
+        short-lived cache and skipped entirely when ``include_total`` is False.
+        """
+        self.logger.info(
+            "Listing API endpoints project_id=%s scope=%s snapshot_id=%s",
+            project_id,
+            scope.value,
+            snapshot_id,
+        )
         project = await self.project_service.get_project(project_id)
         if not project:
             return None
 
+        if snapshot_id is not None:
+            snapshot = await self.snapshot_service.get_project_snapshot(
+                project_id, snapshot_id
+            )
+            if (
+                snapshot is None
+                or snapshot.analysis_type != SnapshotType.API_ENDPOINTS.value
+            ):
+                raise ValueError("api endpoint snapshot not found")
+        elif scope == EndpointScope.LATEST:
+            snapshot = await self.snapshot_service.get_latest_snapshot(
+                project_id, analysis_type=SnapshotType.API_ENDPOINTS.value
+            )
+            if snapshot is None:
+                return ApiEndpointPage(
+                    items=[],
+                    total=0 if include_total else None,
+                    limit=limit,
+                    offset=offset,
+                )
+            snapshot_id = snapshot.id
+
         entries = await self.snapshot_api_endpoint_service.get_project_api_endpoints(
             project_id=project_id,
-            limit=limit,
+            limit=limit + 1,
             offset=offset,
             http_method=http_method,
+            after=decode_cursor(cursor) if cursor else None,
+            snapshot_id=snapshot_id,
         )
-        total = await self.snapshot_api_endpoint_service.count_project_api_endpoints(
-            project_id=project_id,
-            http_method=http_method,
-        )
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            next_cursor = encode_cursor(entries[-1].created_at, entries[-1].id)
+        total = None
+        if include_total:
+            total = await cached_total(
+                ("api_endpoints", project_id, snapshot_id, http_method),
+                lambda: self.snapshot_api_endpoint_service.count_project_api_endpoints(
+                    project_id=project_id,
+                    http_method=http_method,
+                    snapshot_id=snapshot_id,
+                ),
+            )
         items = [
             ApiEndpointPublic(
                 id=entry.id,
@@ -183,36 +280,111 @@ class ApiEndpointAnalysisService:
             )
             for entry in entries
         ]
-        return ApiEndpointPage(items=items, total=total, limit=limit, offset=offset)
+        return ApiEndpointPage(
+            items=items,
+            total=total,
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+        )
 
-    def _extract_fastapi_endpoints(
-        self, scanner: FileSystemScanner, root_path: Path
+    def extract_endpoints(
+        self, index: ScanIndex, root_path: Path
     ) -> list[EndpointCandidate]:
-        endpoints: list[EndpointCandidate] = []
-        for path in scanner.scan_files():
-            if path.suffix.lower() != ".py":
-                continue
-            endpoints.extend(extract_fastapi_endpoints(path, root_path))
+        """Extract FastAPI endpoint candidates from indexed Python files."""
+        return self._extract_files(list(index.files_with_suffix(".py")), root_path)
+
+    def merge_changes(
+        self,
+        previous_entries: list[ApiEndpoint],
+        changes: GitFileChanges,
+        root_path: Path,
+    ) -> list[EndpointCandidate]:
+        """Keep endpoints from untouched files and re-extract changed Python files."""
+        endpoints = [
+            EndpointCandidate(
+                http_method=entry.http_method,
+                path=entry.path,
+                framework=entry.framework,
+                language=entry.language,
+                source_file=entry.source_file,
+                source_symbol=entry.source_symbol,
+                confidence=float(entry.confidence),
+            )
+            for entry in previous_entries
+            if entry.source_file not in changes.touched
+        ]
+        endpoints.extend(
+            self._extract_files(
+                [
+                    root_path / relative_path
+                    for relative_path in sorted(changes.reparse)
+                    if relative_path.lower().endswith(".py")
+                ],
+                root_path,
+            )
+        )
         return endpoints
 
-    async def _store_detected_endpoints(
+    def _extract_files(
+        self, paths: Sequence[Path], root_path: Path
+    ) -> list[EndpointCandidate]:
+        per_file = get_parse_cache().parse_many(
+            EXTRACTOR_NAME,
+            EXTRACTOR_VERSION,
+            paths,
+            lambda misses: [
+                extract_fastapi_endpoints(path, root_path) for path in misses
+            ],
+            encode=lambda endpoints: [astuple(endpoint) for endpoint in endpoints],
+            decode=lambda rows: [EndpointCandidate(*row) for row in rows],
+            root=root_path,
+        )
+        return [endpoint for endpoints in per_file for endpoint in endpoints]
+
+    async def store_api_endpoints(
         self,
         project_id: uuid.UUID,
         detected: list[EndpointCandidate],
-        title: str,
-    ) -> ProjectApiEndpointAnalysis:
+        title: str = "API endpoint analysis snapshot",
+        commit_hash: str | None = None,
+        commit: bool = True,
+        project_checked: bool = False,
+        scan_config: str | None = None,
+    ) -> Snapshot:
+        """Persist an API endpoint snapshot for detected endpoints."""
+        fingerprint = result_fingerprint(
+            SnapshotType.API_ENDPOINTS.value,
+            detected,
+            title,
+            scan_config,
+        )
+        unchanged = await self.snapshot_service.observe_unchanged(
+            project_id,
+            SnapshotType.API_ENDPOINTS.value,
+            fingerprint,
+            commit_hash=commit_hash,
+            commit=commit,
+        )
+        if unchanged is not None:
+            return unchanged
         if not detected:
             summary_json = {
                 "title": title,
                 "message": "No endpoints were found in this project.",
+                "fingerprint": fingerprint,
             }
-            await self.snapshot_service.create_snapshot(
+            if scan_config:
+                summary_json[SCAN_CONFIG_KEY] = scan_config
+            return await self.snapshot_service.create_snapshot(
                 project_id=project_id,
                 summary_json=summary_json,
                 analysis_type=SnapshotType.API_ENDPOINTS.value,
-                commit_hash=None,
+                commit_hash=commit_hash,
+                commit=commit,
+                fingerprint=fingerprint,
+                project_checked=project_checked,
             )
-            return ProjectApiEndpointAnalysis(endpoints=[])
 
         summary_json = {
             "title": title,
@@ -223,45 +395,40 @@ class ApiEndpointAnalysisService:
                     "framework": endpoint.framework,
                     "language": endpoint.language,
                 }
-                for endpoint in detected
+                for endpoint in sorted(
+                    detected, key=lambda item: (item.path, item.http_method)
+                )[:SNAPSHOT_SUMMARY_TOP_N]
             ],
             "detected_count": len(detected),
+            "truncated": len(detected) > SNAPSHOT_SUMMARY_TOP_N,
+            "fingerprint": fingerprint,
         }
-        snapshot = await self.snapshot_service.create_snapshot(
-            project_id=project_id,
-            summary_json=summary_json,
-            analysis_type=SnapshotType.API_ENDPOINTS.value,
-            commit_hash=None,
-        )
-        created = await self.snapshot_api_endpoint_service.create_snapshot_api_endpoints(
-            [
-                ApiEndpointCreate(
-                    snapshot_id=snapshot.id,
-                    http_method=endpoint.http_method,
-                    path=endpoint.path,
-                    framework=endpoint.framework,
-                    language=endpoint.language,
-                    source_file=endpoint.source_file,
-                    source_symbol=endpoint.source_symbol,
-                    confidence=endpoint.confidence,
-                )
-                for endpoint in detected
-            ]
-        )
-        return ProjectApiEndpointAnalysis(
-            endpoints=[
-                ApiEndpointPublic(
-                    id=entry.id,
-                    snapshot_id=entry.snapshot_id,
-                    http_method=entry.http_method,
-                    path=entry.path,
-                    framework=entry.framework,
-                    language=entry.language,
-                    source_file=entry.source_file,
-                    source_symbol=entry.source_symbol,
-                    confidence=float(entry.confidence),
-                    created_at=entry.created_at,
-                )
-                for entry in created
-            ]
-        )
+        if scan_config:
+            summary_json[SCAN_CONFIG_KEY] = scan_config
+        async with self.snapshot_service.unit_of_work(commit=commit):
+            snapshot = await self.snapshot_service.create_snapshot(
+                project_id=project_id,
+                summary_json=summary_json,
+                analysis_type=SnapshotType.API_ENDPOINTS.value,
+                commit_hash=commit_hash,
+                commit=False,
+                fingerprint=fingerprint,
+                project_checked=project_checked,
+            )
+            await self.snapshot_api_endpoint_service.create_snapshot_api_endpoints(
+                [
+                    ApiEndpointCreate(
+                        snapshot_id=snapshot.id,
+                        http_method=endpoint.http_method,
+                        path=endpoint.path,
+                        framework=endpoint.framework,
+                        language=endpoint.language,
+                        source_file=endpoint.source_file,
+                        source_symbol=endpoint.source_symbol,
+                        confidence=endpoint.confidence,
+                    )
+                    for endpoint in detected
+                ],
+                commit=False,
+            )
+        return snapshot
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+"""Stable fingerprints of analysis results."""
+
+from dataclasses import asdict, is_dataclass
+import hashlib
+import json
+from typing import Any, Iterable
+
+
+def result_fingerprint(
+    analysis_type: str, rows: Iterable[Any], *context: str | None
+) -> str:
+    """Return a hash of an analysis result that ignores row order.
+
+    ``context`` holds values stored alongside the rows, such as the scan
+    configuration, so a result computed under different settings never
+    matches an older snapshot.
+    """
+    encoded = sorted(
+        json.dumps(
+            asdict(row) if is_dataclass(row) else row,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        for row in rows
+    )
+    digest = hashlib.sha256()
+    for part in (analysis_type, *(value or "" for value in context)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    for row in encoded:
+        digest.update(row.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from app.shared.filesystem.scanner import FileSystemScanner
+from app.shared.cache.parse_cache import get_parse_cache
+from app.shared.concurrency.parse_pool import get_parse_pool
+from app.shared.filesystem.scan_index import ScanIndex
 
 """Framework analysis application service."""
 
 import logging
 import uuid
 
+from app.domains.analysis.services.analysis_rule_cache import (
+    active_ignored_directories,
+    get_analysis_rule_cache,
+)
 from app.domains.analysis.models.dto.framework import ProjectFrameworkAnalysis
-from app.domains.projects.models.source_type import SourceType
+from app.domains.analysis.services.fingerprint import result_fingerprint
 from app.domains.analysis.repository.analysis_framework_rule_repository import (
     AnalysisFrameworkRuleRepository,
 )
@@ -21,11 +27,17 @@ from app.domains.projects.services.framework_detector import (
 )
 from app.domains.projects.models.snapshot_type import SnapshotType
 from app.domains.projects.services.project_service import ProjectService
+from app.domains.projects.services.project_source import (
+    resolve_project_source,
+    source_read_lock,
+)
 from app.domains.projects.services.snapshot_framework_service import (
     SnapshotFrameworkService,
 )
 from app.domains.projects.services.snapshot_service import SnapshotService
-from app.infrastructure.external.source.orchestartor import prepare_source
+from app.infrastructure.external.git.commits import get_clean_head_commit
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.shared.concurrency.executor import run_analysis, run_blocking
 
 
 class FrameworkAnalysisService:
@@ -58,17 +70,36 @@ class FrameworkAnalysisService:
         if not project:
             return None
 
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=True,
+        source_path = await resolve_project_source(project, allow_clone=True, sync=True)
+        detector = await self.build_detector()
+        ignored_directories = await active_ignored_directories(
+            self.ignored_directory_repository
+        )
+        async with source_read_lock(project, source_path):
+            head_commit = await run_blocking(
+                get_clean_head_commit, source_path, ignored_directories
+            )
+            index = await run_analysis(
+                ScanIndex.build,
+                root_path=source_path,
+                ignored_directories=ignored_directories,
+            )
+            frameworks = await run_analysis(detector.detect, index)
+        await self.store_frameworks(
+            project_id, frameworks, commit_hash=head_commit, project_checked=True
         )
+        return ProjectFrameworkAnalysis(frameworks=frameworks)
+
+    async def build_detector(self) -> FrameworkDetector:
+        """Return a detector for the active framework rules."""
+        return await get_analysis_rule_cache().get(
+            "framework_detector", self._load_detector
+        )
+
+    async def _load_detector(self) -> FrameworkDetector:
         rules_with_names = (
             await self.framework_rule_repository.list_active_with_framework_name()
         )
-        ignored_directories = await self.ignored_directory_repository.list_active()
-
         detector_rules = [
             FrameworkRule(
                 framework=framework_name,
@@ -78,18 +109,39 @@ class FrameworkAnalysisService:
             )
             for rule, framework_name in rules_with_names
         ]
-
-        detector = FrameworkDetector(detector_rules)
-        scanner = FileSystemScanner(
-            root_path=source_path,
-            ignored_directories={entry.name for entry in ignored_directories},
+        return FrameworkDetector(
+            detector_rules,
+            parse_pool=get_parse_pool(),
+            parse_cache=get_parse_cache(),
         )
-        frameworks = detector.detect(scanner)
+
+    async def store_frameworks(
+        self,
+        project_id: uuid.UUID,
+        frameworks: dict[str, float],
+        commit_hash: str | None = None,
+        commit: bool = True,
+        project_checked: bool = False,
+    ) -> Snapshot:
+        """Persist a framework snapshot for detected frameworks."""
         self.logger.info(
             "Detected frameworks project_id=%s count=%s",
             project_id,
             len(frameworks),
         )
+        fingerprint = result_fingerprint(
+            SnapshotType.FRAMEWORKS.value,
+            frameworks.items(),
+        )
+        unchanged = await self.snapshot_service.observe_unchanged(
+            project_id,
+            SnapshotType.FRAMEWORKS.value,
+            fingerprint,
+            commit_hash=commit_hash,
+            commit=commit,
+        )
+        if unchanged is not None:
+            return unchanged
         summary_json = {
             "title": "Framework analysis snapshot",
             "frameworks": [
@@ -100,17 +152,22 @@ class FrameworkAnalysisService:
             ],
             "detected_count": len(frameworks),
         }
-        snapshot = await self.snapshot_service.create_snapshot(
-            project_id=project_id,
-            summary_json=summary_json,
-            analysis_type=SnapshotType.FRAMEWORKS.value,
-            commit_hash=None,
-        )
-        await self.snapshot_framework_service.create_snapshot_frameworks(
-            snapshot_id=snapshot.id,
-            frameworks=frameworks,
-        )
-        return ProjectFrameworkAnalysis(frameworks=frameworks)
+        async with self.snapshot_service.unit_of_work(commit=commit):
+            snapshot = await self.snapshot_service.create_snapshot(
+                project_id=project_id,
+                summary_json=summary_json,
+                analysis_type=SnapshotType.FRAMEWORKS.value,
+                commit_hash=commit_hash,
+                commit=False,
+                fingerprint=fingerprint,
+                project_checked=project_checked,
+            )
+            await self.snapshot_framework_service.create_snapshot_frameworks(
+                snapshot_id=snapshot.id,
+                frameworks=frameworks,
+                commit=False,
+            )
+        return snapshot
 
     async def get_latest_framework_analysis(
         self, project_id: uuid.UUID
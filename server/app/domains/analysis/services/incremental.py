@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+"""Helpers for incremental re-analysis based on git history."""
+
+import hashlib
+from pathlib import Path
+from typing import Iterable, Set
+
+from app.infrastructure.external.git.diff import GitFileChanges, diff_name_status
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.shared.concurrency.executor import run_blocking
+
+SCAN_CONFIG_KEY = "scan_config"
+
+
+def scan_config_key(*parts: Iterable[str]) -> str:
+    """Return a stable key for the configuration a snapshot was computed with."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update("\n".join(sorted(part)).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+async def changes_since_snapshot(
+    snapshot: Snapshot | None,
+    source_path: Path,
+    head_commit: str | None,
+    config_key: str,
+    ignored_directories: Set[str],
+) -> GitFileChanges | None:
+    """Return files changed since ``snapshot``, or None when a full scan is required."""
+    if snapshot is None or head_commit is None or not snapshot.commit_hash:
+        return None
+    if snapshot.summary_json.get(SCAN_CONFIG_KEY) != config_key:
+        return None
+    changes = await run_blocking(
+        diff_name_status, source_path, snapshot.commit_hash, head_commit
+    )
+    if changes is None:
+        return None
+    return changes.without_ignored(ignored_directories)
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from app.shared.filesystem.scanner import FileSystemScanner
+from app.shared.filesystem.scan_index import ScanIndex
 
 """Infrastructure analysis application service."""
 
 import logging
 import uuid
 
+from app.domains.analysis.services.analysis_rule_cache import (
+    active_ignored_directories,
+    get_analysis_rule_cache,
+)
 from app.domains.analysis.models.dto.infrastructure import ProjectInfrastructureAnalysis
-from app.domains.projects.models.source_type import SourceType
+from app.domains.analysis.services.fingerprint import result_fingerprint
 from app.domains.analysis.repository.analysis_ignored_directory_repository import (
     AnalysisIgnoredDirectoryRepository,
 )
@@ -18,11 +22,17 @@ from app.domains.analysis.repository.analysis_infra_rule_repository import (
 from app.domains.projects.services.infra_detector import InfraDetector, InfraRule
 from app.domains.projects.models.snapshot_type import SnapshotType
 from app.domains.projects.services.project_service import ProjectService
+from app.domains.projects.services.project_source import (
+    resolve_project_source,
+    source_read_lock,
+)
 from app.domains.projects.services.snapshot_infrastructure_service import (
     SnapshotInfrastructureService,
 )
 from app.domains.projects.services.snapshot_service import SnapshotService
-from app.infrastructure.external.source.orchestartor import prepare_source
+from app.infrastructure.external.git.commits import get_clean_head_commit
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.shared.concurrency.executor import run_analysis, run_blocking
 
 
 class InfrastructureAnalysisService:
@@ -55,17 +65,36 @@ class InfrastructureAnalysisService:
         if not project:
             return None
 
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=True,
+        source_path = await resolve_project_source(project, allow_clone=True, sync=True)
+        detector = await self.build_detector()
+        ignored_directories = await active_ignored_directories(
+            self.ignored_directory_repository
+        )
+        async with source_read_lock(project, source_path):
+            head_commit = await run_blocking(
+                get_clean_head_commit, source_path, ignored_directories
+            )
+            index = await run_analysis(
+                ScanIndex.build,
+                root_path=source_path,
+                ignored_directories=ignored_directories,
+            )
+            components = await run_analysis(detector.detect, index)
+        await self.store_infrastructure(
+            project_id, components, commit_hash=head_commit, project_checked=True
+        )
+        return ProjectInfrastructureAnalysis(components=components)
+
+    async def build_detector(self) -> InfraDetector:
+        """Return a detector for the active infrastructure rules."""
+        return await get_analysis_rule_cache().get(
+            "infra_detector", self._load_detector
         )
+
+    async def _load_detector(self) -> InfraDetector:
         rules_with_names = (
             await self.infra_rule_repository.list_active_with_component_name()
         )
-        ignored_directories = await self.ignored_directory_repository.list_active()
-
         detector_rules = [
             InfraRule(
                 component=component_name,
@@ -75,34 +104,53 @@ class InfrastructureAnalysisService:
             )
             for rule, component_name in rules_with_names
         ]
+        return InfraDetector(detector_rules)
 
-        detector = InfraDetector(detector_rules)
-        scanner = FileSystemScanner(
-            root_path=source_path,
-            ignored_directories={entry.name for entry in ignored_directories},
-        )
-        components = detector.detect(scanner)
+    async def store_infrastructure(
+        self,
+        project_id: uuid.UUID,
+        components: list[str],
+        commit_hash: str | None = None,
+        commit: bool = True,
+        project_checked: bool = False,
+    ) -> Snapshot:
+        """Persist an infrastructure snapshot for detected components."""
         self.logger.info(
             "Detected infrastructure components project_id=%s count=%s",
             project_id,
             len(components),
         )
+        fingerprint = result_fingerprint(SnapshotType.INFRASTRUCTURE.value, components)
+        unchanged = await self.snapshot_service.observe_unchanged(
+            project_id,
+            SnapshotType.INFRASTRUCTURE.value,
+            fingerprint,
+            commit_hash=commit_hash,
+            commit=commit,
+        )
+        if unchanged is not None:
+            return unchanged
         summary_json = {
             "title": "Infrastructure analysis snapshot",
             "components": [{"name": component} for component in components],
             "detected_count": len(components),
         }
-        snapshot = await self.snapshot_service.create_snapshot(
-            project_id=project_id,
-            summary_json=summary_json,
-            analysis_type=SnapshotType.INFRASTRUCTURE.value,
-            commit_hash=None,
-        )
-        await self.snapshot_infrastructure_service.create_snapshot_infrastructure(
-            snapshot_id=snapshot.id,
-            components=components,
-        )
-        return ProjectInfrastructureAnalysis(components=components)
+        async with self.snapshot_service.unit_of_work(commit=commit):
+            snapshot = await self.snapshot_service.create_snapshot(
+                project_id=project_id,
+                summary_json=summary_json,
+                analysis_type=SnapshotType.INFRASTRUCTURE.value,
+                commit_hash=commit_hash,
+                commit=False,
+                fingerprint=fingerprint,
+                project_checked=project_checked,
+            )
+            await self.snapshot_infrastructure_service.create_snapshot_infrastructure(
+                snapshot_id=snapshot.id,
+                components=components,
+                commit=False,
+            )
+        return snapshot
 
     async def get_latest_infrastructure_analysis(
         self, project_id: uuid.UUID
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from app.shared.filesystem.scanner import FileSystemScanner
+from app.shared.filesystem.scan_index import ScanIndex
 
 """Language analysis application service."""
 
 import logging
 import uuid
 
+from app.domains.analysis.services.analysis_rule_cache import (
+    active_ignored_directories,
+    get_analysis_rule_cache,
+)
 from app.domains.analysis.models.dto.language import ProjectLanguageAnalysis
-from app.domains.projects.models.source_type import SourceType
 from app.domains.analysis.repository.analysis_ignored_directory_repository import (
     AnalysisIgnoredDirectoryRepository,
 )
@@ -18,11 +21,24 @@ from app.domains.analysis.repository.analysis_language_rule_repository import (
 from app.domains.projects.services.language_detector import LanguageDetector, LanguageRule
 from app.domains.projects.models.snapshot_type import SnapshotType
 from app.domains.projects.services.project_service import ProjectService
+from app.domains.projects.services.project_source import (
+    resolve_project_source,
+    source_read_lock,
+)
 from app.domains.projects.services.snapshot_language_service import (
     SnapshotLanguageService,
 )
 from app.domains.projects.services.snapshot_service import SnapshotService
-from app.infrastructure.external.source.orchestartor import prepare_source
+from app.domains.analysis.services.fingerprint import result_fingerprint
+from app.domains.analysis.services.incremental import (
+    SCAN_CONFIG_KEY,
+    changes_since_snapshot,
+    scan_config_key,
+)
+from app.infrastructure.external.git.commits import get_clean_head_commit
+from app.infrastructure.external.git.diff import GitFileChanges
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.shared.concurrency.executor import run_analysis, run_blocking
 
 
 class LanguageAnalysisService:
@@ -55,36 +71,127 @@ class LanguageAnalysisService:
         if not project:
             return None
 
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=True,
+        source_path = await resolve_project_source(project, allow_clone=True, sync=True)
+
+        detector = await self.build_detector()
+        ignored_directories = await active_ignored_directories(
+            self.ignored_directory_repository
         )
+        async with source_read_lock(project, source_path):
+            head_commit = await run_blocking(
+                get_clean_head_commit, source_path, ignored_directories
+            )
+            config_key = self.scan_config(detector, ignored_directories)
+            previous = await self.snapshot_service.get_latest_snapshot(
+                project_id, analysis_type=SnapshotType.LANGUAGES.value
+            )
+            changes = await changes_since_snapshot(
+                previous, source_path, head_commit, config_key, ignored_directories
+            )
+            if changes is None:
+                index = await run_analysis(
+                    ScanIndex.build,
+                    root_path=source_path,
+                    ignored_directories=ignored_directories,
+                )
+                languages = await run_analysis(detector.detect, index)
+            else:
+                self.logger.info(
+                    "Updating languages incrementally "
+                    "project_id=%s changed_files=%s",
+                    project_id,
+                    len(changes.touched),
+                )
+                previous_languages = (
+                    await self.snapshot_language_service.get_snapshot_languages(
+                        previous.id
+                    )
+                )
+                languages = self.merge_changes(detector, previous_languages, changes)
+        await self.store_languages(
+            project_id,
+            languages,
+            commit_hash=head_commit,
+            scan_config=config_key,
+            project_checked=True,
+        )
+        return ProjectLanguageAnalysis(languages=languages)
 
-        rules = await self.language_rule_repository.list_active()
-        ignored_directories = await self.ignored_directory_repository.list_active()
+    @staticmethod
+    def scan_config(
+        detector: LanguageDetector, ignored_directories: frozenset[str]
+    ) -> str:
+        """Return the configuration key stored with language snapshots."""
+        return scan_config_key(
+            ignored_directories,
+            (
+                f"{rule.extension}:{rule.language}:{rule.weight}"
+                for rule in detector.rules
+            ),
+        )
 
-        detector_rules = [
-            LanguageRule(
-                extension=rule.extension,
-                language=rule.language,
-                weight=rule.weight,
-            )
-            for rule in rules
-        ]
+    @staticmethod
+    def merge_changes(
+        detector: LanguageDetector,
+        previous: dict[str, int],
+        changes: GitFileChanges,
+    ) -> dict[str, int]:
+        """Apply added and deleted files to a previous language count."""
+        languages = dict(previous)
+        for language, weight in detector.detect_paths(changes.added).items():
+            languages[language] = languages.get(language, 0) + weight
+        for language, weight in detector.detect_paths(changes.deleted).items():
+            languages[language] = languages.get(language, 0) - weight
+        return {language: weight for language, weight in languages.items() if weight > 0}
+
+    async def build_detector(self) -> LanguageDetector:
+        """Return a detector for the active language rules."""
+        return await get_analysis_rule_cache().get(
+            "language_detector", self._load_detector
+        )
 
-        detector = LanguageDetector(detector_rules)
-        scanner = FileSystemScanner(
-            root_path=source_path,
-            ignored_directories={entry.name for entry in ignored_directories},
+    async def _load_detector(self) -> LanguageDetector:
+        rules = await self.language_rule_repository.list_active()
+        return LanguageDetector(
+            [
+                LanguageRule(
+                    extension=rule.extension,
+                    language=rule.language,
+                    weight=rule.weight,
+                )
+                for rule in rules
+            ]
         )
-        languages = detector.detect(scanner)
+
+    async def store_languages(
+        self,
+        project_id: uuid.UUID,
+        languages: dict[str, int],
+        commit_hash: str | None = None,
+        commit: bool = True,
+        project_checked: bool = False,
+        scan_config: str | None = None,
+    ) -> Snapshot:
+        """Persist a language snapshot for detected languages."""
         self.logger.info(
             "Detected languages project_id=%s count=%s",
             project_id,
             len(languages),
         )
+        fingerprint = result_fingerprint(
+            SnapshotType.LANGUAGES.value,
+            languages.items(),
+            scan_config,
+        )
+        unchanged = await self.snapshot_service.observe_unchanged(
+            project_id,
+            SnapshotType.LANGUAGES.value,
+            fingerprint,
+            commit_hash=commit_hash,
+            commit=commit,
+        )
+        if unchanged is not None:
+            return unchanged
         summary_json = {
             "title": "Language analysis snapshot",
             "languages": [
@@ -95,17 +202,24 @@ class LanguageAnalysisService:
             ],
             "total_weight": sum(languages.values()),
         }
-        snapshot = await self.snapshot_service.create_snapshot(
-            project_id=project_id,
-            summary_json=summary_json,
-            analysis_type=SnapshotType.LANGUAGES.value,
-            commit_hash=None,
-        )
-        await self.snapshot_language_service.create_snapshot_languages(
-            snapshot_id=snapshot.id,
-            languages=languages,
-        )
-        return ProjectLanguageAnalysis(languages=languages)
+        if scan_config:
+            summary_json[SCAN_CONFIG_KEY] = scan_config
+        async with self.snapshot_service.unit_of_work(commit=commit):
+            snapshot = await self.snapshot_service.create_snapshot(
+                project_id=project_id,
+                summary_json=summary_json,
+                analysis_type=SnapshotType.LANGUAGES.value,
+                commit_hash=commit_hash,
+                commit=False,
+                fingerprint=fingerprint,
+                project_checked=project_checked,
+            )
+            await self.snapshot_language_service.create_snapshot_languages(
+                snapshot_id=snapshot.id,
+                languages=languages,
+                commit=False,
+            )
+        return snapshot
 
     async def get_latest_language_analysis(
         self, project_id: uuid.UUID
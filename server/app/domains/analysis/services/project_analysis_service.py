@@ -2,8 +2,10 @@ from __future__ import annotations
 
 """Project analysis orchestration service."""
 
+import logging
 import uuid
 
+from app.domains.analysis.services.analysis_rule_cache import active_ignored_directories
 from app.domains.analysis.models.dto.framework import ProjectFrameworkAnalysis
 from app.domains.analysis.models.dto.api_endpoint import (
     ApiEndpointPage,
@@ -12,6 +14,11 @@ from app.domains.analysis.models.dto.api_endpoint import (
 from app.domains.analysis.models.dto.infrastructure import ProjectInfrastructureAnalysis
 from app.domains.analysis.models.dto.dependency import ProjectDependencyPublic
 from app.domains.analysis.models.dto.language import ProjectLanguageAnalysis
+from app.domains.analysis.models.dto.project_analysis import ProjectFullAnalysis
+from app.domains.analysis.models.endpoint_scope import EndpointScope
+from app.domains.analysis.repository.analysis_ignored_directory_repository import (
+    AnalysisIgnoredDirectoryRepository,
+)
 from app.domains.analysis.services.framework_analysis_service import (
     FrameworkAnalysisService,
 )
@@ -24,28 +31,149 @@ from app.domains.analysis.services.infrastructure_analysis_service import (
 from app.domains.analysis.services.project_dependency_analysis_service import (
     ProjectDependencyAnalysisService,
 )
+from app.domains.analysis.services.incremental import scan_config_key
 from app.domains.analysis.services.language_analysis_service import (
     LanguageAnalysisService,
 )
+from app.domains.projects.services.project_service import ProjectService
+from app.domains.projects.services.project_source import (
+    resolve_project_source,
+    source_read_lock,
+)
+from app.domains.projects.services.snapshot_service import SnapshotService
+from app.infrastructure.external.git.commits import get_clean_head_commit
+from app.shared.concurrency.executor import run_analysis, run_blocking
+from app.shared.filesystem.scan_index import ScanIndex
 
 
 class ProjectAnalysisService:
     """Compose project analysis services."""
 
+    logger = logging.getLogger(__name__)
+
     def __init__(
         self,
+        project_service: ProjectService,
+        ignored_directory_repository: AnalysisIgnoredDirectoryRepository,
+        snapshot_service: SnapshotService,
         language_analysis_service: LanguageAnalysisService,
         framework_analysis_service: FrameworkAnalysisService,
         infrastructure_analysis_service: InfrastructureAnalysisService,
         api_endpoint_analysis_service: ApiEndpointAnalysisService,
         project_dependency_analysis_service: ProjectDependencyAnalysisService,
     ) -> None:
+        self.project_service = project_service
+        self.ignored_directory_repository = ignored_directory_repository
+        self.snapshot_service = snapshot_service
         self.language_analysis_service = language_analysis_service
         self.framework_analysis_service = framework_analysis_service
         self.infrastructure_analysis_service = infrastructure_analysis_service
         self.api_endpoint_analysis_service = api_endpoint_analysis_service
         self.project_dependency_analysis_service = project_dependency_analysis_service
 
+    async def analyze_all(self, project_id: uuid.UUID) -> ProjectFullAnalysis | None:
+        """Run every analysis over one source scan and persist them in one transaction."""
+        self.logger.info("Analyzing all types for project_id=%s", project_id)
+        project = await self.project_service.get_project(project_id)
+        if not project:
+            return None
+
+        source_path = await resolve_project_source(project, allow_clone=True, sync=True)
+        ignored_directories = await active_ignored_directories(
+            self.ignored_directory_repository
+        )
+        language_detector = await self.language_analysis_service.build_detector()
+        framework_detector = await self.framework_analysis_service.build_detector()
+        infra_detector = await self.infrastructure_analysis_service.build_detector()
+
+        def detect_all():
+            index = ScanIndex.build(
+                root_path=source_path,
+                ignored_directories=ignored_directories,
+            )
+            return (
+                language_detector.detect(index),
+                framework_detector.detect(index),
+                infra_detector.detect(index),
+                self.api_endpoint_analysis_service.extract_endpoints(
+                    index, source_path
+                ),
+                self.project_dependency_analysis_service.extract_dependencies(
+                    index, source_path
+                ),
+            )
+
+        async with source_read_lock(project, source_path):
+            commit_hash = await run_blocking(
+                get_clean_head_commit, source_path, ignored_directories
+            )
+            languages, frameworks, components, endpoints, dependencies = (
+                await run_analysis(detect_all)
+            )
+
+        file_scan_config = scan_config_key(ignored_directories)
+        async with self.snapshot_service.unit_of_work():
+            await self.language_analysis_service.store_languages(
+                project_id,
+                languages,
+                commit_hash=commit_hash,
+                commit=False,
+                project_checked=True,
+                scan_config=self.language_analysis_service.scan_config(
+                    language_detector, ignored_directories
+                ),
+            )
+            await self.framework_analysis_service.store_frameworks(
+                project_id,
+                frameworks,
+                commit_hash=commit_hash,
+                commit=False,
+                project_checked=True,
+            )
+            await self.infrastructure_analysis_service.store_infrastructure(
+                project_id,
+                components,
+                commit_hash=commit_hash,
+                commit=False,
+                project_checked=True,
+            )
+            endpoint_snapshot = (
+                await self.api_endpoint_analysis_service.store_api_endpoints(
+                    project_id,
+                    endpoints,
+                    commit_hash=commit_hash,
+                    commit=False,
+                    project_checked=True,
+                    scan_config=file_scan_config,
+                )
+            )
+            dependency_snapshot = (
+                await self.project_dependency_analysis_service.store_dependencies(
+                    project_id,
+                    dependencies,
+                    commit_hash=commit_hash,
+                    commit=False,
+                    project_checked=True,
+                    scan_config=file_scan_config,
+                )
+            )
+
+        self.logger.info(
+            "Stored full analysis project_id=%s commit_hash=%s", project_id, commit_hash
+        )
+        return ProjectFullAnalysis(
+            commit_hash=commit_hash,
+            languages=ProjectLanguageAnalysis(languages=languages),
+            frameworks=ProjectFrameworkAnalysis(frameworks=frameworks),
+            infrastructure=ProjectInfrastructureAnalysis(components=components),
+            api_endpoints=await self.api_endpoint_analysis_service.load_api_endpoints(
+                endpoint_snapshot.id
+            ),
+            dependencies=await self.project_dependency_analysis_service.load_dependencies(
+                dependency_snapshot.id
+            ),
+        )
+
     async def analyze_and_store_languages(
         self, project_id: uuid.UUID
     ) -> ProjectLanguageAnalysis | None:
@@ -130,6 +258,10 @@ class ProjectAnalysisService:
         limit: int = 100,
         offset: int = 0,
         http_method: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
+        scope: EndpointScope = EndpointScope.ALL,
+        snapshot_id: uuid.UUID | None = None,
     ) -> ApiEndpointPage | None:
         """List stored API endpoints for a project."""
         return await self.api_endpoint_analysis_service.list_project_api_endpoints(
@@ -137,6 +269,10 @@ class ProjectAnalysisService:
             limit=limit,
             offset=offset,
             http_method=http_method,
+            cursor=cursor,
+            include_total=include_total,
+            scope=scope,
+            snapshot_id=snapshot_id,
         )
 
     async def analyze_and_store_dependencies(
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from app.shared.filesystem.scanner import FileSystemScanner
+from app.shared.filesystem.scan_index import ScanIndex
 
 """Project dependency analysis application service."""
+from dataclasses import astuple
 import logging
 from pathlib import Path
+from typing import Sequence
 import uuid
 
 from app.analysis.dependency.base import DependencyCandidate
 from app.analysis.dependency.requirements import RequirementsDependencyExtractor
+from app.core.settings import SNAPSHOT_SUMMARY_TOP_N
+from app.domains.analysis.services.analysis_rule_cache import active_ignored_directories
 from app.domains.analysis.models.dto.dependency import (
     ProjectDependencyCreate,
     ProjectDependencyPublic,
@@ -17,13 +21,29 @@ from app.domains.analysis.repository.analysis_ignored_directory_repository impor
     AnalysisIgnoredDirectoryRepository,
 )
 from app.domains.projects.models.snapshot_type import SnapshotType
-from app.domains.projects.models.source_type import SourceType
 from app.domains.projects.services.project_service import ProjectService
+from app.domains.projects.services.project_source import (
+    resolve_project_source,
+    source_read_lock,
+)
 from app.domains.projects.services.snapshot_project_dependency_service import (
     SnapshotProjectDependencyService,
 )
 from app.domains.projects.services.snapshot_service import SnapshotService
-from app.infrastructure.external.source.orchestartor import prepare_source
+from app.domains.analysis.services.fingerprint import result_fingerprint
+from app.domains.analysis.services.incremental import (
+    SCAN_CONFIG_KEY,
+    changes_since_snapshot,
+    scan_config_key,
+)
+from app.infrastructure.external.git.commits import get_clean_head_commit
+from app.infrastructure.external.git.diff import GitFileChanges
+from app.infrastructure.persistence.postgres.analysis.entities.project_dependency import (
+    ProjectDependency,
+)
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.shared.cache.parse_cache import get_parse_cache
+from app.shared.concurrency.executor import run_analysis, run_blocking
 
 
 class ProjectDependencyAnalysisService:
@@ -54,31 +74,95 @@ class ProjectDependencyAnalysisService:
         if not project:
             return None
 
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=True,
+        source_path = await resolve_project_source(project, allow_clone=True, sync=True)
+        ignored_directories = await active_ignored_directories(
+            self.ignored_directory_repository
         )
-        ignored_directories = await self.ignored_directory_repository.list_active()
-        scanner = FileSystemScanner(
-            root_path=source_path,
-            ignored_directories={entry.name for entry in ignored_directories},
+        async with source_read_lock(project, source_path):
+            head_commit = await run_blocking(
+                get_clean_head_commit, source_path, ignored_directories
+            )
+            config_key = scan_config_key(ignored_directories)
+            previous = await self.snapshot_service.get_latest_snapshot(
+                project_id, analysis_type=SnapshotType.DEPENDENCIES.value
+            )
+            changes = await changes_since_snapshot(
+                previous, source_path, head_commit, config_key, ignored_directories
+            )
+            if changes is None:
+                index = await run_analysis(
+                    ScanIndex.build,
+                    root_path=source_path,
+                    ignored_directories=ignored_directories,
+                )
+                detected = await run_analysis(
+                    self.extract_dependencies, index, source_path
+                )
+            else:
+                self.logger.info(
+                    "Updating dependencies incrementally "
+                    "project_id=%s changed_files=%s",
+                    project_id,
+                    len(changes.touched),
+                )
+                previous_entries = (
+                    await self.snapshot_dependency_service.get_snapshot_dependencies(
+                        previous.id
+                    )
+                )
+                detected = await run_analysis(
+                    self.merge_changes, previous_entries, changes, source_path
+                )
+        snapshot = await self.store_dependencies(
+            project_id,
+            detected,
+            commit_hash=head_commit,
+            scan_config=config_key,
+            project_checked=True,
         )
+        return await self.load_dependencies(snapshot.id)
 
-        detected = self._extract_dependencies(scanner, source_path)
+    async def store_dependencies(
+        self,
+        project_id: uuid.UUID,
+        detected: list[DependencyCandidate],
+        commit_hash: str | None = None,
+        commit: bool = True,
+        project_checked: bool = False,
+        scan_config: str | None = None,
+    ) -> Snapshot:
+        """Persist a dependency snapshot for detected dependencies."""
+        fingerprint = result_fingerprint(
+            SnapshotType.DEPENDENCIES.value,
+            detected,
+            scan_config,
+        )
+        unchanged = await self.snapshot_service.observe_unchanged(
+            project_id,
+            SnapshotType.DEPENDENCIES.value,
+            fingerprint,
+            commit_hash=commit_hash,
+            commit=commit,
+        )
+        if unchanged is not None:
+            return unchanged
         if not detected:
             summary_json = {
                 "title": "Dependency analysis snapshot",
                 "message": "No dependencies were found in this project.",
+                "fingerprint": fingerprint,
             }
-            await self.snapshot_service.create_snapshot(
+            if scan_config:
+                summary_json[SCAN_CONFIG_KEY] = scan_config
+            return await self.snapshot_service.create_snapshot(
                 project_id=project_id,
                 summary_json=summary_json,
                 analysis_type=SnapshotType.DEPENDENCIES.value,
-                commit_hash=None,
+                commit_hash=commit_hash,
+                commit=commit,
+                fingerprint=fingerprint,
+                project_checked=project_checked,
             )
-            return []
 
         summary_json = {
             "title": "Dependency analysis snapshot",
@@ -90,42 +174,41 @@ class ProjectDependencyAnalysisService:
                     "scope": dependency.scope,
                     "source_file": dependency.source_file,
                 }
-                for dependency in detected
+                for dependency in sorted(
+                    detected, key=lambda item: (item.name, item.source_file)
+                )[:SNAPSHOT_SUMMARY_TOP_N]
             ],
             "detected_count": len(detected),
+            "truncated": len(detected) > SNAPSHOT_SUMMARY_TOP_N,
+            "fingerprint": fingerprint,
         }
-        snapshot = await self.snapshot_service.create_snapshot(
-            project_id=project_id,
-            summary_json=summary_json,
-            analysis_type=SnapshotType.DEPENDENCIES.value,
-            commit_hash=None,
-        )
-        created = await self.snapshot_dependency_service.create_snapshot_dependencies(
-            [
-                ProjectDependencyCreate(
-                    snapshot_id=snapshot.id,
-                    name=dependency.name,
-                    version=dependency.version,
-                    ecosystem=dependency.ecosystem,
-                    scope=dependency.scope,
-                    source_file=dependency.source_file,
-                )
-                for dependency in detected
-            ]
-        )
-        return [
-            ProjectDependencyPublic(
-                id=entry.id,
-                snapshot_id=entry.snapshot_id,
-                name=entry.name,
-                version=entry.version,
-                ecosystem=entry.ecosystem,
-                scope=entry.scope,
-                source_file=entry.source_file,
-                created_at=entry.created_at,
+        if scan_config:
+            summary_json[SCAN_CONFIG_KEY] = scan_config
+        async with self.snapshot_service.unit_of_work(commit=commit):
+            snapshot = await self.snapshot_service.create_snapshot(
+                project_id=project_id,
+                summary_json=summary_json,
+                analysis_type=SnapshotType.DEPENDENCIES.value,
+                commit_hash=commit_hash,
+                commit=False,
+                fingerprint=fingerprint,
+                project_checked=project_checked,
             )
-            for entry in created
-        ]
+            await self.snapshot_dependency_service.create_snapshot_dependencies(
+                [
+                    ProjectDependencyCreate(
+                        snapshot_id=snapshot.id,
+                        name=dependency.name,
+                        version=dependency.version,
+                        ecosystem=dependency.ecosystem,
+                        scope=dependency.scope,
+                        source_file=dependency.source_file,
+                    )
+                    for dependency in detected
+                ],
+                commit=False,
+            )
+        return snapshot
 
     async def get_latest_dependencies(
         self, project_id: uuid.UUID
@@ -143,8 +226,14 @@ class ProjectDependencyAnalysisService:
         if not snapshot:
             return []
 
+        return await self.load_dependencies(snapshot.id)
+
+    async def load_dependencies(
+        self, snapshot_id: uuid.UUID
+    ) -> list[ProjectDependencyPublic]:
+        """Return the dependencies stored for a snapshot."""
         entries = await self.snapshot_dependency_service.get_snapshot_dependencies(
-            snapshot.id
+            snapshot_id
         )
         return [
             ProjectDependencyPublic(
@@ -160,13 +249,55 @@ class ProjectDependencyAnalysisService:
             for entry in entries
         ]
 
-    def _extract_dependencies(
-        self, scanner: FileSystemScanner, root_path: Path
+    def extract_dependencies(
+        self, index: ScanIndex, root_path: Path
     ) -> list[DependencyCandidate]:
-        extractor = RequirementsDependencyExtractor()
-        dependencies: list[DependencyCandidate] = []
-        for path in scanner.scan_files():
-            if path.name != "requirements.txt":
-                continue
-            dependencies.extend(extractor.extract(path, root_path))
+        """Extract dependency candidates from indexed requirements files."""
+        return self._extract_files(
+            list(index.files_named("requirements.txt")), root_path
+        )
+
+    def merge_changes(
+        self,
+        previous_entries: list[ProjectDependency],
+        changes: GitFileChanges,
+        root_path: Path,
+    ) -> list[DependencyCandidate]:
+        """Keep dependencies from untouched files and re-extract changed manifests."""
+        dependencies = [
+            DependencyCandidate(
+                name=entry.name,
+                version=entry.version,
+                ecosystem=entry.ecosystem,
+                scope=entry.scope,
+                source_file=entry.source_file,
+            )
+            for entry in previous_entries
+            if entry.source_file not in changes.touched
+        ]
+        dependencies.extend(
+            self._extract_files(
+                [
+                    root_path / relative_path
+                    for relative_path in sorted(changes.reparse)
+                    if relative_path.rsplit("/", 1)[-1] == "requirements.txt"
+                ],
+                root_path,
+            )
+        )
         return dependencies
+
+    def _extract_files(
+        self, paths: Sequence[Path], root_path: Path
+    ) -> list[DependencyCandidate]:
+        extractor = RequirementsDependencyExtractor()
+        per_file = get_parse_cache().parse_many(
+            extractor.name,
+            extractor.version,
+            paths,
+            lambda misses: [extractor.extract(path, root_path) for path in misses],
+            encode=lambda dependencies: [astuple(item) for item in dependencies],
+            decode=lambda rows: [DependencyCandidate(*row) for row in rows],
+            root=root_path,
+        )
+        return [dependency for dependencies in per_file for dependency in dependencies]
@@ -10,6 +10,10 @@ from app.domains.auth.models.dto.auth import (
     LoginPayload,
     RegisterPayload,
 )
+from app.domains.auth.services.bootstrap_latch import (
+    BootstrapLatch,
+    get_bootstrap_latch,
+)
 from app.domains.identity.models.dto.user import UserCreate
 from app.domains.identity.services.user_service import UserService
 
@@ -17,8 +21,13 @@ _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 class AuthService:
-    def __init__(self, user_service: UserService) -> None:
+    def __init__(
+        self,
+        user_service: UserService,
+        bootstrap_latch: BootstrapLatch | None = None,
+    ) -> None:
         self.user_service = user_service
+        self.bootstrap_latch = bootstrap_latch or get_bootstrap_latch()
 
     async def register(self, data: RegisterPayload) -> AuthUser:
         if data.role == "admin":
@@ -42,6 +51,7 @@ class AuthService:
                 role="admin",
             )
         )
+        self.bootstrap_latch.set()
         return AuthUser.model_validate(created)
 
     async def login(self, data: LoginPayload) -> AuthToken:
@@ -54,4 +64,6 @@ class AuthService:
         return AuthToken(access_token=token, user=AuthUser.model_validate(user))
 
     async def bootstrap_needed(self) -> bool:
-        return not await self.user_service.has_admin()
+        return not await self.bootstrap_latch.is_bootstrapped(
+            self.user_service.has_admin
+        )
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+"""Process-wide latch recording that an admin account exists."""
+
+from functools import lru_cache
+import time
+from typing import Awaitable, Callable
+
+from app.core.settings import AUTH_BOOTSTRAP_RECHECK_SECONDS
+
+
+class BootstrapLatch:
+    """Remember that bootstrap is done so requests stop querying for an admin.
+
+    Until an admin is seen every call runs ``has_admin``. Once latched, the
+    check runs again only after ``recheck_seconds``, and only for the first
+    caller past that point, so steady-state requests never reach the database.
+    """
+
+    def __init__(
+        self,
+        recheck_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.recheck_seconds = recheck_seconds
+        self.clock = clock
+        self._latched = False
+        self._next_check = 0.0
+
+    async def is_bootstrapped(self, has_admin: Callable[[], Awaitable[bool]]) -> bool:
+        """Return whether an admin exists, querying only when the latch is stale."""
+        if self._latched and self.clock() < self._next_check:
+            return True
+        # Push the deadline before awaiting so concurrent requests keep using
+        # the latch while a single revalidation is in flight.
+        self._next_check = self.clock() + self.recheck_seconds
+        self._latched = await has_admin()
+        return self._latched
+
+    def set(self) -> None:
+        """Latch after an admin has been created in this process."""
+        self._latched = True
+        self._next_check = self.clock() + self.recheck_seconds
+
+
+@lru_cache(maxsize=1)
+def get_bootstrap_latch() -> BootstrapLatch:
+    """Return the process-wide bootstrap latch."""
+    return BootstrapLatch(recheck_seconds=AUTH_BOOTSTRAP_RECHECK_SECONDS)
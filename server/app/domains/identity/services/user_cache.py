@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+"""Process-wide cache of active users resolved from access tokens."""
+
+from functools import lru_cache
+import uuid
+
+from app.core.settings import USER_CACHE_SIZE, USER_CACHE_TTL_SECONDS
+from app.infrastructure.persistence.postgres.identity.entities.user import User
+from app.shared.cache.ttl_cache import TTLCache
+
+
+class UserCache:
+    """Bounded TTL cache of active users keyed by id.
+
+    Only active users are stored. Code that changes a user must
+    ``invalidate`` its entry; the TTL bounds how long another process can
+    serve a user after it was changed elsewhere.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self._entries: TTLCache[User] = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, user_id: uuid.UUID) -> User | None:
+        """Return a cached active user or None."""
+        user = self._entries.get(user_id)
+        if user is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return user
+
+    def set(self, user: User) -> None:
+        """Cache a detached copy of ``user`` if it is active."""
+        if user.is_active:
+            self._entries.set(user.id, User(**user.model_dump()))
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop the cached entry for ``user_id``."""
+        self.invalidations += 1
+        self._entries.pop(user_id)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and invalidation counters and the current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_user_cache() -> UserCache:
+    """Return the process-wide user cache."""
+    return UserCache(maxsize=USER_CACHE_SIZE, ttl_seconds=USER_CACHE_TTL_SECONDS)
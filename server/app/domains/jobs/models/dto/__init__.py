@@ -0,0 +1,5 @@
+from app.domains.jobs.models.dto.analysis_job import AnalysisJobPublic
+
+__all__ = [
+    "AnalysisJobPublic",
+]
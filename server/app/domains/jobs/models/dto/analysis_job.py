@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+"""Analysis job DTOs."""
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlmodel import SQLModel
+
+
+class AnalysisJobPublic(SQLModel):
+    """Public representation of an analysis job."""
+
+    id: uuid.UUID
+    project_id: uuid.UUID
+    analysis_type: str
+    status: str
+    attempts: int
+    result_json: dict[str, Any] | None
+    error: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+"""Analysis job lifecycle states."""
+
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of an analysis job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+IN_FLIGHT_STATUSES = (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
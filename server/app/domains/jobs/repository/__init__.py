@@ -0,0 +1,5 @@
+from app.domains.jobs.repository.analysis_job_repository import AnalysisJobRepository
+
+__all__ = [
+    "AnalysisJobRepository",
+]
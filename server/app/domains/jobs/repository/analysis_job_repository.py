@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+"""Analysis job repository for persistence access."""
+
+import logging
+import uuid
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.domains.jobs.models.job_status import IN_FLIGHT_STATUSES, JobStatus
+from app.infrastructure.persistence.postgres.jobs.entities.analysis_job import AnalysisJob
+
+
+class AnalysisJobRepository:
+    """Data access layer for analysis jobs."""
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def enqueue(
+        self,
+        project_id: uuid.UUID,
+        analysis_type: str,
+        requested_by: uuid.UUID | None = None,
+    ) -> tuple[AnalysisJob, bool]:
+        """Queue a job unless one is in flight; return the job and whether it is new."""
+        while True:
+            result = await self.session.execute(
+                insert(AnalysisJob)
+                .values(
+                    id=uuid.uuid4(),
+                    project_id=project_id,
+                    analysis_type=analysis_type,
+                    status=JobStatus.QUEUED.value,
+                    requested_by=requested_by,
+                    created_at=func.now(),
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[AnalysisJob.project_id, AnalysisJob.analysis_type],
+                    index_where=AnalysisJob.status.in_(IN_FLIGHT_STATUSES),
+                )
+                .returning(AnalysisJob.id)
+            )
+            job_id = result.scalar_one_or_none()
+            await self.session.commit()
+            if job_id is not None:
+                self.logger.info(
+                    "Queued analysis job id=%s project_id=%s analysis_type=%s",
+                    job_id,
+                    project_id,
+                    analysis_type,
+                )
+                return await self._get_fresh(job_id), True
+
+            existing = await self.get_in_flight(project_id, analysis_type)
+            if existing is not None:
+                return existing, False
+
+    async def get_by_id(self, job_id: uuid.UUID) -> AnalysisJob | None:
+        """Return a job by id or None."""
+        result = await self.session.execute(
+            select(AnalysisJob).where(AnalysisJob.id == job_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_in_flight(
+        self, project_id: uuid.UUID, analysis_type: str
+    ) -> AnalysisJob | None:
+        """Return the queued or running job for a project and analysis type."""
+        result = await self.session.execute(
+            select(AnalysisJob)
+            .where(
+                (AnalysisJob.project_id == project_id)
+                & (AnalysisJob.analysis_type == analysis_type)
+                & (AnalysisJob.status.in_(IN_FLIGHT_STATUSES))
+            )
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def claim_next(self) -> AnalysisJob | None:
+        """Mark the oldest queued job as running and return it.
+
+        Concurrent workers skip rows locked by each other, so each job is
+        claimed exactly once.
+        """
+        next_job_id = (
+            select(AnalysisJob.id)
+            .where(AnalysisJob.status == JobStatus.QUEUED.value)
+            .order_by(AnalysisJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(AnalysisJob)
+            .where(AnalysisJob.id == next_job_id)
+            .values(
+                status=JobStatus.RUNNING.value,
+                started_at=func.now(),
+                heartbeat_at=func.now(),
+                attempts=AnalysisJob.attempts + 1,
+            )
+            .returning(AnalysisJob.id)
+        )
+        job_id = result.scalar_one_or_none()
+        await self.session.commit()
+        if job_id is None:
+            return None
+        return await self._get_fresh(job_id)
+
+    async def heartbeat(self, job_id: uuid.UUID, attempt: int) -> bool:
+        """Record that ``attempt`` of a job is still running.
+
+        Returns False when the attempt no longer owns the job.
+        """
+        result = await self.session.execute(
+            update(AnalysisJob)
+            .where(_owned_by(job_id, attempt))
+            .values(heartbeat_at=func.now())
+        )
+        await self.session.commit()
+        return bool(result.rowcount)
+
+    async def finish(
+        self,
+        job_id: uuid.UUID,
+        attempt: int,
+        status: JobStatus,
+        result_json: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> bool:
+        """Record the final state of a running job.
+
+        Returns False, leaving the job untouched, when ``attempt`` was
+        superseded by a later claim.
+        """
+        result = await self.session.execute(
+            update(AnalysisJob)
+            .where(_owned_by(job_id, attempt))
+            .values(
+                status=status.value,
+                result_json=result_json,
+                error=error,
+                finished_at=func.now(),
+            )
+        )
+        await self.session.commit()
+        return bool(result.rowcount)
+
+    async def requeue(self, job_id: uuid.UUID, attempt: int) -> bool:
+        """Put a running job back on the queue if ``attempt`` still owns it."""
+        result = await self.session.execute(
+            update(AnalysisJob)
+            .where(_owned_by(job_id, attempt))
+            .values(status=JobStatus.QUEUED.value, started_at=None, heartbeat_at=None)
+        )
+        await self.session.commit()
+        return bool(result.rowcount)
+
+    async def requeue_stale(
+        self, stale_after: timedelta, max_attempts: int
+    ) -> tuple[int, int]:
+        """Recover running jobs whose worker stopped sending heartbeats.
+
+        Jobs that have used ``max_attempts`` attempts are failed, the others
+        are queued again. Staleness is judged by the database clock. Returns
+        the number of requeued and failed jobs.
+        """
+        last_seen = func.coalesce(AnalysisJob.heartbeat_at, AnalysisJob.started_at)
+        stale = (AnalysisJob.status == JobStatus.RUNNING.value) & (
+            last_seen < func.now() - stale_after
+        )
+        failed = await self.session.execute(
+            update(AnalysisJob)
+            .where(stale & (AnalysisJob.attempts >= max_attempts))
+            .values(
+                status=JobStatus.FAILED.value,
+                error=f"worker stopped responding after {max_attempts} attempts",
+                finished_at=func.now(),
+            )
+        )
+        requeued = await self.session.execute(
+            update(AnalysisJob)
+            .where(stale)
+            .values(status=JobStatus.QUEUED.value, started_at=None, heartbeat_at=None)
+        )
+        await self.session.commit()
+        return int(requeued.rowcount or 0), int(failed.rowcount or 0)
+
+    async def _get_fresh(self, job_id: uuid.UUID) -> AnalysisJob:
+        result = await self.session.execute(
+            select(AnalysisJob)
+            .where(AnalysisJob.id == job_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
+
+
+def _owned_by(job_id: uuid.UUID, attempt: int):
+    return (
+        (AnalysisJob.id == job_id)
+        & (AnalysisJob.status == JobStatus.RUNNING.value)
+        & (AnalysisJob.attempts == attempt)
+    )
@@ -0,0 +1,9 @@
+"""Analysis job service components."""
+
+from app.domains.jobs.services.analysis_job_service import AnalysisJobService
+from app.domains.jobs.services.analysis_job_worker import AnalysisJobWorkerPool
+
+__all__ = [
+    "AnalysisJobService",
+    "AnalysisJobWorkerPool",
+]
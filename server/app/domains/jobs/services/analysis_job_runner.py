@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+"""Dispatch analysis jobs to the project analysis service."""
+
+import uuid
+from typing import Any
+
+from app.domains.analysis.services.project_analysis_service import (
+    ProjectAnalysisService,
+)
+from app.domains.projects.models.snapshot_type import SnapshotType
+
+_ANALYSIS_METHODS = {
+    SnapshotType.LANGUAGES.value: "analyze_and_store_languages",
+    SnapshotType.FRAMEWORKS.value: "analyze_and_store_frameworks",
+    SnapshotType.INFRASTRUCTURE.value: "analyze_and_store_infrastructure",
+    SnapshotType.API_ENDPOINTS.value: "analyze_and_store_api_endpoints",
+    SnapshotType.DEPENDENCIES.value: "analyze_and_store_dependencies",
+}
+
+SUPPORTED_ANALYSIS_TYPES = frozenset(_ANALYSIS_METHODS)
+
+
+async def run_analysis_job(
+    analysis_service: ProjectAnalysisService,
+    project_id: uuid.UUID,
+    analysis_type: str,
+) -> dict[str, Any] | None:
+    """Run one analysis and return its JSON result, or None if the project is gone."""
+    method = getattr(analysis_service, _ANALYSIS_METHODS[analysis_type])
+    result = await method(project_id)
+    if result is None:
+        return None
+    if isinstance(result, list):
+        return {analysis_type: [item.model_dump(mode="json") for item in result]}
+    return result.model_dump(mode="json")
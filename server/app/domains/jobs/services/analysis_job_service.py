@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+"""Analysis job application service."""
+
+import logging
+import uuid
+
+from app.domains.jobs.models.dto.analysis_job import AnalysisJobPublic
+from app.domains.jobs.repository.analysis_job_repository import AnalysisJobRepository
+from app.domains.jobs.services.analysis_job_runner import SUPPORTED_ANALYSIS_TYPES
+from app.domains.projects.services.project_service import ProjectService
+
+
+class AnalysisJobService:
+    """Queue analysis jobs and report their status."""
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        job_repository: AnalysisJobRepository,
+        project_service: ProjectService,
+    ) -> None:
+        self.job_repository = job_repository
+        self.project_service = project_service
+
+    async def enqueue_analysis(
+        self,
+        project_id: uuid.UUID,
+        analysis_type: str,
+        requested_by: uuid.UUID | None = None,
+    ) -> AnalysisJobPublic | None:
+        """Queue an analysis, reusing the in-flight job for the same project and type."""
+        if analysis_type not in SUPPORTED_ANALYSIS_TYPES:
+            raise ValueError("unsupported analysis_type")
+        project = await self.project_service.get_project(project_id)
+        if not project:
+            return None
+
+        job, created = await self.job_repository.enqueue(
+            project_id=project_id,
+            analysis_type=analysis_type,
+            requested_by=requested_by,
+        )
+        if not created:
+            self.logger.info(
+                "Reusing in-flight analysis job id=%s project_id=%s analysis_type=%s",
+                job.id,
+                project_id,
+                analysis_type,
+            )
+        return AnalysisJobPublic.model_validate(job)
+
+    async def get_job(self, job_id: uuid.UUID) -> AnalysisJobPublic | None:
+        """Return a job by id or None."""
+        job = await self.job_repository.get_by_id(job_id)
+        if not job:
+            return None
+        return AnalysisJobPublic.model_validate(job)
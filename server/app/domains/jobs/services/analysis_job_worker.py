@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+"""Background workers that process queued analysis jobs."""
+
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domains.analysis.services.project_analysis_service import (
+    ProjectAnalysisService,
+)
+from app.domains.jobs.models.job_status import JobStatus
+from app.domains.jobs.repository.analysis_job_repository import AnalysisJobRepository
+from app.domains.jobs.services.analysis_job_runner import run_analysis_job
+from app.infrastructure.persistence.postgres.jobs.entities.analysis_job import AnalysisJob
+
+AnalysisServiceFactory = Callable[[AsyncSession], ProjectAnalysisService]
+
+
+class AnalysisJobWorkerPool:
+    """Poll the job table and run claimed analyses with bounded concurrency.
+
+    Running jobs send a heartbeat every ``heartbeat_interval`` seconds. Every
+    pool periodically requeues jobs whose heartbeat is older than
+    ``stale_after`` and fails those that already used ``max_attempts``.
+    Results are only recorded while the attempt still owns its job.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        analysis_service_factory: AnalysisServiceFactory,
+        concurrency: int,
+        poll_interval: float,
+        stale_after: float,
+        heartbeat_interval: float,
+        max_attempts: int,
+    ) -> None:
+        self.session_factory = session_factory
+        self.analysis_service_factory = analysis_service_factory
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.heartbeat_interval = heartbeat_interval
+        self.max_attempts = max_attempts
+        self._stopping = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Recover abandoned jobs and start the worker and sweeper tasks."""
+        if self.concurrency <= 0:
+            self.logger.info("Analysis job workers disabled")
+            return
+        await self._sweep()
+
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._run_worker(number), name=f"analysis-job-{number}")
+            for number in range(self.concurrency)
+        ]
+        self._tasks.append(
+            asyncio.create_task(self._run_sweeper(), name="analysis-job-sweeper")
+        )
+        self.logger.info("Started analysis job workers count=%s", self.concurrency)
+
+    async def stop(self) -> None:
+        """Stop the worker tasks, requeueing jobs that were interrupted."""
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run_worker(self, number: int) -> None:
+        while not self._stopping.is_set():
+            try:
+                async with self.session_factory() as session:
+                    job = await AnalysisJobRepository(session).claim_next()
+            except Exception:
+                self.logger.exception("Failed to claim analysis job worker=%s", number)
+                job = None
+
+            if job is None:
+                await self._wait_stopping(self.poll_interval)
+                continue
+
+            await self._process(job)
+
+    async def _run_sweeper(self) -> None:
+        while not self._stopping.is_set():
+            if await self._wait_stopping(self.heartbeat_interval):
+                return
+            try:
+                await self._sweep()
+            except Exception:
+                self.logger.exception("Failed to sweep stale analysis jobs")
+
+    async def _sweep(self) -> None:
+        async with self.session_factory() as session:
+            requeued, failed = await AnalysisJobRepository(session).requeue_stale(
+                timedelta(seconds=self.stale_after), self.max_attempts
+            )
+        if requeued or failed:
+            self.logger.warning(
+                "Recovered stale analysis jobs requeued=%s failed=%s", requeued, failed
+            )
+
+    async def _wait_stopping(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _process(self, job: AnalysisJob) -> None:
+        heartbeat = asyncio.create_task(
+            self._send_heartbeats(job), name=f"analysis-job-heartbeat-{job.id}"
+        )
+        try:
+            await self._run_job(job)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+    async def _send_heartbeats(self, job: AnalysisJob) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with self.session_factory() as session:
+                    owned = await AnalysisJobRepository(session).heartbeat(
+                        job.id, job.attempts
+                    )
+            except Exception:
+                self.logger.exception("Failed to record heartbeat job_id=%s", job.id)
+                continue
+            if not owned:
+                self.logger.warning(
+                    "Analysis job attempt was superseded id=%s attempt=%s",
+                    job.id,
+                    job.attempts,
+                )
+                return
+
+    async def _run_job(self, job: AnalysisJob) -> None:
+        self.logger.info(
+            "Running analysis job id=%s project_id=%s analysis_type=%s attempt=%s",
+            job.id,
+            job.project_id,
+            job.analysis_type,
+            job.attempts,
+        )
+        try:
+            async with self.session_factory() as session:
+                result_json = await run_analysis_job(
+                    self.analysis_service_factory(session),
+                    project_id=job.project_id,
+                    analysis_type=job.analysis_type,
+                )
+        except asyncio.CancelledError:
+            self.logger.warning("Analysis job interrupted id=%s", job.id)
+            async with self.session_factory() as session:
+                await AnalysisJobRepository(session).requeue(job.id, job.attempts)
+            raise
+        except Exception as exc:
+            self.logger.exception("Analysis job failed id=%s", job.id)
+            await self._finish(job, JobStatus.FAILED, error=str(exc) or type(exc).__name__)
+            return
+
+        if result_json is None:
+            await self._finish(job, JobStatus.FAILED, error="project not found")
+            return
+        if await self._finish(job, JobStatus.SUCCEEDED, result_json=result_json):
+            self.logger.info("Analysis job succeeded id=%s", job.id)
+
+    async def _finish(
+        self,
+        job: AnalysisJob,
+        status: JobStatus,
+        result_json: dict | None = None,
+        error: str | None = None,
+    ) -> bool:
+        async with self.session_factory() as session:
+            recorded = await AnalysisJobRepository(session).finish(
+                job.id, job.attempts, status, result_json=result_json, error=error
+            )
+        if not recorded:
+            self.logger.warning(
+                "Discarded result of superseded analysis job id=%s attempt=%s",
+                job.id,
+                job.attempts,
+            )
+        return recorded
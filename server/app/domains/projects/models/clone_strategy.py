@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+"""Clone strategies for git project sources."""
+
+from enum import Enum
+
+
+class CloneStrategy(str, Enum):
+    """How much of a git repository is cloned."""
+    FULL = "full"
+    SHALLOW = "shallow"
+    BLOBLESS = "blobless"
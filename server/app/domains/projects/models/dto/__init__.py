@@ -1,19 +1,25 @@
+from app.domains.projects.models.clone_strategy import CloneStrategy
 from app.domains.projects.models.dto.project import (
+    ProjectCloneSettings,
     ProjectCreate,
     ProjectMemberCreate,
     ProjectMemberPublic,
     ProjectMemberUserPublic,
     ProjectPublic,
+    ProjectSettings,
 )
 from app.domains.projects.models.dto.snapshot import SnapshotPage, SnapshotPublic
 from app.domains.projects.models.source_type import SourceType
 
 __all__ = [
+    "CloneStrategy",
+    "ProjectCloneSettings",
     "ProjectCreate",
     "ProjectMemberCreate",
     "ProjectMemberPublic",
     "ProjectMemberUserPublic",
     "ProjectPublic",
+    "ProjectSettings",
     "SnapshotPage",
     "SnapshotPublic",
     "SourceType",
@@ -4,19 +4,36 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Any
 
-from sqlmodel import SQLModel
+from sqlmodel import Field, SQLModel
 
 from app.domains.identity.models.dto.user import UserPublic
+from app.domains.projects.models.clone_strategy import CloneStrategy
 from app.domains.projects.models.source_type import SourceType
 
 
+class ProjectCloneSettings(SQLModel):
+    """How a git project is cloned; unset fields use the server defaults."""
+    strategy: CloneStrategy | None = None
+    depth: int | None = Field(default=None, ge=1)
+    single_branch: bool = False
+    branch: str | None = None
+    sparse_paths: list[str] = Field(default_factory=list)
+
+
+class ProjectSettings(SQLModel):
+    """Per-project settings stored with the project."""
+    clone: ProjectCloneSettings = Field(default_factory=ProjectCloneSettings)
+
+
 class ProjectCreate(SQLModel):
     """Payload to create a project."""
     name: str
     description: str | None = None
     source_type: SourceType
     source_ref: str
+    settings: ProjectSettings | None = None
 
 
 class ProjectPublic(SQLModel):
@@ -26,6 +43,7 @@ class ProjectPublic(SQLModel):
     description: str | None
     source_type: SourceType
     source_ref: str
+    settings_json: dict[str, Any] = Field(default_factory=dict)
     created_at: datetime
     last_analysis_at: datetime | None
 
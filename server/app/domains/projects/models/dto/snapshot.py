@@ -30,19 +30,49 @@ class SnapshotPublicNoSummary(SQLModel):
     created_at: datetime
 
 
+class SnapshotProjection(SQLModel):
+    """Snapshot restricted to the fields requested by the client."""
+
+    id: uuid.UUID | None = None
+    project_id: uuid.UUID | None = None
+    analysis_type: str | None = None
+    commit_hash: str | None = None
+    summary_json: dict[str, Any] | None = None
+    created_at: datetime | None = None
+
+
 class SnapshotPage(SQLModel):
     """Paginated snapshots response."""
 
     items: list[SnapshotPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 class SnapshotPageNoSummary(SQLModel):
     """Paginated snapshots response without summary."""
 
     items: list[SnapshotPublicNoSummary]
-    total: int
+    total: int | None
+    limit: int
+    offset: int
+    next_cursor: str | None = None
+
+
+class SnapshotProjectionPage(SQLModel):
+    """Paginated snapshots response limited to requested fields."""
+
+    items: list[SnapshotProjection]
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
+
+
+class ProjectLatestSnapshots(SQLModel):
+    """Latest snapshot of each analysis type for a project."""
+
+    project_id: uuid.UUID
+    snapshots: dict[str, SnapshotPublic]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+"""Snapshot retention policy and run report."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which snapshots of one project and analysis type survive retention.
+
+    A snapshot is kept if it is among the ``keep_last`` newest, the newest of
+    its UTC day within ``keep_daily_days``, or the newest of its ISO week within
+    ``keep_weekly_weeks`` (``None`` keeps one per week forever, ``0`` none).
+    The newest snapshot is always kept.
+    """
+
+    keep_last: int = 10
+    keep_daily_days: int = 30
+    keep_weekly_weeks: int | None = None
+
+
+@dataclass
+class RetentionReport:
+    """Rows reclaimed by a retention run."""
+
+    series_scanned: int = 0
+    snapshots_deleted: int = 0
+    rows_deleted: dict[str, int] = field(default_factory=dict)
+
+    def add_rows(self, rows_deleted: dict[str, int]) -> None:
+        for table, count in rows_deleted.items():
+            self.rows_deleted[table] = self.rows_deleted.get(table, 0) + count
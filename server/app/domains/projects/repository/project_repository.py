@@ -25,6 +25,14 @@ class ProjectRepository:
         await self.session.refresh(project)
         return project
 
+    async def update(self, project: Project) -> Project:
+        """Persist changes to a project and return the stored entity."""
+        self.logger.info("Updating project id=%s", project.id)
+        self.session.add(project)
+        await self.session.commit()
+        await self.session.refresh(project)
+        return project
+
     async def get_by_id(self, project_id: uuid.UUID) -> Project | None:
         """Return a project by id or None."""
         self.logger.debug("Fetching project by id=%s", project_id)
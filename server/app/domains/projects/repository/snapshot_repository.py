@@ -6,11 +6,20 @@ import logging
 import uuid
 from datetime import datetime
 
-from sqlalchemy import func
+from sqlalchemy import func, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from sqlmodel import select
 
+from app.infrastructure.persistence.postgres.projects.entities.project_latest_snapshot import (
+    ProjectLatestSnapshot,
+)
 from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.infrastructure.persistence.postgres.projects.entities.snapshot_observation import (
+    SnapshotObservation,
+)
+from app.shared.pagination.keyset import KeysetPosition
 
 
 class SnapshotRepository:
@@ -21,14 +30,42 @@ class SnapshotRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def create(self, snapshot: Snapshot) -> Snapshot:
-        """Persist a snapshot and return the stored entity."""
+    async def create(self, snapshot: Snapshot, commit: bool = True) -> Snapshot:
+        """Persist a snapshot and return the stored entity.
+
+        The latest-snapshot pointer for the project and analysis type is moved
+        in the same transaction. With ``commit=False`` nothing is committed so
+        the caller can commit the snapshot together with its rows.
+        """
         self.logger.info("Creating snapshot project_id=%s", snapshot.project_id)
         self.session.add(snapshot)
+        await self._point_latest(snapshot)
+        if not commit:
+            return snapshot
         await self.session.commit()
         await self.session.refresh(snapshot)
         return snapshot
 
+    async def create_observation(
+        self, observation: SnapshotObservation, commit: bool = True
+    ) -> SnapshotObservation:
+        """Persist a record that an existing snapshot was reproduced."""
+        self.logger.info(
+            "Recording snapshot observation snapshot_id=%s", observation.snapshot_id
+        )
+        self.session.add(observation)
+        if commit:
+            await self.session.commit()
+        return observation
+
+    async def commit(self) -> None:
+        """Commit pending snapshot writes."""
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        """Discard pending snapshot writes."""
+        await self.session.rollback()
+
     async def get_by_id(self, snapshot_id: uuid.UUID) -> Snapshot | None:
         """Return a snapshot by id or None."""
         result = await self.session.execute(
@@ -43,11 +80,25 @@ class SnapshotRepository:
         offset: int = 0,
         start_at: datetime | None = None,
         end_at: datetime | None = None,
+        after: KeysetPosition | None = None,
+        include_summary: bool = True,
     ) -> list[Snapshot]:
-        """List snapshots for a project with optional filters."""
+        """List snapshots for a project, newest first, with optional filters.
+
+        When ``after`` is given, rows strictly older than that
+        ``(created_at, id)`` position are returned and ``offset`` is ignored.
+        With ``include_summary=False`` the JSONB summary is not selected and
+        must not be accessed on the returned snapshots.
+        """
         query = self._build_project_query(project_id, start_at, end_at)
+        if not include_summary:
+            query = query.options(defer(Snapshot.summary_json, raiseload=True))
+        if after is not None:
+            query = query.where(tuple_(Snapshot.created_at, Snapshot.id) < after)
+        else:
+            query = query.offset(offset)
         result = await self.session.execute(
-            query.order_by(Snapshot.created_at.desc()).limit(limit).offset(offset)
+            query.order_by(Snapshot.created_at.desc(), Snapshot.id.desc()).limit(limit)
         )
         return list(result.scalars().all())
 
@@ -86,15 +137,55 @@ class SnapshotRepository:
         """Return the latest snapshot for a project and analysis type."""
         result = await self.session.execute(
             select(Snapshot)
+            .join(
+                ProjectLatestSnapshot,
+                ProjectLatestSnapshot.snapshot_id == Snapshot.id,
+            )
             .where(
-                (Snapshot.project_id == project_id)
-                & (Snapshot.analysis_type == analysis_type)
+                (ProjectLatestSnapshot.project_id == project_id)
+                & (ProjectLatestSnapshot.analysis_type == analysis_type)
             )
-            .order_by(Snapshot.created_at.desc())
-            .limit(1)
         )
         return result.scalar_one_or_none()
 
+    async def list_latest_by_projects(
+        self,
+        project_ids: list[uuid.UUID],
+        analysis_types: list[str] | None = None,
+    ) -> list[Snapshot]:
+        """Return the latest snapshot of each analysis type for many projects."""
+        query = (
+            select(Snapshot)
+            .join(
+                ProjectLatestSnapshot,
+                ProjectLatestSnapshot.snapshot_id == Snapshot.id,
+            )
+            .where(ProjectLatestSnapshot.project_id.in_(project_ids))
+        )
+        if analysis_types:
+            query = query.where(ProjectLatestSnapshot.analysis_type.in_(analysis_types))
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def _point_latest(self, snapshot: Snapshot) -> None:
+        statement = insert(ProjectLatestSnapshot).values(
+            project_id=snapshot.project_id,
+            analysis_type=snapshot.analysis_type,
+            snapshot_id=snapshot.id,
+            created_at=snapshot.created_at,
+        )
+        excluded = statement.excluded
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=["project_id", "analysis_type"],
+                set_={
+                    "snapshot_id": excluded.snapshot_id,
+                    "created_at": excluded.created_at,
+                },
+                where=ProjectLatestSnapshot.created_at <= excluded.created_at,
+            )
+        )
+
     @staticmethod
     def _build_project_query(
         project_id: uuid.UUID,
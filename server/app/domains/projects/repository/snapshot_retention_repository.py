@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+"""Snapshot retention repository for persistence access."""
+
+from datetime import datetime
+import logging
+import uuid
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.infrastructure.persistence.postgres.analysis.entities.api_endpoint import ApiEndpoint
+from app.infrastructure.persistence.postgres.analysis.entities.project_dependency import (
+    ProjectDependency,
+)
+from app.infrastructure.persistence.postgres.analysis.entities.snapshot_framework import (
+    SnapshotFramework,
+)
+from app.infrastructure.persistence.postgres.analysis.entities.snapshot_infrastructure import (
+    SnapshotInfrastructure,
+)
+from app.infrastructure.persistence.postgres.analysis.entities.snapshot_language import (
+    SnapshotLanguage,
+)
+from app.infrastructure.persistence.postgres.projects.entities.project_latest_snapshot import (
+    ProjectLatestSnapshot,
+)
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+
+# api_endpoints and project_dependencies have no foreign key to snapshots, so
+# child rows are deleted explicitly rather than relying on ON DELETE CASCADE.
+_CHILD_ENTITIES = (
+    ApiEndpoint,
+    ProjectDependency,
+    SnapshotLanguage,
+    SnapshotFramework,
+    SnapshotInfrastructure,
+)
+
+
+class SnapshotRetentionRepository:
+    """Data access layer for pruning superseded snapshots."""
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def list_series(self) -> list[tuple[uuid.UUID, str]]:
+        """List every (project_id, analysis_type) pair that has snapshots."""
+        result = await self.session.execute(
+            select(ProjectLatestSnapshot.project_id, ProjectLatestSnapshot.analysis_type)
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def list_series_snapshots(
+        self, project_id: uuid.UUID, analysis_type: str
+    ) -> list[tuple[uuid.UUID, datetime]]:
+        """List (id, created_at) of a project's snapshots of one analysis type."""
+        result = await self.session.execute(
+            select(Snapshot.id, Snapshot.created_at).where(
+                (Snapshot.project_id == project_id)
+                & (Snapshot.analysis_type == analysis_type)
+            )
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def delete_snapshots(self, snapshot_ids: list[uuid.UUID]) -> dict[str, int]:
+        """Delete snapshots with their child rows and commit; return rows per table."""
+        rows_deleted: dict[str, int] = {}
+        for entity in (*_CHILD_ENTITIES, Snapshot):
+            id_column = Snapshot.id if entity is Snapshot else entity.snapshot_id
+            result = await self.session.execute(
+                delete(entity)
+                .where(id_column.in_(snapshot_ids))
+                .execution_options(synchronize_session=False)
+            )
+            rows_deleted[entity.__tablename__] = result.rowcount
+        await self.session.commit()
+        return rows_deleted
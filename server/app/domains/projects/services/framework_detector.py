@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from app.shared.filesystem.scanner import FileSystemScanner
+from app.shared.cache.parse_cache import ParseCache
+from app.shared.concurrency.parse_pool import ParsePool
+from app.shared.filesystem.scan_index import ScanIndex
 
 """Framework detection based on dependency and config signals."""
 
@@ -9,8 +11,36 @@ import json
 import re
 from pathlib import Path
 import tomllib
+from typing import Callable, Sequence
 
 from app.core.logging import get_logger
+from app.domains.projects.services.rule_set import compile_rule_set
+
+_MANIFEST_NAMES = (
+    "requirements.txt",
+    "pyproject.toml",
+    "package.json",
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts",
+)
+_MANIFEST_SIGNALS = {
+    "requirements.txt": "python_dependency",
+    "pyproject.toml": "python_dependency",
+    "package.json": "node_dependency",
+    "pom.xml": "java_dependency",
+    "build.gradle": "java_dependency",
+    "build.gradle.kts": "java_dependency",
+}
+# Bump when a parser's output changes so cached tokens are re-parsed.
+_PARSER_VERSION = 1
+_IMPORT_SUFFIXES = (".py", ".js", ".ts", ".jsx", ".tsx", ".java")
+_JS_SUFFIXES = {".js", ".ts", ".jsx", ".tsx"}
+_PY_IMPORT_RE = re.compile(r"import\s+([a-zA-Z0-9_\\.]+)")
+_PY_FROM_IMPORT_RE = re.compile(r"from\s+([a-zA-Z0-9_\\.]+)\s+import")
+_JS_FROM_RE = re.compile(r"from\s+['\"]([^'\"]+)['\"]")
+_JS_REQUIRE_RE = re.compile(r"require\(['\"]([^'\"]+)['\"]\)")
+_JAVA_IMPORT_RE = re.compile(r"import\s+([a-zA-Z0-9_\\.]+);")
 
 
 @dataclass(frozen=True)
@@ -26,18 +56,27 @@ class FrameworkRule:
 class FrameworkDetector:
     """Detect frameworks using signal rules and weighted scores."""
 
-    def __init__(self, rules: list[FrameworkRule]) -> None:
+    def __init__(
+        self,
+        rules: list[FrameworkRule],
+        parse_pool: ParsePool | None = None,
+        parse_cache: ParseCache | None = None,
+    ) -> None:
         self.rules = rules
+        self.rule_set = compile_rule_set(
+            tuple(
+                (rule.framework, rule.signal_type, rule.signal_value, rule.weight)
+                for rule in rules
+            )
+        )
+        self.parse_pool = parse_pool
+        self.parse_cache = parse_cache
         self.logger = get_logger(__name__)
 
-    def detect(self, scanner: FileSystemScanner) -> dict[str, float]:
+    def detect(self, index: ScanIndex) -> dict[str, float]:
         """Return confidence scores for frameworks based on signals."""
-        signals = _collect_signals(scanner)
-        scores: dict[str, int] = {}
-
-        for rule in self.rules:
-            if _signal_matches(rule, signals):
-                scores[rule.framework] = scores.get(rule.framework, 0) + rule.weight
+        signals = _collect_signals(index, self.parse_pool, self.parse_cache)
+        scores = self.rule_set.score(signals)
 
         total = sum(scores.values())
         if total <= 0:
@@ -45,47 +84,68 @@ class FrameworkDetector:
         return {name: score / total for name, score in scores.items()}
 
 
-def _signal_matches(rule: FrameworkRule, signals: dict[str, set[str]]) -> bool:
-    signal_type = rule.signal_type
-    signal_value = rule.signal_value.lower().strip()
-    if not signal_value:
-        return False
-    return signal_value in signals.get(signal_type, set())
-
-
-def _collect_signals(scanner: FileSystemScanner) -> dict[str, set[str]]:
-    python_deps: set[str] = set()
-    node_deps: set[str] = set()
-    java_deps: set[str] = set()
-    config_files: set[str] = set()
-    import_tokens: set[str] = set()
-
-    for path in scanner.scan_files():
-        name = path.name
-        config_files.add(name.lower())
-
-        if name == "requirements.txt":
-            python_deps.update(_parse_requirements(path))
-        elif name == "pyproject.toml":
-            python_deps.update(_parse_pyproject(path))
-        elif name == "package.json":
-            node_deps.update(_parse_package_json(path))
-        elif name == "pom.xml":
-            java_deps.update(_parse_pom(path))
-        elif name in {"build.gradle", "build.gradle.kts"}:
-            java_deps.update(_parse_gradle(path))
-
-        if path.suffix.lower() in {".py", ".js", ".ts", ".jsx", ".tsx", ".java"}:
-            import_tokens.update(_parse_imports(path))
-
-    return {
-        "python_dependency": python_deps,
-        "node_dependency": node_deps,
-        "java_dependency": java_deps,
-        "config_file": config_files,
-        "import": import_tokens,
+def _collect_signals(
+    index: ScanIndex,
+    parse_pool: ParsePool | None = None,
+    parse_cache: ParseCache | None = None,
+) -> dict[str, set[str]]:
+    signals: dict[str, set[str]] = {
+        "python_dependency": set(),
+        "node_dependency": set(),
+        "java_dependency": set(),
+        "config_file": {name.lower() for name in index.file_names()},
+        "import": set(),
     }
 
+    manifests = list(index.files_named(*_MANIFEST_NAMES))
+    manifest_tokens = _cached_tokens(
+        parse_cache,
+        "framework.manifest",
+        manifests,
+        lambda paths: [_parse_manifest(path) for path in paths],
+    )
+    for path, tokens in zip(manifests, manifest_tokens):
+        signals[_MANIFEST_SIGNALS[path.name]].update(tokens)
+
+    def parse_imports(paths: Sequence[Path]) -> list[set[str]]:
+        if parse_pool is not None:
+            return parse_pool.parse_each(_parse_imports, paths)
+        return [_parse_imports(path) for path in paths]
+
+    source_files = list(index.files_with_suffix(*_IMPORT_SUFFIXES))
+    for tokens in _cached_tokens(
+        parse_cache, "framework.imports", source_files, parse_imports
+    ):
+        signals["import"].update(tokens)
+
+    return signals
+
+
+def _cached_tokens(
+    parse_cache: ParseCache | None,
+    extractor: str,
+    paths: Sequence[Path],
+    parse: Callable[[Sequence[Path]], list[set[str]]],
+) -> list[set[str]]:
+    if parse_cache is None:
+        return parse(paths)
+    return parse_cache.parse_many(
+        extractor, _PARSER_VERSION, paths, parse, encode=sorted, decode=set
+    )
+
+
+def _parse_manifest(path: Path) -> set[str]:
+    name = path.name
+    if name == "requirements.txt":
+        return _parse_requirements(path)
+    if name == "pyproject.toml":
+        return _parse_pyproject(path)
+    if name == "package.json":
+        return _parse_package_json(path)
+    if name == "pom.xml":
+        return _parse_pom(path)
+    return _parse_gradle(path)
+
 
 def _parse_requirements(path: Path) -> set[str]:
     deps: set[str] = set()
@@ -181,26 +241,27 @@ def _parse_imports(path: Path) -> set[str]:
     except OSError:
         return tokens
 
+    suffix = path.suffix.lower()
     for line in content.splitlines():
         line = line.strip()
         if not line:
             continue
-        if path.suffix.lower() == ".py":
-            match = re.match(r"import\s+([a-zA-Z0-9_\\.]+)", line)
+        if suffix == ".py":
+            match = _PY_IMPORT_RE.match(line)
             if match:
                 tokens.add(match.group(1).split(".")[0].lower())
-            match = re.match(r"from\s+([a-zA-Z0-9_\\.]+)\s+import", line)
+            match = _PY_FROM_IMPORT_RE.match(line)
             if match:
                 tokens.add(match.group(1).split(".")[0].lower())
-        elif path.suffix.lower() in {".js", ".ts", ".jsx", ".tsx"}:
-            match = re.search(r"from\s+['\"]([^'\"]+)['\"]", line)
+        elif suffix in _JS_SUFFIXES:
+            match = _JS_FROM_RE.search(line)
             if match:
                 tokens.add(match.group(1).split("/")[0].lower())
-            match = re.search(r"require\(['\"]([^'\"]+)['\"]\)", line)
+            match = _JS_REQUIRE_RE.search(line)
             if match:
                 tokens.add(match.group(1).split("/")[0].lower())
-        elif path.suffix.lower() == ".java":
-            match = re.match(r"import\s+([a-zA-Z0-9_\\.]+);", line)
+        elif suffix == ".java":
+            match = _JAVA_IMPORT_RE.match(line)
             if match:
                 tokens.add(match.group(1).split(".")[-1].lower())
     return tokens
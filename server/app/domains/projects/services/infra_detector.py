@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-from app.shared.filesystem.scanner import FileSystemScanner
+from app.shared.filesystem.scan_index import ScanIndex
 
 """Infrastructure detection based on filesystem signals."""
 
 from dataclasses import dataclass
-import fnmatch
-from pathlib import Path
 
 from app.core.logging import get_logger
+from app.domains.projects.services.rule_set import compile_rule_set
 
 
 @dataclass(frozen=True)
@@ -26,23 +25,25 @@ class InfraDetector:
 
     def __init__(self, rules: list[InfraRule]) -> None:
         self.rules = rules
+        self.rule_set = compile_rule_set(
+            tuple(
+                (rule.component, rule.signal_type, rule.signal_value, rule.weight)
+                for rule in rules
+            )
+        )
         self.logger = get_logger(__name__)
 
-    def detect(self, scanner: FileSystemScanner) -> list[str]:
+    def detect(self, index: ScanIndex) -> list[str]:
         """Return detected infrastructure components ordered by score."""
         self.logger.debug("Detecting infrastructure rules=%s", len(self.rules))
-        signals = _collect_signals(scanner)
+        signals = _collect_signals(index)
         self.logger.debug(
             "Collected infra signals files=%s directories=%s globs=%s",
             len(signals.get("file", set())),
             len(signals.get("directory", set())),
             len(signals.get("glob_targets", set())),
         )
-        scores: dict[str, int] = {}
-
-        for rule in self.rules:
-            if _signal_matches(rule, signals):
-                scores[rule.component] = scores.get(rule.component, 0) + rule.weight
+        scores = self.rule_set.score(signals, glob_targets=signals["glob_targets"])
 
         detected = [
             name
@@ -54,47 +55,22 @@ class InfraDetector:
         return detected
 
 
-def _signal_matches(rule: InfraRule, signals: dict[str, set[str]]) -> bool:
-    signal_type = rule.signal_type
-    signal_value = rule.signal_value.lower().strip()
-    if not signal_value:
-        return False
-    if signal_type == "glob":
-        return _glob_matches(signal_value, signals.get("glob_targets", set()))
-    return signal_value in signals.get(signal_type, set())
-
-
-def _glob_matches(pattern: str, targets: set[str]) -> bool:
-    for target in targets:
-        if fnmatch.fnmatch(target, pattern):
-            return True
-    return False
-
-
-def _collect_signals(scanner: FileSystemScanner) -> dict[str, set[str]]:
+def _collect_signals(index: ScanIndex) -> dict[str, set[str]]:
     files: set[str] = set()
     directories: set[str] = set()
     glob_targets: set[str] = set()
 
-    for path in scanner.scan_files():
-        files.add(path.name.lower())
-        relative = _relative_posix(scanner.root_path, path)
-        glob_targets.add(relative)
-        glob_targets.add(path.name.lower())
+    for relative in index.relative_files():
+        name = relative.rsplit("/", 1)[-1].lower()
+        files.add(name)
+        glob_targets.add(relative.lower())
+        glob_targets.add(name)
 
-    for path in scanner.scan_directories():
-        relative = _relative_posix(scanner.root_path, path)
-        directories.add(relative)
+    for relative in index.relative_directories():
+        directories.add(relative.lower())
 
     return {
         "file": files,
         "directory": directories,
         "glob_targets": glob_targets,
     }
-
-
-def _relative_posix(root: Path, path: Path) -> str:
-    try:
-        return path.relative_to(root).as_posix().lower()
-    except ValueError:
-        return path.as_posix().lower()
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from app.shared.filesystem.scanner import FileSystemScanner
+from app.shared.filesystem.scan_index import ScanIndex
 
 """Language detection based on file extensions."""
 
 from dataclasses import dataclass
+from pathlib import PurePosixPath
 from typing import Iterable
 
 from app.core.logging import get_logger
@@ -26,9 +27,23 @@ class LanguageDetector:
         self.rules = list(rules)
         self.logger = get_logger(__name__)
 
-    def detect(self, scanner: FileSystemScanner) -> dict[str, int]:
-        """Return a weighted language count based on scanned files."""
+    def detect(self, index: ScanIndex) -> dict[str, int]:
+        """Return a weighted language count based on indexed files."""
         self.logger.info("Detecting languages using %s rules", len(self.rules))
+        counts = self._weigh(index.suffix_counts())
+        self.logger.info("Language detection complete languages=%s", len(counts))
+        return counts
+
+    def detect_paths(self, relative_paths: Iterable[str]) -> dict[str, int]:
+        """Return a weighted language count for the given relative file paths."""
+        suffix_counts: dict[str, int] = {}
+        for relative_path in relative_paths:
+            suffix = PurePosixPath(relative_path).suffix.lower()
+            if suffix:
+                suffix_counts[suffix] = suffix_counts.get(suffix, 0) + 1
+        return self._weigh(suffix_counts)
+
+    def _weigh(self, suffix_counts: dict[str, int]) -> dict[str, int]:
         rule_map: dict[str, LanguageRule] = {}
         for rule in self.rules:
             extension = rule.extension.lower().lstrip(".")
@@ -37,14 +52,14 @@ class LanguageDetector:
             rule_map[extension] = rule
 
         counts: dict[str, int] = {}
-        for path in scanner.scan_files():
-            extension = path.suffix.lower().lstrip(".")
+        for suffix, file_count in suffix_counts.items():
+            extension = suffix.lstrip(".")
             if not extension:
                 continue
             rule = rule_map.get(extension)
             if not rule:
                 continue
-            counts[rule.language] = counts.get(rule.language, 0) + rule.weight
-
-        self.logger.info("Language detection complete languages=%s", len(counts))
+            counts[rule.language] = (
+                counts.get(rule.language, 0) + rule.weight * file_count
+            )
         return counts
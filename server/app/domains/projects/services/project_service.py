@@ -6,11 +6,21 @@ from datetime import datetime, timezone
 import logging
 import uuid
 
-from app.domains.projects.models.dto.project import ProjectCreate, ProjectPublic
+from app.domains.projects.models.dto.project import (
+    ProjectCreate,
+    ProjectPublic,
+    ProjectSettings,
+)
 from app.infrastructure.persistence.postgres.projects.entities.project import Project
 from app.domains.projects.models.source_type import SourceType
 from app.domains.projects.repository.project_repository import ProjectRepository
+from app.domains.projects.services.project_settings import (
+    clone_options,
+    resolve_project_settings,
+)
+from app.domains.projects.services.project_source import resolve_project_source
 from app.infrastructure.external.source.orchestartor import prepare_source
+from app.shared.concurrency.executor import run_analysis
 
 
 class ProjectService:
@@ -32,22 +42,27 @@ class ProjectService:
             raise PermissionError("admin role required")
         if data.source_type not in {SourceType.GIT, SourceType.LOCAL}:
             raise ValueError("invalid source_type")
+        settings = resolve_project_settings(data.settings or ProjectSettings())
+        options = clone_options(settings)
 
         project = Project(
             name=data.name,
             description=data.description,
             source_type=data.source_type.value,
             source_ref=data.source_ref,
+            settings_json=settings.model_dump(mode="json"),
             created_at=datetime.now(timezone.utc),
         )
 
         if data.source_type == SourceType.GIT:
             try:
-                local_path = prepare_source(
+                local_path = await run_analysis(
+                    prepare_source,
                     source_type=data.source_type,
                     source_ref=data.source_ref,
                     project_id=project.id,
                     allow_clone=True,
+                    clone_options=options,
                 )
                 self.logger.info("Cloned git source to %s", local_path)
             except Exception as exc:
@@ -61,10 +76,29 @@ class ProjectService:
         created = await self.project_repository.create(project)
         return ProjectPublic.model_validate(created)
 
+    async def update_settings(
+        self, project_id: uuid.UUID, settings: ProjectSettings, actor_role: str
+    ) -> ProjectPublic | None:
+        """Replace a project's settings.
+
+        Clone settings take effect the next time the source is cloned.
+        """
+        self.logger.info("Updating project settings project_id=%s", project_id)
+        if actor_role != "admin":
+            raise PermissionError("admin role required")
+        settings = resolve_project_settings(settings)
+
+        project = await self.project_repository.get_by_id(project_id)
+        if not project:
+            return None
+        project.settings_json = settings.model_dump(mode="json")
+        updated = await self.project_repository.update(project)
+        return ProjectPublic.model_validate(updated)
+
     async def prepare_project_source(
         self, project_id: uuid.UUID, actor_role: str
     ) -> None:
-        """Prepare project source content based on its configured type."""
+        """Prepare project source content, fetching git sources regardless of age."""
         self.logger.info("Preparing project source project_id=%s", project_id)
         if actor_role != "admin":
             raise PermissionError("admin role required")
@@ -73,11 +107,8 @@ class ProjectService:
         if not project:
             raise ValueError("project not found")
 
-        prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=False,
+        await resolve_project_source(
+            ProjectPublic.model_validate(project), sync=True, max_age_seconds=0
         )
 
     async def list_projects(self, limit: int = 100, offset: int = 0) -> list[ProjectPublic]:
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+"""Interpretation of per-project settings."""
+
+from pathlib import PurePosixPath
+from typing import Any, Mapping
+
+from app.core.settings import GIT_CLONE_DEFAULT_STRATEGY, GIT_CLONE_SHALLOW_DEPTH
+from app.domains.projects.models.clone_strategy import CloneStrategy
+from app.domains.projects.models.dto.project import (
+    ProjectCloneSettings,
+    ProjectSettings,
+)
+from app.infrastructure.external.git.clone import CloneOptions
+
+
+def load_project_settings(settings_json: Mapping[str, Any] | None) -> ProjectSettings:
+    """Return the settings stored with a project, filling in defaults."""
+    return ProjectSettings.model_validate(settings_json or {})
+
+
+def resolve_project_settings(settings: ProjectSettings) -> ProjectSettings:
+    """Return ``settings`` with the clone strategy in effect made explicit.
+
+    Raises ValueError when the clone settings are inconsistent. Stored
+    settings keep cloning the same way when ``GIT_CLONE_DEFAULT_STRATEGY``
+    changes later.
+    """
+    clone_options(settings)
+    clone = settings.clone.model_copy(update={"strategy": _clone_strategy(settings.clone)})
+    return settings.model_copy(update={"clone": clone})
+
+
+def clone_options(settings: ProjectSettings) -> CloneOptions:
+    """Return the clone options selected by ``settings``.
+
+    Raises ValueError when the clone settings are inconsistent.
+    """
+    clone = settings.clone
+    strategy = _clone_strategy(clone)
+    if clone.sparse_paths and strategy != CloneStrategy.BLOBLESS:
+        raise ValueError("sparse_paths require the blobless clone strategy")
+    if clone.depth is not None and strategy != CloneStrategy.SHALLOW:
+        raise ValueError("depth requires the shallow clone strategy")
+    for path in clone.sparse_paths:
+        parts = PurePosixPath(path).parts
+        if not parts or path.startswith(("/", "-")) or ".." in parts:
+            raise ValueError(f"invalid sparse path: {path}")
+    depth = None
+    if strategy == CloneStrategy.SHALLOW:
+        depth = clone.depth or GIT_CLONE_SHALLOW_DEPTH
+    return CloneOptions(
+        depth=depth,
+        blobless=strategy == CloneStrategy.BLOBLESS,
+        single_branch=clone.single_branch,
+        branch=clone.branch or None,
+        sparse_paths=tuple(clone.sparse_paths),
+    )
+
+
+def _clone_strategy(clone: ProjectCloneSettings) -> CloneStrategy:
+    if clone.strategy is not None:
+        return clone.strategy
+    # Settings stored without a strategy keep the one their options imply.
+    if clone.depth is not None:
+        return CloneStrategy.SHALLOW
+    if clone.sparse_paths:
+        return CloneStrategy.BLOBLESS
+    return CloneStrategy(GIT_CLONE_DEFAULT_STRATEGY)
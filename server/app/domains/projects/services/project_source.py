@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+"""Local checkouts of project sources."""
+
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator
+
+from app.core.settings import GIT_SYNC_MAX_AGE_SECONDS
+from app.domains.projects.models.dto.project import ProjectPublic
+from app.domains.projects.models.source_type import SourceType
+from app.domains.projects.services.project_settings import (
+    clone_options,
+    load_project_settings,
+)
+from app.infrastructure.external.git.clone import checkout_lock_path
+from app.infrastructure.external.git.sync import sync_repository
+from app.infrastructure.external.source.orchestartor import prepare_source
+from app.shared.concurrency.executor import run_analysis, run_blocking
+from app.shared.concurrency.file_lock import async_file_lock
+from app.shared.concurrency.single_flight import SingleFlight
+
+
+@lru_cache(maxsize=1)
+def get_source_flights() -> SingleFlight[Path]:
+    """Return the process-wide registry of in-progress clones and syncs."""
+    return SingleFlight()
+
+
+async def resolve_project_source(
+    project: ProjectPublic,
+    allow_clone: bool = False,
+    sync: bool = False,
+    max_age_seconds: float = GIT_SYNC_MAX_AGE_SECONDS,
+) -> Path:
+    """Return the local source path of ``project``.
+
+    Git sources are cloned with the project's clone settings when missing and
+    ``allow_clone`` is set. With ``sync`` they are fetched and reset to the
+    tracked branch unless they were fetched within ``max_age_seconds``.
+    Concurrent callers share one clone or sync per project; the checkout lock
+    taken by the git helpers extends that to other processes, and a sync waits
+    for readers holding ``source_read_lock``.
+    """
+    source_type = SourceType(project.source_type)
+    if source_type != SourceType.GIT or not (allow_clone or sync):
+        return await run_blocking(
+            prepare_source,
+            source_type=source_type,
+            source_ref=project.source_ref,
+            project_id=project.id,
+            allow_clone=allow_clone,
+        )
+
+    options = clone_options(load_project_settings(project.settings_json))
+
+    async def prepare() -> Path:
+        # Cloning and fetching are long network calls; keep them in the bounded pool.
+        source_path = await run_analysis(
+            prepare_source,
+            source_type=source_type,
+            source_ref=project.source_ref,
+            project_id=project.id,
+            allow_clone=allow_clone,
+            clone_options=options,
+        )
+        if sync:
+            # Wait for the lock here rather than in a pool thread, so readers
+            # that still need the pool to finish their scan can release it.
+            async with async_file_lock(checkout_lock_path(source_path)):
+                await run_analysis(
+                    sync_repository,
+                    source_path,
+                    branch=options.branch,
+                    max_age_seconds=max_age_seconds,
+                    locked=True,
+                )
+        return source_path
+
+    key = (project.id, allow_clone, sync, max_age_seconds)
+    return await get_source_flights().run(key, prepare)
+
+
+@asynccontextmanager
+async def source_read_lock(
+    project: ProjectPublic, source_path: Path
+) -> AsyncIterator[None]:
+    """Keep syncs from moving ``project``'s checkout for the duration of the block.
+
+    Analyses read HEAD and scan the tree inside it, so the commit they record
+    matches the files they saw. Readers share the lock; local sources are
+    never synced and are not locked.
+    """
+    if SourceType(project.source_type) != SourceType.GIT:
+        yield
+        return
+    async with async_file_lock(checkout_lock_path(source_path), shared=True):
+        yield
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+"""Process-wide cache of indexed project trees."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import uuid
+
+from app.analysis.structure.tree import TreeIndex
+from app.core.settings import PROJECT_TREE_CACHE_SIZE, PROJECT_TREE_CACHE_TTL_SECONDS
+from app.shared.cache.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True)
+class CachedProjectTree:
+    """Tree index of a project source at one version."""
+
+    version: str
+    config_key: str
+    index: TreeIndex
+    commit_hash: str | None = None
+
+    def etag(self, *variant: object) -> str:
+        """Return a strong ETag for one rendering of this tree."""
+        digest = hashlib.sha1(f"{self.config_key}:{self.version}".encode("utf-8"))
+        for part in variant:
+            digest.update(b"\0")
+            digest.update(str(part).encode("utf-8"))
+        return f'"{digest.hexdigest()}"'
+
+
+class ProjectTreeCache:
+    """Bounded TTL cache of project tree indexes keyed by project id.
+
+    Entries are only reused while their version (HEAD commit, or root mtime for
+    local sources) matches; the TTL bounds how long changes below the root of a
+    local source can go unnoticed.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self._entries: TTLCache[CachedProjectTree] = TTLCache(
+            maxsize=maxsize, ttl_seconds=ttl_seconds
+        )
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def get(self, project_id: uuid.UUID) -> CachedProjectTree | None:
+        """Return the cached tree for ``project_id`` or None."""
+        return self._entries.get(project_id)
+
+    def set(self, project_id: uuid.UUID, tree: CachedProjectTree) -> None:
+        """Cache ``tree`` for ``project_id``."""
+        self._entries.set(project_id, tree)
+
+    def invalidate(self, project_id: uuid.UUID) -> None:
+        """Drop the cached tree for ``project_id``."""
+        self._entries.pop(project_id)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and incremental refresh counters and the current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "size": len(self._entries),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_project_tree_cache() -> ProjectTreeCache:
+    """Return the process-wide project tree cache."""
+    return ProjectTreeCache(
+        maxsize=PROJECT_TREE_CACHE_SIZE, ttl_seconds=PROJECT_TREE_CACHE_TTL_SECONDS
+    )
@@ -2,19 +2,38 @@ from __future__ import annotations
 
 """Project tree domain services."""
 
-from app.analysis.structure.tree import build_project_tree
+from itertools import islice
+import logging
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator
+
+from app.analysis.structure.tree import TreeIndex
+from app.domains.analysis.services.analysis_rule_cache import active_ignored_directories
+from app.domains.analysis.services.incremental import scan_config_key
 from app.domains.analysis.repository.analysis_ignored_directory_repository import (
     AnalysisIgnoredDirectoryRepository,
 )
 from app.domains.projects.services.project_service import ProjectService
-from app.infrastructure.external.source.orchestartor import prepare_source
+from app.domains.projects.services.project_source import resolve_project_source
+from app.domains.projects.services.project_tree_cache import (
+    CachedProjectTree,
+    get_project_tree_cache,
+)
+from app.infrastructure.external.git.commits import get_head_commit
+from app.infrastructure.external.git.diff import diff_name_status
+from app.shared.concurrency.executor import run_analysis, run_blocking
 from app.domains.projects.models.source_type import SourceType
 import uuid
 
+# Nodes pulled from the directory walk per executor hop while streaming.
+_STREAM_BATCH_SIZE = 500
+
 
 class ProjectTreeService:
     """Application logic for project tree retrieval."""
 
+    logger = logging.getLogger(__name__)
+
     def __init__(
         self,
         project_service: ProjectService,
@@ -23,19 +42,111 @@ class ProjectTreeService:
         self.project_service = project_service
         self.ignored_directory_repository = ignored_directory_repository
 
-    async def get_project_tree(self, project_id: uuid.UUID):
-        """Return the tree for a project."""
+    async def get_project_tree(
+        self,
+        project_id: uuid.UUID,
+        path: str = ".",
+        depth: int | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the tree for a project, optionally below ``path`` and to ``depth``."""
+        tree = await self.get_tree(project_id)
+        if tree is None:
+            return None
+        return await self.render_tree(tree, path=path, depth=depth)
+
+    async def get_tree(self, project_id: uuid.UUID) -> CachedProjectTree | None:
+        """Return the indexed tree of a project's current source.
+
+        The index is reused while the HEAD commit (or the root mtime of a local
+        source) is unchanged. After a new commit only the directories whose
+        entries were added or removed are listed again.
+        """
         project = await self.project_service.get_project(project_id)
         if not project:
             return None
 
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=False,
+        source_type = SourceType(project.source_type)
+        source_path = await resolve_project_source(project)
+        ignored_directories = await active_ignored_directories(
+            self.ignored_directory_repository
         )
-        ignored_directories = await self.ignored_directory_repository.list_active()
-        return build_project_tree(
-            source_path, ignored_directories={entry.name for entry in ignored_directories}
+        config_key = scan_config_key(ignored_directories)
+        commit_hash, version = await run_blocking(
+            _source_version, source_path, source_type
         )
+
+        cache = get_project_tree_cache()
+        cached = cache.get(project.id)
+        if cached is not None and cached.config_key != config_key:
+            cached = None
+        if cached is not None and cached.version == version:
+            cache.hits += 1
+            return cached
+
+        index = None
+        if cached is not None and cached.commit_hash and commit_hash:
+            changes = await run_blocking(
+                diff_name_status, source_path, cached.commit_hash, commit_hash
+            )
+            if changes is not None:
+                changed = changes.added | changes.deleted
+                self.logger.info(
+                    "Refreshing project tree incrementally project_id=%s changed_files=%s",
+                    project.id,
+                    len(changed),
+                )
+                index = await run_analysis(cached.index.refresh, changed)
+                cache.refreshes += 1
+        if index is None:
+            cache.misses += 1
+            index = await run_analysis(TreeIndex.scan, source_path, ignored_directories)
+
+        tree = CachedProjectTree(
+            version=version,
+            config_key=config_key,
+            index=index,
+            commit_hash=commit_hash,
+        )
+        cache.set(project.id, tree)
+        return tree
+
+    async def render_tree(
+        self,
+        tree: CachedProjectTree,
+        path: str = ".",
+        depth: int | None = None,
+    ) -> dict[str, Any]:
+        """Return the nested tree below ``path`` to ``depth``."""
+        return await run_analysis(tree.index.build, path, depth)
+
+    async def stream_tree(
+        self,
+        tree: CachedProjectTree,
+        path: str = ".",
+        depth: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Return an async iterator of flat tree nodes below ``path``.
+
+        The start path is validated up front; nodes are produced in batches
+        on the blocking executor as the consumer reads.
+        """
+        return _stream_nodes(tree.index.iter_nodes(path, depth))
+
+
+def _source_version(source_path: Path, source_type: SourceType) -> tuple[str | None, str]:
+    if source_type == SourceType.GIT:
+        commit_hash = get_head_commit(source_path)
+        if commit_hash:
+            return commit_hash, f"commit:{commit_hash}"
+    return None, f"mtime:{source_path.stat().st_mtime_ns}"
+
+
+async def _stream_nodes(
+    nodes: Iterator[dict[str, Any]],
+) -> AsyncIterator[dict[str, Any]]:
+    while True:
+        batch = await run_blocking(list, islice(nodes, _STREAM_BATCH_SIZE))
+        if not batch:
+            return
+        for node in batch:
+            yield node
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+"""Compiled signal rules shared by the framework and infrastructure detectors."""
+
+from dataclasses import dataclass
+import fnmatch
+from functools import lru_cache
+import re
+from typing import Iterable, Mapping
+
+GLOB_SIGNAL = "glob"
+_WILDCARDS = re.compile(r"[*?\[]")
+
+# (target, signal_type, signal_value, weight)
+RuleKey = tuple[str, str, str, int]
+# (rule position, target, weight)
+_Entry = tuple[int, str, int]
+
+
+@dataclass(frozen=True)
+class _GlobRule:
+    value: str
+    regex: re.Pattern[str]
+
+
+class GlobMatcher:
+    """Match many ``fnmatch`` patterns against many paths without a rule-by-path scan.
+
+    Patterns without wildcards are looked up in the target set. The others are
+    bucketed by their literal tail (``*.tf``) or head (``docker-compose*``), so
+    each target only checks the patterns that can possibly match it. Patterns
+    with wildcards at both ends are located by their longest literal run.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._literals: set[str] = set()
+        self._by_suffix: dict[str, list[_GlobRule]] = {}
+        self._by_prefix: dict[str, list[_GlobRule]] = {}
+        self._floating: list[_GlobRule] = []
+        for pattern in dict.fromkeys(patterns):
+            wildcards = list(_WILDCARDS.finditer(pattern))
+            if not wildcards:
+                self._literals.add(pattern)
+                continue
+            rule = _GlobRule(pattern, re.compile(fnmatch.translate(pattern)))
+            tail = pattern[wildcards[-1].end() :]
+            head = pattern[: wildcards[0].start()]
+            if tail and "]" not in tail:
+                self._by_suffix.setdefault(tail, []).append(rule)
+            elif head:
+                self._by_prefix.setdefault(head, []).append(rule)
+            else:
+                self._floating.append(rule)
+        self._suffix_lengths = sorted({len(key) for key in self._by_suffix})
+        self._prefix_lengths = sorted({len(key) for key in self._by_prefix})
+
+    def __len__(self) -> int:
+        return (
+            len(self._literals)
+            + sum(len(rules) for rules in self._by_suffix.values())
+            + sum(len(rules) for rules in self._by_prefix.values())
+            + len(self._floating)
+        )
+
+    def matches(self, targets: set[str]) -> set[str]:
+        """Return the patterns that match at least one of ``targets``."""
+        matched = self._literals & targets
+        if self._by_suffix or self._by_prefix:
+            for target in targets:
+                for length in self._suffix_lengths:
+                    _match_bucket(self._by_suffix.get(target[-length:]), target, matched)
+                for length in self._prefix_lengths:
+                    _match_bucket(self._by_prefix.get(target[:length]), target, matched)
+        if self._floating:
+            _match_floating(self._floating, targets, matched)
+        return matched
+
+
+def _match_floating(
+    rules: list[_GlobRule], targets: set[str], matched: set[str]
+) -> None:
+    # Paths cannot contain NUL, so one joined string lets str.find locate the
+    # literal part of each pattern; only the paths around a hit are regex-checked.
+    joined = "\0".join(targets)
+    for rule in rules:
+        literal = _longest_literal(rule.value)
+        if not literal:
+            if any(rule.regex.match(target) for target in targets):
+                matched.add(rule.value)
+            continue
+        position = joined.find(literal)
+        while position != -1:
+            begin = joined.rfind("\0", 0, position) + 1
+            end = joined.find("\0", position)
+            if end == -1:
+                end = len(joined)
+            if rule.regex.match(joined[begin:end]):
+                matched.add(rule.value)
+                break
+            position = joined.find(literal, end)
+
+
+def _longest_literal(pattern: str) -> str:
+    if "[" in pattern:
+        return ""
+    return max(re.split(r"[*?]", pattern), key=len)
+
+
+def _match_bucket(
+    bucket: list[_GlobRule] | None, target: str, matched: set[str]
+) -> None:
+    if not bucket:
+        return
+    for rule in bucket:
+        if rule.value not in matched and rule.regex.match(target):
+            matched.add(rule.value)
+
+
+class CompiledRuleSet:
+    """Signal rules indexed by signal type and normalized value."""
+
+    def __init__(self, rules: Iterable[RuleKey]) -> None:
+        self._exact: dict[str, dict[str, list[_Entry]]] = {}
+        self._globs: dict[str, list[_Entry]] = {}
+        for position, (target, signal_type, signal_value, weight) in enumerate(rules):
+            entry = (position, target, weight)
+            value = signal_value.lower().strip()
+            if not value:
+                continue
+            if signal_type == GLOB_SIGNAL:
+                self._globs.setdefault(value, []).append(entry)
+            else:
+                self._exact.setdefault(signal_type, {}).setdefault(value, []).append(
+                    entry
+                )
+        self._glob_matcher = GlobMatcher(self._globs)
+
+    def score(
+        self,
+        signals: Mapping[str, set[str]],
+        glob_targets: set[str] | None = None,
+    ) -> dict[str, int]:
+        """Return the summed weight of every matching rule per target.
+
+        Targets are ordered by their first matching rule, as a rule-by-rule
+        scan would order them.
+        """
+        matched: list[_Entry] = []
+        for signal_type, by_value in self._exact.items():
+            observed = signals.get(signal_type)
+            if not observed:
+                continue
+            if len(observed) < len(by_value):
+                hits = [by_value[value] for value in observed if value in by_value]
+            else:
+                hits = [rules for value, rules in by_value.items() if value in observed]
+            for entries in hits:
+                matched.extend(entries)
+        if glob_targets and self._globs:
+            for pattern in self._glob_matcher.matches(glob_targets):
+                matched.extend(self._globs[pattern])
+        scores: dict[str, int] = {}
+        for _position, target, weight in sorted(matched):
+            scores[target] = scores.get(target, 0) + weight
+        return scores
+
+
+@lru_cache(maxsize=8)
+def compile_rule_set(rules: tuple[RuleKey, ...]) -> CompiledRuleSet:
+    """Return the compiled rule set for ``rules``, reusing it while they are unchanged."""
+    return CompiledRuleSet(rules)
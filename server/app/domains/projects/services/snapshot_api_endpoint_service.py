@@ -9,6 +9,7 @@ from app.infrastructure.persistence.postgres.analysis.entities.api_endpoint impo
 from app.domains.analysis.repository.api_endpoint_repository import (
     ApiEndpointRepository,
 )
+from app.shared.pagination.keyset import KeysetPosition
 
 
 class SnapshotApiEndpointService:
@@ -18,7 +19,7 @@ class SnapshotApiEndpointService:
         self.api_endpoint_repository = api_endpoint_repository
 
     async def create_snapshot_api_endpoints(
-        self, endpoints: list[ApiEndpointCreate]
+        self, endpoints: list[ApiEndpointCreate], commit: bool = True
     ) -> list[ApiEndpoint]:
         """Create API endpoint entries for a snapshot."""
         entries = [
@@ -36,7 +37,7 @@ class SnapshotApiEndpointService:
         ]
         if not entries:
             return []
-        return await self.api_endpoint_repository.create_many(entries)
+        return await self.api_endpoint_repository.create_many(entries, commit=commit)
 
     async def get_snapshot_api_endpoints(
         self, snapshot_id: uuid.UUID
@@ -50,20 +51,28 @@ class SnapshotApiEndpointService:
         limit: int = 100,
         offset: int = 0,
         http_method: str | None = None,
+        after: KeysetPosition | None = None,
+        snapshot_id: uuid.UUID | None = None,
     ) -> list[ApiEndpoint]:
-        """Return API endpoints for a project."""
+        """Return API endpoints for a project, optionally from a single snapshot."""
         return await self.api_endpoint_repository.list_by_project(
             project_id=project_id,
             limit=limit,
             offset=offset,
             http_method=http_method,
+            after=after,
+            snapshot_id=snapshot_id,
         )
 
     async def count_project_api_endpoints(
-        self, project_id: uuid.UUID, http_method: str | None = None
+        self,
+        project_id: uuid.UUID,
+        http_method: str | None = None,
+        snapshot_id: uuid.UUID | None = None,
     ) -> int:
-        """Count API endpoints for a project."""
+        """Count API endpoints for a project, optionally from a single snapshot."""
         return await self.api_endpoint_repository.count_by_project(
             project_id=project_id,
             http_method=http_method,
+            snapshot_id=snapshot_id,
         )
@@ -17,7 +17,10 @@ class SnapshotFrameworkService:
         self.snapshot_framework_repository = snapshot_framework_repository
 
     async def create_snapshot_frameworks(
-        self, snapshot_id: uuid.UUID, frameworks: dict[str, float]
+        self,
+        snapshot_id: uuid.UUID,
+        frameworks: dict[str, float],
+        commit: bool = True,
     ) -> list[SnapshotFramework]:
         """Create snapshot framework entries for detected frameworks."""
         entries = [
@@ -30,7 +33,9 @@ class SnapshotFrameworkService:
         ]
         if not entries:
             return []
-        return await self.snapshot_framework_repository.create_many(entries)
+        return await self.snapshot_framework_repository.create_many(
+            entries, commit=commit
+        )
 
     async def get_snapshot_frameworks(
         self, snapshot_id: uuid.UUID
@@ -25,7 +25,10 @@ class SnapshotInfrastructureService:
         self.snapshot_infrastructure_repository = snapshot_infrastructure_repository
 
     async def create_snapshot_infrastructure(
-        self, snapshot_id: uuid.UUID, components: list[str]
+        self,
+        snapshot_id: uuid.UUID,
+        components: list[str],
+        commit: bool = True,
     ) -> list[SnapshotInfrastructure]:
         """Create snapshot infrastructure entries for detected components."""
         self.logger.info(
@@ -43,7 +46,9 @@ class SnapshotInfrastructureService:
         if not entries:
             self.logger.debug("No infrastructure components to persist")
             return []
-        return await self.snapshot_infrastructure_repository.create_many(entries)
+        return await self.snapshot_infrastructure_repository.create_many(
+            entries, commit=commit
+        )
 
     async def get_snapshot_infrastructure(
         self, snapshot_id: uuid.UUID
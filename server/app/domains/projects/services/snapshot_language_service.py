@@ -17,7 +17,10 @@ class SnapshotLanguageService:
         self.snapshot_language_repository = snapshot_language_repository
 
     async def create_snapshot_languages(
-        self, snapshot_id: uuid.UUID, languages: dict[str, int]
+        self,
+        snapshot_id: uuid.UUID,
+        languages: dict[str, int],
+        commit: bool = True,
     ) -> list[SnapshotLanguage]:
         """Create snapshot language entries for detected languages."""
         entries = [
@@ -30,7 +33,9 @@ class SnapshotLanguageService:
         ]
         if not entries:
             return []
-        return await self.snapshot_language_repository.create_many(entries)
+        return await self.snapshot_language_repository.create_many(
+            entries, commit=commit
+        )
 
     async def get_snapshot_languages(
         self, snapshot_id: uuid.UUID
@@ -20,7 +20,7 @@ class SnapshotProjectDependencyService:
         self.project_dependency_repository = project_dependency_repository
 
     async def create_snapshot_dependencies(
-        self, dependencies: list[ProjectDependencyCreate]
+        self, dependencies: list[ProjectDependencyCreate], commit: bool = True
     ) -> list[ProjectDependency]:
         """Create dependency entries for a snapshot."""
         entries = [
@@ -36,7 +36,9 @@ class SnapshotProjectDependencyService:
         ]
         if not entries:
             return []
-        return await self.project_dependency_repository.create_many(entries)
+        return await self.project_dependency_repository.create_many(
+            entries, commit=commit
+        )
 
     async def get_snapshot_dependencies(
         self, snapshot_id: uuid.UUID
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+"""Snapshot retention selection."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
+import uuid
+
+from app.domains.projects.models.retention import RetentionPolicy
+
+
+def select_expired_snapshots(
+    snapshots: Sequence[tuple[uuid.UUID, datetime]],
+    policy: RetentionPolicy,
+    now: datetime,
+) -> list[uuid.UUID]:
+    """Return ids of ``(id, created_at)`` snapshots that no policy rule keeps."""
+    ordered = sorted(snapshots, key=lambda snapshot: snapshot[1], reverse=True)
+    keep = {snapshot_id for snapshot_id, _ in ordered[: max(policy.keep_last, 1)]}
+
+    daily_since = now - timedelta(days=policy.keep_daily_days)
+    weekly_since = (
+        None
+        if policy.keep_weekly_weeks is None
+        else now - timedelta(weeks=policy.keep_weekly_weeks)
+    )
+    seen_days: set[object] = set()
+    seen_weeks: set[object] = set()
+    for snapshot_id, created_at in ordered:
+        moment = created_at.astimezone(timezone.utc)
+        if policy.keep_daily_days > 0 and created_at >= daily_since:
+            day = moment.date()
+            if day not in seen_days:
+                seen_days.add(day)
+                keep.add(snapshot_id)
+        if policy.keep_weekly_weeks != 0 and (
+            weekly_since is None or created_at >= weekly_since
+        ):
+            week = moment.isocalendar()[:2]
+            if week not in seen_weeks:
+                seen_weeks.add(week)
+                keep.add(snapshot_id)
+
+    return [snapshot_id for snapshot_id, _ in ordered if snapshot_id not in keep]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+"""Snapshot retention application service."""
+
+from datetime import datetime, timezone
+import logging
+
+from app.domains.projects.models.retention import RetentionPolicy, RetentionReport
+from app.domains.projects.repository.snapshot_retention_repository import (
+    SnapshotRetentionRepository,
+)
+from app.domains.projects.services.snapshot_retention import select_expired_snapshots
+
+
+class SnapshotRetentionService:
+    """Delete snapshots that a retention policy no longer keeps."""
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        retention_repository: SnapshotRetentionRepository,
+        policy: RetentionPolicy,
+        batch_size: int = 200,
+    ) -> None:
+        self.retention_repository = retention_repository
+        self.policy = policy
+        self.batch_size = max(batch_size, 1)
+
+    async def apply(self, now: datetime | None = None) -> RetentionReport:
+        """Prune every project and analysis type, one committed batch at a time."""
+        now = now or datetime.now(timezone.utc)
+        report = RetentionReport()
+        for project_id, analysis_type in await self.retention_repository.list_series():
+            report.series_scanned += 1
+            snapshots = await self.retention_repository.list_series_snapshots(
+                project_id, analysis_type
+            )
+            expired = select_expired_snapshots(snapshots, self.policy, now)
+            for start in range(0, len(expired), self.batch_size):
+                rows_deleted = await self.retention_repository.delete_snapshots(
+                    expired[start : start + self.batch_size]
+                )
+                report.snapshots_deleted += rows_deleted.get("snapshots", 0)
+                report.add_rows(rows_deleted)
+            if expired:
+                self.logger.info(
+                    "Pruned snapshots project_id=%s analysis_type=%s deleted=%s kept=%s",
+                    project_id,
+                    analysis_type,
+                    len(expired),
+                    len(snapshots) - len(expired),
+                )
+        return report
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+"""Background task that periodically applies snapshot retention."""
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domains.projects.models.retention import RetentionPolicy, RetentionReport
+from app.domains.projects.repository.snapshot_retention_repository import (
+    SnapshotRetentionRepository,
+)
+from app.domains.projects.services.snapshot_retention_service import (
+    SnapshotRetentionService,
+)
+
+
+class SnapshotRetentionWorker:
+    """Run snapshot retention every ``interval`` seconds and keep running totals."""
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        policy: RetentionPolicy,
+        batch_size: int,
+        interval: float,
+    ) -> None:
+        self.session_factory = session_factory
+        self.policy = policy
+        self.batch_size = batch_size
+        self.interval = interval
+        self.totals = RetentionReport()
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start the retention loop unless it is disabled."""
+        if self.interval <= 0:
+            self.logger.info("Snapshot retention disabled")
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="snapshot-retention")
+        self.logger.info(
+            "Started snapshot retention interval=%s policy=%s", self.interval, self.policy
+        )
+
+    async def stop(self) -> None:
+        """Stop the retention loop; an interrupted batch is rolled back."""
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_once(self) -> RetentionReport:
+        """Apply the policy once and add the result to the running totals."""
+        async with self.session_factory() as session:
+            report = await SnapshotRetentionService(
+                SnapshotRetentionRepository(session),
+                policy=self.policy,
+                batch_size=self.batch_size,
+            ).apply()
+        self.totals.series_scanned += report.series_scanned
+        self.totals.snapshots_deleted += report.snapshots_deleted
+        self.totals.add_rows(report.rows_deleted)
+        self.logger.info(
+            "Snapshot retention finished series=%s snapshots_deleted=%s rows_deleted=%s "
+            "total_snapshots_deleted=%s",
+            report.series_scanned,
+            report.snapshots_deleted,
+            report.rows_deleted,
+            self.totals.snapshots_deleted,
+        )
+        return report
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.run_once()
+            except Exception:
+                self.logger.exception("Snapshot retention run failed")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
@@ -2,20 +2,31 @@ from __future__ import annotations
 
 """Snapshot domain services."""
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 import logging
 import uuid
-from typing import Any
+from typing import Any, AsyncIterator, Sequence
 
 from app.domains.projects.models.dto.snapshot import (
+    ProjectLatestSnapshots,
     SnapshotPage,
     SnapshotPageNoSummary,
+    SnapshotProjection,
+    SnapshotProjectionPage,
     SnapshotPublic,
     SnapshotPublicNoSummary,
 )
 from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.infrastructure.persistence.postgres.projects.entities.snapshot_observation import (
+    SnapshotObservation,
+)
 from app.domains.projects.repository.snapshot_repository import SnapshotRepository
 from app.domains.projects.services.project_service import ProjectService
+from app.shared.pagination.keyset import cached_total, decode_cursor, encode_cursor
+
+
+SNAPSHOT_FIELDS = tuple(SnapshotProjection.model_fields)
 
 
 class SnapshotService:
@@ -37,11 +48,19 @@ class SnapshotService:
         summary_json: dict[str, Any],
         analysis_type: str = "generic",
         commit_hash: str | None = None,
+        commit: bool = True,
+        fingerprint: str | None = None,
+        project_checked: bool = False,
     ) -> Snapshot:
-        """Create a snapshot for an existing project."""
+        """Create a snapshot for an existing project.
+
+        Callers that have already loaded the project pass ``project_checked``
+        to skip looking it up again.
+        """
         self.logger.info("Creating snapshot project_id=%s", project_id)
-        project = await self.project_service.get_project(project_id)
-        if not project:
+        if not project_checked and not await self.project_service.get_project(
+            project_id
+        ):
             raise ValueError("project not found")
 
         snapshot = Snapshot(
@@ -49,9 +68,70 @@ class SnapshotService:
             analysis_type=analysis_type,
             commit_hash=commit_hash,
             summary_json=summary_json,
+            fingerprint=fingerprint,
             created_at=datetime.now(timezone.utc),
         )
-        return await self.snapshot_repository.create(snapshot)
+        return await self.snapshot_repository.create(snapshot, commit=commit)
+
+    async def observe_unchanged(
+        self,
+        project_id: uuid.UUID,
+        analysis_type: str,
+        fingerprint: str,
+        commit_hash: str | None = None,
+        commit: bool = True,
+    ) -> Snapshot | None:
+        """Return the latest snapshot if it already holds this result.
+
+        A match is recorded as an observation of that snapshot instead of a new
+        snapshot with a copy of its rows. Returns None when the result differs
+        and a new snapshot has to be written.
+        """
+        latest = await self.get_latest_snapshot(project_id, analysis_type=analysis_type)
+        if latest is None or latest.fingerprint != fingerprint:
+            return None
+        self.logger.info(
+            "Snapshot result unchanged project_id=%s analysis_type=%s snapshot_id=%s",
+            project_id,
+            analysis_type,
+            latest.id,
+        )
+        await self.snapshot_repository.create_observation(
+            SnapshotObservation(
+                snapshot_id=latest.id,
+                commit_hash=commit_hash,
+                observed_at=datetime.now(timezone.utc),
+            ),
+            commit=commit,
+        )
+        return latest
+
+    @asynccontextmanager
+    async def unit_of_work(self, commit: bool = True) -> AsyncIterator[None]:
+        """Group a snapshot and its rows into one transaction.
+
+        Writes staged inside the block with ``commit=False`` are flushed and
+        committed together when it exits, or rolled back if it raises, so
+        readers never see a snapshot without its rows. With ``commit=False``
+        the writes are left pending for an enclosing unit of work.
+        """
+        if not commit:
+            yield
+            return
+        try:
+            yield
+        except Exception:
+            await self.rollback()
+            raise
+        await self.commit()
+
+    async def commit(self) -> None:
+        """Commit snapshots created with ``commit=False``."""
+        await self.snapshot_repository.commit()
+
+    async def rollback(self) -> None:
+        """Discard snapshots created with ``commit=False``."""
+        await self.snapshot_repository.rollback()
 
     async def get_latest_snapshot(
         self, project_id: uuid.UUID, analysis_type: str | None = None
@@ -64,6 +144,43 @@ class SnapshotService:
             )
         return await self.snapshot_repository.get_latest_by_project(project_id)
 
+    async def get_project_snapshot(
+        self, project_id: uuid.UUID, snapshot_id: uuid.UUID
+    ) -> Snapshot | None:
+        """Return a snapshot only if it belongs to the given project."""
+        snapshot = await self.snapshot_repository.get_by_id(snapshot_id)
+        if snapshot is None or snapshot.project_id != project_id:
+            return None
+        return snapshot
+
+    async def get_latest_snapshots(
+        self,
+        project_ids: list[uuid.UUID],
+        analysis_types: list[str] | None = None,
+    ) -> list[ProjectLatestSnapshots]:
+        """Return the latest snapshot per analysis type for each requested project."""
+        self.logger.info("Loading latest snapshots projects=%s", len(project_ids))
+        snapshots = await self.snapshot_repository.list_latest_by_projects(
+            project_ids=project_ids,
+            analysis_types=analysis_types,
+        )
+        by_project: dict[uuid.UUID, dict[str, SnapshotPublic]] = {
+            project_id: {} for project_id in project_ids
+        }
+        for snapshot in snapshots:
+            by_project[snapshot.project_id][snapshot.analysis_type] = SnapshotPublic(
+                id=snapshot.id,
+                project_id=snapshot.project_id,
+                analysis_type=snapshot.analysis_type,
+                commit_hash=snapshot.commit_hash,
+                summary_json=snapshot.summary_json,
+                created_at=snapshot.created_at,
+            )
+        return [
+            ProjectLatestSnapshots(project_id=project_id, snapshots=latest)
+            for project_id, latest in by_project.items()
+        ]
+
     async def list_snapshots(
         self,
         project_id: uuid.UUID,
@@ -71,25 +188,47 @@ class SnapshotService:
         offset: int = 0,
         start_at: datetime | None = None,
         end_at: datetime | None = None,
-    ) -> SnapshotPage | None:
-        """List snapshots for a project with pagination and date filters."""
+        cursor: str | None = None,
+        include_total: bool = True,
+        fields: Sequence[str] | None = None,
+    ) -> SnapshotPage | SnapshotProjectionPage | None:
+        """List snapshots for a project with pagination and date filters.
+
+        When ``fields`` is given, items only carry those fields and the summary
+        JSON is read from the database only if it is one of them.
+        """
         self.logger.info("Listing snapshots project_id=%s", project_id)
+        if fields is not None:
+            unknown = sorted(set(fields) - set(SNAPSHOT_FIELDS))
+            if unknown:
+                raise ValueError(f"unknown snapshot fields: {', '.join(unknown)}")
         project = await self.project_service.get_project(project_id)
         if not project:
             return None
 
-        snapshots = await self.snapshot_repository.list_by_project(
-            project_id=project_id,
-            limit=limit,
-            offset=offset,
-            start_at=start_at,
-            end_at=end_at,
-        )
-        total = await self.snapshot_repository.count_by_project(
-            project_id=project_id,
-            start_at=start_at,
-            end_at=end_at,
+        snapshots, total, next_cursor = await self._page_snapshots(
+            project_id,
+            limit,
+            offset,
+            start_at,
+            end_at,
+            cursor,
+            include_total,
+            include_summary=fields is None or "summary_json" in fields,
         )
+        if fields is not None:
+            return SnapshotProjectionPage(
+                items=[
+                    SnapshotProjection(
+                        **{field: getattr(snapshot, field) for field in fields}
+                    )
+                    for snapshot in snapshots
+                ],
+                total=total,
+                limit=limit,
+                offset=offset,
+                next_cursor=next_cursor,
+            )
         items = [
             SnapshotPublic(
                 id=snapshot.id,
@@ -101,7 +240,13 @@ class SnapshotService:
             )
             for snapshot in snapshots
         ]
-        return SnapshotPage(items=items, total=total, limit=limit, offset=offset)
+        return SnapshotPage(
+            items=items,
+            total=total,
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+        )
 
     async def list_snapshots_without_summary(
         self,
@@ -110,6 +255,8 @@ class SnapshotService:
         offset: int = 0,
         start_at: datetime | None = None,
         end_at: datetime | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> SnapshotPageNoSummary | None:
         """List snapshots without summary for a project with pagination and date filters."""
         self.logger.info("Listing snapshots (no summary) project_id=%s", project_id)
@@ -117,17 +264,15 @@ class SnapshotService:
         if not project:
             return None
 
-        snapshots = await self.snapshot_repository.list_by_project(
-            project_id=project_id,
-            limit=limit,
-            offset=offset,
-            start_at=start_at,
-            end_at=end_at,
-        )
-        total = await self.snapshot_repository.count_by_project(
-            project_id=project_id,
-            start_at=start_at,
-            end_at=end_at,
+        snapshots, total, next_cursor = await self._page_snapshots(
+            project_id,
+            limit,
+            offset,
+            start_at,
+            end_at,
+            cursor,
+            include_total,
+            include_summary=False,
         )
         items = [
             SnapshotPublicNoSummary(
@@ -140,5 +285,45 @@ class SnapshotService:
             for snapshot in snapshots
         ]
         return SnapshotPageNoSummary(
-            items=items, total=total, limit=limit, offset=offset
+            items=items,
+            total=total,
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
         )
+
+    async def _page_snapshots(
+        self,
+        project_id: uuid.UUID,
+        limit: int,
+        offset: int,
+        start_at: datetime | None,
+        end_at: datetime | None,
+        cursor: str | None,
+        include_total: bool,
+        include_summary: bool = True,
+    ) -> tuple[list[Snapshot], int | None, str | None]:
+        snapshots = await self.snapshot_repository.list_by_project(
+            project_id=project_id,
+            limit=limit + 1,
+            offset=offset,
+            start_at=start_at,
+            end_at=end_at,
+            after=decode_cursor(cursor) if cursor else None,
+            include_summary=include_summary,
+        )
+        next_cursor = None
+        if len(snapshots) > limit:
+            snapshots = snapshots[:limit]
+            next_cursor = encode_cursor(snapshots[-1].created_at, snapshots[-1].id)
+        total = None
+        if include_total:
+            total = await cached_total(
+                ("snapshots", project_id, start_at, end_at),
+                lambda: self.snapshot_repository.count_by_project(
+                    project_id=project_id,
+                    start_at=start_at,
+                    end_at=end_at,
+                ),
+            )
+        return snapshots, total, next_cursor
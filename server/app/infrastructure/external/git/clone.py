@@ -1,15 +1,56 @@
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
 import hashlib
+import os
+import shutil
 import subprocess
+import tempfile
 import uuid
 from pathlib import Path
 
 from app.core.settings import IRAOBSERVER_REPOS_DIR
+from app.shared.concurrency.file_lock import file_lock
+
+
+@dataclass(frozen=True)
+class CloneOptions:
+    """How much history and content ``git clone`` fetches.
+
+    ``depth`` makes a shallow clone and ``blobless`` defers file contents until
+    they are checked out. ``sparse_paths`` limits the checkout to those
+    directories plus the files at the repository root.
+    """
+
+    depth: int | None = None
+    blobless: bool = False
+    single_branch: bool = False
+    branch: str | None = None
+    sparse_paths: tuple[str, ...] = ()
+
+    def arguments(self) -> list[str]:
+        """Return the ``git clone`` flags for these options."""
+        arguments: list[str] = []
+        if self.depth:
+            arguments += ["--depth", str(self.depth)]
+            # --depth implies --single-branch unless told otherwise.
+            if not self.single_branch:
+                arguments.append("--no-single-branch")
+        if self.blobless:
+            arguments.append("--filter=blob:none")
+        if self.single_branch:
+            arguments.append("--single-branch")
+        if self.branch:
+            arguments += ["--branch", self.branch]
+        if self.sparse_paths:
+            arguments.append("--sparse")
+        return arguments
 
 
 def clone_repository(
     repo_url: str,
     project_id: uuid.UUID | None = None,
     allow_clone: bool = False,
+    options: CloneOptions | None = None,
 ) -> Path:
     # Return deterministic local path, optionally cloning if missing.
     if project_id:
@@ -28,9 +69,48 @@ def clone_repository(
             f"Repository not found at {target_path}. Clone is disabled."
         )
 
-    subprocess.run(
-        ["git", "clone", repo_url, str(target_path)],
-        check=True,
-    )
+    with checkout_lock(target_path):
+        # Another worker may have finished the clone while we waited.
+        if not target_path.exists():
+            _clone_into(repo_url, target_path, options or CloneOptions())
 
     return target_path
+
+
+def checkout_lock(
+    target_path: Path, shared: bool = False
+) -> AbstractContextManager[None]:
+    """Return the cross-process lock guarding clones and syncs of ``target_path``.
+
+    Clones and syncs take it exclusively; readers that must not see the
+    checkout change under them take it ``shared``.
+    """
+    return file_lock(checkout_lock_path(target_path), shared=shared)
+
+
+def checkout_lock_path(target_path: Path) -> Path:
+    """Return the lock file behind ``checkout_lock``."""
+    return target_path.parent / ".locks" / f"{target_path.name}.lock"
+
+
+def _clone_into(repo_url: str, target_path: Path, options: CloneOptions) -> None:
+    # Clone into a staging directory and rename it into place, so a checkout
+    # that exists is always complete even if a clone dies halfway.
+    prefix = f".{target_path.name}.clone-"
+    for leftover in target_path.parent.glob(f"{prefix}*"):
+        shutil.rmtree(leftover, ignore_errors=True)
+    staging = Path(tempfile.mkdtemp(prefix=prefix, dir=target_path.parent))
+    try:
+        subprocess.run(
+            ["git", "clone", *options.arguments(), "--", repo_url, str(staging)],
+            check=True,
+        )
+        if options.sparse_paths:
+            subprocess.run(
+                ["git", "-C", str(staging), "sparse-checkout", "set", *options.sparse_paths],
+                check=True,
+            )
+        os.rename(staging, target_path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
@@ -3,10 +3,14 @@ from __future__ import annotations
 """Git commit helpers."""
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+import logging
 from pathlib import Path
+from typing import AbstractSet, Any
 
-from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -25,25 +29,93 @@ def list_recent_commits(
     since: datetime | None = None,
     until: datetime | None = None,
 ) -> list[GitCommitInfo]:
-    """Return recent commits for a repository path."""
+    """Return recent commits for a repository path.
+
+    A shallow clone is deepened when its history ends before ``limit`` commits
+    (or before ``since``) are found.
+    """
     try:
         repo = Repo(repo_path)
     except (InvalidGitRepositoryError, NoSuchPathError) as exc:
         raise ValueError("git repository not found") from exc
 
-    commits = []
-    kwargs = {"max_count": limit}
+    kwargs: dict[str, Any] = {"max_count": limit}
     if since:
         kwargs["since"] = since
     if until:
         kwargs["until"] = until
-    for commit in repo.iter_commits(**kwargs):
-        commits.append(
-            GitCommitInfo(
-                commit_hash=commit.hexsha,
-                message=commit.message.strip().splitlines()[0] if commit.message else "",
-                author_name=commit.author.name if commit.author else "",
-                authored_at=commit.authored_datetime,
-            )
-        )
+    commits = _collect_commits(repo, kwargs)
+    if len(commits) < limit and _deepen(repo, limit - len(commits), since):
+        commits = _collect_commits(repo, kwargs)
     return commits
+
+
+def _collect_commits(repo: Repo, kwargs: dict[str, Any]) -> list[GitCommitInfo]:
+    return [
+        GitCommitInfo(
+            commit_hash=commit.hexsha,
+            message=commit.message.strip().splitlines()[0] if commit.message else "",
+            author_name=commit.author.name if commit.author else "",
+            authored_at=commit.authored_datetime,
+        )
+        for commit in repo.iter_commits(**kwargs)
+    ]
+
+
+def _deepen(repo: Repo, missing: int, since: datetime | None) -> bool:
+    """Fetch more history into a shallow clone; return whether it was fetched."""
+    shallow_file = Path(repo.git_dir) / "shallow"
+    if not shallow_file.exists():
+        return False
+    if since is not None:
+        cutoff = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+        boundary = [repo.commit(sha) for sha in shallow_file.read_text().split()]
+        if all(commit.committed_datetime < cutoff for commit in boundary):
+            return False
+        arguments = [f"--shallow-since={since.isoformat()}"]
+    else:
+        arguments = [f"--deepen={missing}"]
+    try:
+        repo.git.fetch(*arguments)
+    except GitCommandError as exc:
+        logger.warning("Deepening shallow clone failed path=%s error=%s", repo.working_dir, exc)
+        return False
+    logger.info("Deepened shallow clone path=%s %s", repo.working_dir, arguments[0])
+    return True
+
+
+def get_head_commit(repo_path: Path) -> str | None:
+    """Return the HEAD commit hash, or None when the path is not a git checkout."""
+    try:
+        repo = Repo(repo_path)
+        return repo.head.commit.hexsha
+    except (InvalidGitRepositoryError, NoSuchPathError, ValueError):
+        return None
+
+
+def get_clean_head_commit(
+    repo_path: Path, ignored_directories: AbstractSet[str] = frozenset()
+) -> str | None:
+    """Return the HEAD commit hash only when a scan of the checkout matches it.
+
+    Returns None when files outside ``ignored_directories`` are modified,
+    untracked or gitignored. Those files are part of a scan but not of the
+    commit, so results computed from them must not be recorded under HEAD.
+    """
+    try:
+        repo = Repo(repo_path)
+        head = repo.head.commit.hexsha
+        output = repo.git.status("--porcelain", "-z", "--ignored")
+    except (InvalidGitRepositoryError, NoSuchPathError, GitCommandError, ValueError):
+        return None
+
+    fields = iter(output.split("\0"))
+    for entry in fields:
+        if not entry:
+            continue
+        status, path = entry[:2], entry[3:]
+        if status[0] in "RC":
+            next(fields, None)  # the rename source path follows
+        if not any(part in ignored_directories for part in path.rstrip("/").split("/")):
+            return None
+    return head
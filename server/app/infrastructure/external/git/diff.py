@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+"""Git diff helpers."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Set
+
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
+
+
+@dataclass(frozen=True)
+class GitFileChanges:
+    """Relative POSIX paths changed between two commits."""
+
+    added: frozenset[str]
+    modified: frozenset[str]
+    deleted: frozenset[str]
+
+    @property
+    def touched(self) -> frozenset[str]:
+        """Every path whose previous results are no longer valid."""
+        return self.added | self.modified | self.deleted
+
+    @property
+    def reparse(self) -> frozenset[str]:
+        """Paths that exist at the new commit and must be parsed again."""
+        return self.added | self.modified
+
+    def without_ignored(self, ignored_directories: Set[str]) -> GitFileChanges:
+        """Drop paths located under an ignored directory name."""
+
+        def keep(path: str) -> bool:
+            return not any(part in ignored_directories for part in path.split("/")[:-1])
+
+        return GitFileChanges(
+            added=frozenset(filter(keep, self.added)),
+            modified=frozenset(filter(keep, self.modified)),
+            deleted=frozenset(filter(keep, self.deleted)),
+        )
+
+
+def diff_name_status(
+    repo_path: Path, base_commit: str, head_commit: str
+) -> GitFileChanges | None:
+    """Return files changed from ``base_commit`` to ``head_commit``.
+
+    Returns None when the result would not describe the working tree, e.g. the
+    checkout has local changes, is a sparse checkout (the diff would list paths
+    outside it) or ``base_commit`` is no longer available.
+    """
+    try:
+        repo = Repo(repo_path)
+        if repo.is_dirty(untracked_files=True) or _is_sparse(repo):
+            return None
+        output = repo.git.diff(
+            "--name-status", "--no-renames", "-z", base_commit, head_commit
+        )
+    except (InvalidGitRepositoryError, NoSuchPathError, GitCommandError):
+        return None
+
+    added: set[str] = set()
+    modified: set[str] = set()
+    deleted: set[str] = set()
+    fields = output.split("\0")
+    for position in range(0, len(fields) - 1, 2):
+        status, path = fields[position], fields[position + 1]
+        if status.startswith("A"):
+            added.add(path)
+        elif status.startswith("D"):
+            deleted.add(path)
+        else:
+            modified.add(path)
+    return GitFileChanges(
+        added=frozenset(added),
+        modified=frozenset(modified),
+        deleted=frozenset(deleted),
+    )
+
+
+def _is_sparse(repo: Repo) -> bool:
+    # ``git sparse-checkout`` may store the flag in the per-worktree config,
+    # which GitPython's config reader does not see.
+    try:
+        return repo.git.config("--bool", "core.sparseCheckout") == "true"
+    except GitCommandError:
+        return False
@@ -5,11 +5,11 @@ from __future__ import annotations
 from datetime import datetime
 import uuid
 
-from app.domains.projects.models.source_type import SourceType
 from app.domains.projects.services.project_service import ProjectService
-from app.infrastructure.external.source.orchestartor import prepare_source
+from app.domains.projects.services.project_source import resolve_project_source
 from app.infrastructure.external.git.branches import get_current_branch, list_local_branches
 from app.infrastructure.external.git.commits import GitCommitInfo, list_recent_commits
+from app.shared.concurrency.executor import run_blocking
 
 
 class GitInfoService:
@@ -24,13 +24,8 @@ class GitInfoService:
         if not project:
             return None
 
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=False,
-        )
-        return list_local_branches(source_path)
+        source_path = await resolve_project_source(project)
+        return await run_blocking(list_local_branches, source_path)
 
     async def get_current_branch(self, project_id: uuid.UUID) -> str | None:
         """Return current git branch for a project."""
@@ -38,13 +33,8 @@ class GitInfoService:
         if not project:
             return None
 
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=False,
-        )
-        return get_current_branch(source_path)
+        source_path = await resolve_project_source(project)
+        return await run_blocking(get_current_branch, source_path)
 
     async def list_commits(
         self,
@@ -58,12 +48,7 @@ class GitInfoService:
         if not project:
             return None
 
-        source_path = prepare_source(
-            source_type=SourceType(project.source_type),
-            source_ref=project.source_ref,
-            project_id=project.id,
-            allow_clone=False,
-        )
-        return list_recent_commits(
-            source_path, limit=limit, since=since, until=until
+        source_path = await resolve_project_source(project)
+        return await run_blocking(
+            list_recent_commits, source_path, limit=limit, since=since, until=until
         )
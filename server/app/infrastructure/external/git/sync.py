@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+"""Incremental fetch-and-reset of cloned repositories."""
+
+from contextlib import nullcontext
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import time
+
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
+
+from app.infrastructure.external.git.clone import checkout_lock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GitSyncResult:
+    """Outcome of bringing a checkout up to date with its remote."""
+
+    path: Path
+    ref: str | None
+    head_before: str | None
+    head_after: str | None
+    fetched: bool
+    fetched_bytes: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return self.head_before != self.head_after
+
+
+def sync_repository(
+    repo_path: Path,
+    branch: str | None = None,
+    max_age_seconds: float = 0.0,
+    locked: bool = False,
+) -> GitSyncResult:
+    """Fetch from ``origin`` and reset the checkout to the tracked branch.
+
+    ``branch`` selects the remote branch to track; by default the current
+    branch's upstream (or ``origin/HEAD``) is used. A checkout fetched less
+    than ``max_age_seconds`` ago is left alone. Syncs and clones of the same
+    checkout are serialized across processes, so callers waiting on a sync
+    reuse its result through the age check. When the fetch fails the checkout
+    is left as it was. Pass ``locked`` when the caller already holds the
+    checkout lock exclusively.
+    """
+    try:
+        repo = Repo(repo_path)
+    except (InvalidGitRepositoryError, NoSuchPathError) as exc:
+        raise ValueError("git repository not found") from exc
+
+    with nullcontext() if locked else checkout_lock(Path(repo_path)):
+        head_before = _head(repo)
+        age = time.time() - _last_fetched_at(Path(repo.git_dir))
+        if max_age_seconds > 0 and age < max_age_seconds:
+            return GitSyncResult(repo_path, None, head_before, head_before, fetched=False)
+
+        size_before = _object_bytes(repo)
+        try:
+            if branch:
+                ref = f"origin/{branch}"
+                repo.git.fetch(
+                    "--prune", "origin", f"+refs/heads/{branch}:refs/remotes/{ref}"
+                )
+                repo.git.checkout("--force", "-B", branch, ref)
+            else:
+                repo.git.fetch("--prune", "origin")
+                ref = _upstream(repo)
+                repo.git.reset("--hard", ref)
+            repo.git.clean("-ffd")
+        except GitCommandError as exc:
+            logger.warning("Git sync failed path=%s error=%s", repo_path, exc)
+            return GitSyncResult(repo_path, None, head_before, _head(repo), fetched=False)
+
+        result = GitSyncResult(
+            path=repo_path,
+            ref=ref,
+            head_before=head_before,
+            head_after=_head(repo),
+            fetched=True,
+            fetched_bytes=max(0, _object_bytes(repo) - size_before),
+        )
+    logger.info(
+        "Synced repository path=%s ref=%s changed=%s fetched_bytes=%s",
+        repo_path,
+        result.ref,
+        result.changed,
+        result.fetched_bytes,
+    )
+    return result
+
+
+def _last_fetched_at(git_dir: Path) -> float:
+    # FETCH_HEAD is rewritten by every fetch; the HEAD reflog covers a fresh clone.
+    times = [0.0]
+    for name in ("FETCH_HEAD", "logs/HEAD"):
+        try:
+            times.append((git_dir / name).stat().st_mtime)
+        except OSError:
+            pass
+    return max(times)
+
+
+def _head(repo: Repo) -> str | None:
+    try:
+        return repo.head.commit.hexsha
+    except ValueError:
+        return None
+
+
+def _upstream(repo: Repo) -> str:
+    try:
+        return repo.git.rev_parse("--abbrev-ref", "--symbolic-full-name", "@{upstream}")
+    except GitCommandError:
+        return "origin/HEAD"
+
+
+def _object_bytes(repo: Repo) -> int:
+    """Return the size of the object database as reported by ``git count-objects``."""
+    stats = dict(
+        line.split(": ", 1)
+        for line in repo.git.count_objects("-v").splitlines()
+        if ": " in line
+    )
+    return (int(stats.get("size", 0)) + int(stats.get("size-pack", 0))) * 1024
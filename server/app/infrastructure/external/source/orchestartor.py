@@ -5,7 +5,7 @@ from pathlib import Path
 import uuid
 
 from app.domains.projects.models.source_type import SourceType
-from app.infrastructure.external.git.clone import clone_repository
+from app.infrastructure.external.git.clone import CloneOptions, clone_repository
 
 
 def prepare_source(
@@ -13,6 +13,7 @@ def prepare_source(
     source_ref: str,
     project_id: uuid.UUID | None = None,
     allow_clone: bool = False,
+    clone_options: CloneOptions | None = None,
 ) -> Path:
     """Prepare a source based on type and return a local path."""
     if source_type == SourceType.GIT:
@@ -20,6 +21,7 @@ def prepare_source(
             source_ref,
             project_id=project_id,
             allow_clone=allow_clone,
+            options=clone_options,
         )
     if source_type == SourceType.LOCAL:
         return Path(source_ref)
@@ -12,6 +12,9 @@ from app.infrastructure.persistence.postgres.analysis.entities.analysis_infra_ru
 from app.infrastructure.persistence.postgres.analysis.entities.analysis_language_rule import (
     AnalysisLanguageRule,
 )
+from app.infrastructure.persistence.postgres.analysis.entities.analysis_rules_version import (
+    AnalysisRulesVersion,
+)
 from app.infrastructure.persistence.postgres.analysis.entities.api_endpoint import ApiEndpoint
 from app.infrastructure.persistence.postgres.analysis.entities.snapshot_framework import SnapshotFramework
 from app.infrastructure.persistence.postgres.analysis.entities.snapshot_infrastructure import (
@@ -27,6 +30,7 @@ __all__ = [
     "AnalysisInfraComponent",
     "AnalysisInfraRule",
     "AnalysisLanguageRule",
+    "AnalysisRulesVersion",
     "ApiEndpoint",
     "ProjectDependency",
     "SnapshotFramework",
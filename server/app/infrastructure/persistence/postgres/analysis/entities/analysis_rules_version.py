@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger, Boolean
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class AnalysisRulesVersion(Base):
+    __tablename__ = "analysis_rules_version"  # type: ignore
+
+    id: Mapped[bool] = mapped_column(Boolean, primary_key=True, default=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
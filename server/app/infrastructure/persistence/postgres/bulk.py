@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+"""Bulk persistence helpers for Postgres-backed repositories."""
+
+from typing import Sequence, TypeVar
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+async def insert_returning(
+    session: AsyncSession, model: type[ModelT], entries: Sequence[ModelT]
+) -> list[ModelT]:
+    """Insert entities with multi-row ``INSERT ... RETURNING`` and return loaded rows.
+
+    Unset columns (such as ``created_at``) are left to server defaults. Each
+    page fills the driver's bind parameter limit, so large snapshots take a
+    handful of round trips instead of one refresh per row.
+    """
+    if not entries:
+        return []
+    columns = [column.key for column in model.__table__.columns]  # type: ignore[attr-defined]
+    rows = [
+        {key: entry.__dict__[key] for key in columns if key in entry.__dict__}
+        for entry in entries
+    ]
+    max_parameters = session.bind.dialect.insertmanyvalues_max_parameters
+    page_size = max(max_parameters // max(len(rows[0]), 1), 1)
+    result = await session.scalars(
+        insert(model)
+        .returning(model)
+        .execution_options(insertmanyvalues_page_size=page_size),
+        rows,
+    )
+    return list(result.all())
@@ -0,0 +1,5 @@
+from app.infrastructure.persistence.postgres.jobs.entities.analysis_job import AnalysisJob
+
+__all__ = [
+    "AnalysisJob",
+]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+"""Postgres LISTEN/NOTIFY subscription kept alive in the background."""
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class PostgresListener:
+    """Hold a dedicated connection that LISTENs on ``channel``.
+
+    ``on_notify`` receives each payload. ``on_state`` is called with True once
+    the subscription is live and with False when the connection is lost;
+    notifications sent while disconnected are missed, so callers should treat
+    both transitions as "anything may have changed".
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        channel: str,
+        on_notify: Callable[[str], None],
+        on_state: Callable[[bool], None],
+        keepalive: float = 30.0,
+        retry_delay: float = 5.0,
+    ) -> None:
+        self.engine = engine
+        self.channel = channel
+        self.on_notify = on_notify
+        self.on_state = on_state
+        self.keepalive = keepalive
+        self.retry_delay = retry_delay
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start listening in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._run(), name=f"pg-listen-{self.channel}"
+            )
+
+    async def stop(self) -> None:
+        """Stop listening and release the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception("LISTEN %s failed; retrying", self.channel)
+            finally:
+                self.on_state(False)
+            await asyncio.sleep(self.retry_delay)
+
+    async def _listen(self) -> None:
+        async with self.engine.connect() as connection:
+            raw = await connection.get_raw_connection()
+            driver = raw.driver_connection
+
+            def forward(_connection: Any, _pid: int, _channel: str, payload: str) -> None:
+                self.on_notify(payload)
+
+            await driver.add_listener(self.channel, forward)
+            self.logger.info("Listening on channel=%s", self.channel)
+            self.on_state(True)
+            try:
+                while True:
+                    await asyncio.sleep(self.keepalive)
+                    await driver.execute("SELECT 1")
+            finally:
+                if not driver.is_closed():
+                    await driver.remove_listener(self.channel, forward)
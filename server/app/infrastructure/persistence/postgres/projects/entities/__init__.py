@@ -1,7 +1,15 @@
 from app.infrastructure.persistence.postgres.projects.entities.project import Project
+from app.infrastructure.persistence.postgres.projects.entities.project_latest_snapshot import (
+    ProjectLatestSnapshot,
+)
 from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.infrastructure.persistence.postgres.projects.entities.snapshot_observation import (
+    SnapshotObservation,
+)
 
 __all__ = [
     "Project",
+    "ProjectLatestSnapshot",
     "Snapshot",
+    "SnapshotObservation",
 ]
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from sqlalchemy import Column, DateTime, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import text
 from sqlmodel import Field, SQLModel
 
@@ -31,6 +31,10 @@ class Project(SQLModel, table=True):
     )
     source_type: str = Field(sa_column=Column(Text, nullable=False))
     source_ref: str = Field(sa_column=Column(Text, nullable=False))
+    settings_json: dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+    )
     created_at: datetime = Field(
         sa_column=Column(
             DateTime(timezone=True), nullable=False, server_default=text("now()")
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+"""Latest snapshot pointer persistence model."""
+
+import uuid
+from datetime import datetime
+from typing import ClassVar
+
+from sqlalchemy import Column, DateTime, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlmodel import Field, SQLModel
+
+
+class ProjectLatestSnapshot(SQLModel, table=True):
+    """Database pointer to the newest snapshot per project and analysis type."""
+
+    __tablename__: ClassVar[str] = "project_latest_snapshot"
+
+    project_id: uuid.UUID = Field(
+        sa_column=Column(UUID(as_uuid=True), primary_key=True),
+    )
+    analysis_type: str = Field(sa_column=Column(Text, primary_key=True))
+    snapshot_id: uuid.UUID = Field(
+        sa_column=Column(UUID(as_uuid=True), nullable=False),
+    )
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
@@ -39,6 +39,10 @@ class Snapshot(SQLModel, table=True):
     summary_json: dict[str, Any] = Field(
         sa_column=Column(JSONB, nullable=False),
     )
+    fingerprint: str | None = Field(
+        default=None,
+        sa_column=Column(Text, nullable=True),
+    )
     created_at: datetime = Field(
         sa_column=Column(
             DateTime(timezone=True), nullable=False, server_default=text("now()")
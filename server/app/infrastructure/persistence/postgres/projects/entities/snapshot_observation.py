@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+"""Snapshot observation persistence model."""
+
+import uuid
+from datetime import datetime
+from typing import ClassVar
+
+from sqlalchemy import Column, DateTime, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import text
+from sqlmodel import Field, SQLModel
+
+
+class SnapshotObservation(SQLModel, table=True):
+    """Database record of a re-analysis that reproduced an existing snapshot."""
+
+    __tablename__: ClassVar[str] = "snapshot_observations"
+
+    id: uuid.UUID = Field(  # type: ignore[call-arg]
+        default_factory=uuid.uuid4,
+        sa_column=Column(
+            UUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("uuid_generate_v4()"),
+        ),
+    )
+    snapshot_id: uuid.UUID = Field(
+        sa_column=Column(UUID(as_uuid=True), nullable=False),
+    )
+    commit_hash: str | None = Field(
+        default=None,
+        sa_column=Column(Text, nullable=True),
+    )
+    observed_at: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default=text("now()")
+        ),
+    )
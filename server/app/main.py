@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI
@@ -9,13 +10,35 @@ from sqlalchemy import text
 from app.api.http.v1.analysis import router as analysis_router
 from app.api.http.v1.auth import router as auth_router
 from app.api.http.v1.git import router as git_router
+from app.api.http.v1.jobs import router as jobs_router
 from app.api.http.v1.projects import router as projects_router
 from app.api.http.v1.snapshots import router as snapshots_router
 from app.api.http.v1.users import router as users_router
 from app.api.http.v1.observe import router as observe_router
-from app.api.deps import require_admin_bootstrap
-from app.core.db import engine
+from app.api.deps import build_project_analysis_service, require_admin_bootstrap
+from app.core.db import AsyncSessionLocal, engine
 from app.core.logging import configure_logging
+from app.core.settings import (
+    ANALYSIS_JOB_HEARTBEAT_SECONDS,
+    ANALYSIS_JOB_MAX_ATTEMPTS,
+    ANALYSIS_JOB_POLL_SECONDS,
+    ANALYSIS_JOB_STALE_SECONDS,
+    ANALYSIS_JOB_WORKERS,
+    SNAPSHOT_RETENTION_BATCH_SIZE,
+    SNAPSHOT_RETENTION_INTERVAL_SECONDS,
+    SNAPSHOT_RETENTION_KEEP_DAILY_DAYS,
+    SNAPSHOT_RETENTION_KEEP_LAST,
+    SNAPSHOT_RETENTION_KEEP_WEEKLY_WEEKS,
+)
+from app.domains.analysis.services.analysis_rule_cache import get_analysis_rules_listener
+from app.domains.jobs.services.analysis_job_worker import AnalysisJobWorkerPool
+from app.domains.projects.models.retention import RetentionPolicy
+from app.domains.projects.services.snapshot_retention_worker import (
+    SnapshotRetentionWorker,
+)
+from app.shared.cache.parse_cache import close_parse_cache
+from app.shared.concurrency.executor import shutdown_executors
+from app.shared.concurrency.parse_pool import shutdown_parse_pool
 
 configure_logging()
 
@@ -26,9 +49,45 @@ async def lifespan(app: FastAPI):
     async with engine.connect() as conn:
         await conn.execute(text("SELECT 1"))
 
+    # --- Analysis rule cache invalidation ---
+    rules_listener = get_analysis_rules_listener()
+    rules_listener.start()
+
+    # --- Background analysis jobs ---
+    job_workers = AnalysisJobWorkerPool(
+        session_factory=AsyncSessionLocal,
+        analysis_service_factory=build_project_analysis_service,
+        concurrency=ANALYSIS_JOB_WORKERS,
+        poll_interval=ANALYSIS_JOB_POLL_SECONDS,
+        stale_after=ANALYSIS_JOB_STALE_SECONDS,
+        heartbeat_interval=ANALYSIS_JOB_HEARTBEAT_SECONDS,
+        max_attempts=ANALYSIS_JOB_MAX_ATTEMPTS,
+    )
+    await job_workers.start()
+
+    # --- Snapshot retention ---
+    retention_worker = SnapshotRetentionWorker(
+        session_factory=AsyncSessionLocal,
+        policy=RetentionPolicy(
+            keep_last=SNAPSHOT_RETENTION_KEEP_LAST,
+            keep_daily_days=SNAPSHOT_RETENTION_KEEP_DAILY_DAYS,
+            keep_weekly_weeks=SNAPSHOT_RETENTION_KEEP_WEEKLY_WEEKS,
+        ),
+        batch_size=SNAPSHOT_RETENTION_BATCH_SIZE,
+        interval=SNAPSHOT_RETENTION_INTERVAL_SECONDS,
+    )
+    await retention_worker.start()
+
     yield
 
     # --- Shutdown ---
+    await retention_worker.stop()
+    await job_workers.stop()
+    await rules_listener.stop()
+    # Joining worker threads and processes blocks; keep the loop responsive.
+    await asyncio.to_thread(shutdown_executors)
+    await asyncio.to_thread(shutdown_parse_pool)
+    close_parse_cache()
     await engine.dispose()
 
 
@@ -48,6 +107,7 @@ app.add_middleware(
 app.include_router(auth_router)
 app.include_router(analysis_router)
 app.include_router(git_router)
+app.include_router(jobs_router)
 app.include_router(projects_router)
 app.include_router(snapshots_router)
 app.include_router(users_router)
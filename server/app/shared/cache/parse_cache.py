@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+"""On-disk cache of per-file extractor output."""
+
+from functools import lru_cache
+import json
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Sequence, TypeVar
+
+from app.core.logging import get_logger
+from app.core.settings import ANALYSIS_PARSE_CACHE_MAX_MB, IRAOBSERVER_REPOS_DIR
+
+T = TypeVar("T")
+
+_LOOKUP_BATCH_SIZE = 500
+_EVICT_TARGET_RATIO = 0.9
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    extractor TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    payload_bytes INTEGER NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (extractor, version, path)
+);
+CREATE INDEX IF NOT EXISTS idx_parse_cache_last_access ON parse_cache (last_access);
+"""
+
+
+class ParseCache:
+    """SQLite cache of extractor results keyed by file path, size and mtime.
+
+    Entries are invalidated when a file's size or mtime changes, or when the
+    extractor version is bumped. Least recently used entries are evicted once
+    the stored payloads exceed ``max_bytes``; ``max_bytes <= 0`` disables caching.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int) -> None:
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.logger = get_logger(__name__)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def parse_many(
+        self,
+        extractor: str,
+        version: int,
+        paths: Sequence[Path],
+        parse: Callable[[Sequence[Path]], list[T]],
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+        root: Path | None = None,
+    ) -> list[T]:
+        """Return one result per path, parsing only files missing from the cache.
+
+        ``parse`` receives the uncached paths and must return their results in
+        the same order. Extractors whose results hold paths relative to a
+        project root pass that ``root``; it is part of the cache key, so the
+        same file parsed under another root is parsed again.
+        """
+        if not self.enabled or not paths:
+            return parse(paths)
+
+        signatures = [_signature(path) for path in paths]
+        keys = [_cache_key(path, root) for path in paths]
+        cached = self._lookup(extractor, version, keys)
+
+        results: list[T | None] = [None] * len(paths)
+        hit_keys: list[str] = []
+        miss_positions: list[int] = []
+        for position, key in enumerate(keys):
+            entry = cached.get(key)
+            signature = signatures[position]
+            if signature is not None and entry is not None and entry[0] == signature:
+                results[position] = decode(json.loads(entry[1]))
+                hit_keys.append(key)
+            else:
+                miss_positions.append(position)
+
+        rows: list[tuple[Any, ...]] = []
+        if miss_positions:
+            parsed = parse([paths[position] for position in miss_positions])
+            now = time.time()
+            for position, value in zip(miss_positions, parsed):
+                results[position] = value
+                signature = signatures[position]
+                if signature is None:
+                    continue
+                payload = json.dumps(encode(value), separators=(",", ":"))
+                rows.append(
+                    (
+                        extractor,
+                        version,
+                        keys[position],
+                        signature[0],
+                        signature[1],
+                        payload,
+                        len(payload),
+                        now,
+                    )
+                )
+
+        self._record(extractor, version, hit_keys, rows)
+        with self._lock:
+            self.hits += len(hit_keys)
+            self.misses += len(miss_positions)
+        self.logger.debug(
+            "Parse cache extractor=%s hits=%s misses=%s",
+            extractor,
+            len(hit_keys),
+            len(miss_positions),
+        )
+        return results  # type: ignore[return-value]
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and eviction counters since startup."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _lookup(
+        self, extractor: str, version: int, keys: list[str]
+    ) -> dict[str, tuple[tuple[int, int], str]]:
+        found: dict[str, tuple[tuple[int, int], str]] = {}
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+                batch = keys[start : start + _LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor = connection.execute(
+                    "SELECT path, size, mtime_ns, payload FROM parse_cache "
+                    f"WHERE extractor = ? AND version = ? AND path IN ({placeholders})",
+                    (extractor, version, *batch),
+                )
+                for path, size, mtime_ns, payload in cursor:
+                    found[path] = ((size, mtime_ns), payload)
+        return found
+
+    def _record(
+        self,
+        extractor: str,
+        version: int,
+        hit_keys: list[str],
+        rows: list[tuple[Any, ...]],
+    ) -> None:
+        if not hit_keys and not rows:
+            return
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "UPDATE parse_cache SET last_access = ? "
+                    "WHERE extractor = ? AND version = ? AND path = ?",
+                    [(now, extractor, version, key) for key in hit_keys],
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            if rows:
+                self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(payload_bytes), 0) FROM parse_cache"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * _EVICT_TARGET_RATIO)
+        doomed: list[tuple[str, int, str]] = []
+        for extractor, version, path, payload_bytes in connection.execute(
+            "SELECT extractor, version, path, payload_bytes FROM parse_cache "
+            "ORDER BY last_access"
+        ).fetchall():
+            if total <= target:
+                break
+            doomed.append((extractor, version, path))
+            total -= payload_bytes
+        with connection:
+            connection.executemany(
+                "DELETE FROM parse_cache WHERE extractor = ? AND version = ? AND path = ?",
+                doomed,
+            )
+        self.evictions += len(doomed)
+        self.logger.info(
+            "Evicted parse cache entries count=%s remaining_bytes=%s",
+            len(doomed),
+            total,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.db_path, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+
+def _cache_key(path: Path, root: Path | None) -> str:
+    if root is None:
+        return os.fspath(path)
+    return f"{os.fspath(root)}\n{os.fspath(path)}"
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
+@lru_cache(maxsize=1)
+def get_parse_cache() -> ParseCache:
+    """Return the process-wide parse cache stored under the repos directory."""
+    return ParseCache(
+        db_path=IRAOBSERVER_REPOS_DIR / ".parse-cache" / "parse_cache.sqlite3",
+        max_bytes=ANALYSIS_PARSE_CACHE_MAX_MB * 1024 * 1024,
+    )
+
+
+def close_parse_cache() -> None:
+    """Log cache statistics and close the process-wide parse cache."""
+    if get_parse_cache.cache_info().currsize:
+        cache = get_parse_cache()
+        cache.logger.info("Parse cache stats %s", cache.stats())
+        cache.close()
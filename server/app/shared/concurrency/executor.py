@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+"""Thread executors for running blocking work off the event loop."""
+
+import asyncio
+from functools import lru_cache, partial
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.core.settings import ANALYSIS_MAX_CONCURRENCY, BLOCKING_IO_WORKERS
+
+T = TypeVar("T")
+
+
+class BlockingExecutor:
+    """Bounded thread pool that runs blocking callables for async code."""
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self.name = name
+        self.max_workers = max(max_workers, 1)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run ``func`` in the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self) -> None:
+        """Stop worker threads, if any were started."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.name,
+                )
+            return self._executor
+
+
+@lru_cache(maxsize=1)
+def get_io_executor() -> BlockingExecutor:
+    """Return the executor for short blocking filesystem and git calls."""
+    return BlockingExecutor("blocking-io", BLOCKING_IO_WORKERS)
+
+
+@lru_cache(maxsize=1)
+def get_analysis_executor() -> BlockingExecutor:
+    """Return the executor for source preparation, scanning and detection.
+
+    Its size bounds how many such steps run at once across all analyses; an
+    analysis waiting between steps does not hold a worker.
+    """
+    return BlockingExecutor("analysis", ANALYSIS_MAX_CONCURRENCY)
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a short blocking call without stalling the event loop."""
+    return await get_io_executor().run(func, *args, **kwargs)
+
+
+async def run_analysis(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run analysis work in the bounded analysis pool."""
+    return await get_analysis_executor().run(func, *args, **kwargs)
+
+
+def shutdown_executors() -> None:
+    """Stop the process-wide thread executors."""
+    for getter in (get_io_executor, get_analysis_executor):
+        if getter.cache_info().currsize:
+            getter().shutdown()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+"""Cross-process locks backed by ``flock``."""
+
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+import fcntl
+import os
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+_POLL_INITIAL_SECONDS = 0.01
+_POLL_MAX_SECONDS = 0.5
+
+
+@contextmanager
+def file_lock(path: Path, shared: bool = False) -> Iterator[None]:
+    """Hold an exclusive (or ``shared``) ``flock`` on ``path`` for the block.
+
+    The lock also excludes other threads of the same process, and it is released
+    by the kernel if the holder dies. This call blocks, so use it from a worker
+    thread.
+    """
+    descriptor = _open(path)
+    try:
+        fcntl.flock(descriptor, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(descriptor)
+
+
+@asynccontextmanager
+async def async_file_lock(path: Path, shared: bool = False) -> AsyncIterator[None]:
+    """Hold an exclusive (or ``shared``) ``flock`` on ``path`` across awaits.
+
+    Waiting polls from the event loop instead of parking a worker thread, so
+    holders that need the executors to make progress cannot be starved by
+    waiters occupying them.
+    """
+    descriptor = _open(path)
+    try:
+        operation = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB
+        delay = _POLL_INITIAL_SECONDS
+        while True:
+            try:
+                fcntl.flock(descriptor, operation)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _POLL_MAX_SECONDS)
+        yield
+    finally:
+        os.close(descriptor)
+
+
+def _open(path: Path) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+"""Process pool for CPU-bound source file parsing."""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import multiprocessing
+import os
+from pathlib import Path
+import threading
+from typing import Callable, Sequence
+
+from app.core.logging import get_logger
+from app.core.settings import (
+    ANALYSIS_PARSE_CHUNK_SIZE,
+    ANALYSIS_PARSE_MIN_FILES,
+    ANALYSIS_PARSE_WORKERS,
+)
+
+TokenParser = Callable[[Path], set[str]]
+
+
+class ParsePool:
+    """Split files into chunks, parse them in worker processes and merge tokens."""
+
+    def __init__(self, max_workers: int, chunk_size: int, min_files: int) -> None:
+        self.max_workers = max_workers
+        self.chunk_size = max(chunk_size, 1)
+        self.min_files = min_files
+        self.logger = get_logger(__name__)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def parse_tokens(self, parser: TokenParser, paths: Sequence[Path]) -> set[str]:
+        """Return the union of ``parser`` tokens across ``paths``.
+
+        Inputs of fewer than ``min_files`` paths are parsed in-process; at least
+        that many go to the worker processes, so ``parser`` must be a
+        module-level function that can be sent to them.
+        """
+        tokens: set[str] = set()
+        for file_tokens in self.parse_each(parser, paths):
+            tokens.update(file_tokens)
+        return tokens
+
+    def parse_each(
+        self, parser: TokenParser, paths: Sequence[Path]
+    ) -> list[set[str]]:
+        """Return ``parser`` tokens for every path, in input order."""
+        if self.max_workers <= 1 or len(paths) < self.min_files:
+            return _parse_chunk(parser, paths)
+
+        chunks = [
+            paths[start : start + self.chunk_size]
+            for start in range(0, len(paths), self.chunk_size)
+        ]
+        self.logger.info(
+            "Parsing files in process pool files=%s chunks=%s workers=%s",
+            len(paths),
+            len(chunks),
+            self.max_workers,
+        )
+        results: list[set[str]] = []
+        for chunk_results in self._get_executor().map(
+            _parse_chunk, repeat(parser), chunks
+        ):
+            results.extend(chunk_results)
+        return results
+
+    def shutdown(self) -> None:
+        """Stop worker processes, if any were started."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+
+def _parse_chunk(parser: TokenParser, paths: Sequence[Path]) -> list[set[str]]:
+    return [parser(path) for path in paths]
+
+
+@lru_cache(maxsize=1)
+def get_parse_pool() -> ParsePool:
+    """Return the process-wide parse pool configured from settings."""
+    max_workers = ANALYSIS_PARSE_WORKERS or (os.cpu_count() or 1)
+    return ParsePool(
+        max_workers=max_workers,
+        chunk_size=ANALYSIS_PARSE_CHUNK_SIZE,
+        min_files=ANALYSIS_PARSE_MIN_FILES,
+    )
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the process-wide parse pool."""
+    if get_parse_pool.cache_info().currsize:
+        get_parse_pool().shutdown()
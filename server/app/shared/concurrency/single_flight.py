@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+"""Deduplication of concurrent async calls."""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Share one in-progress call per key between concurrent async callers.
+
+    The first caller starts the call as a task and later callers await the same
+    task until it finishes. Cancelling a caller does not cancel the shared call.
+    Results are not kept once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[T]] = {}
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of ``func()``, joining a call already running for ``key``."""
+        task = self._calls.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+"""Single-pass filesystem index shared by analyzers."""
+
+from array import array
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, Set
+
+from app.core.logging import get_logger
+from app.shared.filesystem.scanner import FileSystemScanner
+
+FILE_KIND = 0
+DIRECTORY_KIND = 1
+
+
+class ScanIndex:
+    """Compact single-walk index of files and directories under a root.
+
+    Entries are stored in parallel arrays (path, suffix, size, mtime, kind).
+    """
+
+    def __init__(self, root_path: Path) -> None:
+        self.root_path = root_path
+        self.paths: list[str] = []
+        self.suffixes: list[str] = []
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.kinds = array("B")
+
+    @classmethod
+    def build(cls, root_path: Path, ignored_directories: Set[str]) -> ScanIndex:
+        """Walk the tree once and return the populated index."""
+        logger = get_logger(__name__)
+        scanner = FileSystemScanner(
+            root_path=root_path,
+            ignored_directories=ignored_directories,
+        )
+        index = cls(root_path)
+        for entry in scanner.walk():
+            try:
+                stat_result = entry.stat()
+            except OSError:
+                continue
+            index.add(
+                relative_path=entry.relative_path,
+                kind=DIRECTORY_KIND if entry.is_dir else FILE_KIND,
+                size=stat_result.st_size,
+                mtime=stat_result.st_mtime,
+            )
+        logger.info(
+            "Built scan index root_path=%s files=%s directories=%s",
+            root_path,
+            index.file_count,
+            index.directory_count,
+        )
+        return index
+
+    def add(self, relative_path: str, kind: int, size: int, mtime: float) -> None:
+        """Append an entry to the index."""
+        suffix = ""
+        if kind == FILE_KIND:
+            suffix = sys.intern(_suffix(relative_path))
+        self.paths.append(relative_path)
+        self.suffixes.append(suffix)
+        self.sizes.append(size)
+        self.mtimes.append(mtime)
+        self.kinds.append(kind)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @property
+    def file_count(self) -> int:
+        return self.kinds.count(FILE_KIND)
+
+    @property
+    def directory_count(self) -> int:
+        return self.kinds.count(DIRECTORY_KIND)
+
+    def absolute(self, relative_path: str) -> Path:
+        """Return the absolute path for an indexed relative path."""
+        return self.root_path / relative_path
+
+    def relative_files(self) -> Iterator[str]:
+        """Yield relative POSIX paths of indexed files."""
+        for position, kind in enumerate(self.kinds):
+            if kind == FILE_KIND:
+                yield self.paths[position]
+
+    def relative_directories(self) -> Iterator[str]:
+        """Yield relative POSIX paths of indexed directories."""
+        for position, kind in enumerate(self.kinds):
+            if kind == DIRECTORY_KIND:
+                yield self.paths[position]
+
+    def file_names(self) -> Iterator[str]:
+        """Yield the base name of every indexed file."""
+        for relative_path in self.relative_files():
+            yield relative_path.rsplit("/", 1)[-1]
+
+    def files(self) -> Iterator[Path]:
+        """Yield absolute paths of indexed files."""
+        for relative_path in self.relative_files():
+            yield self.root_path / relative_path
+
+    def directories(self) -> Iterator[Path]:
+        """Yield absolute paths of indexed directories."""
+        for relative_path in self.relative_directories():
+            yield self.root_path / relative_path
+
+    def files_with_suffix(self, *suffixes: str) -> Iterator[Path]:
+        """Yield files whose lowercased suffix is one of ``suffixes``."""
+        wanted = {suffix.lower() for suffix in suffixes}
+        for position, suffix in enumerate(self.suffixes):
+            if suffix in wanted and self.kinds[position] == FILE_KIND:
+                yield self.root_path / self.paths[position]
+
+    def files_named(self, *names: str) -> Iterator[Path]:
+        """Yield files whose base name is one of ``names``."""
+        wanted = set(names)
+        for relative_path in self.relative_files():
+            if relative_path.rsplit("/", 1)[-1] in wanted:
+                yield self.root_path / relative_path
+
+    def suffix_counts(self) -> dict[str, int]:
+        """Return the number of indexed files per lowercased suffix."""
+        counts: dict[str, int] = {}
+        for position, suffix in enumerate(self.suffixes):
+            if not suffix or self.kinds[position] != FILE_KIND:
+                continue
+            counts[suffix] = counts.get(suffix, 0) + 1
+        return counts
+
+    def scan_files(self) -> Iterable[Path]:
+        """Scanner-compatible alias for :meth:`files`."""
+        return self.files()
+
+    def scan_directories(self) -> Iterable[Path]:
+        """Scanner-compatible alias for :meth:`directories`."""
+        return self.directories()
+
+
+def _suffix(relative_path: str) -> str:
+    name = relative_path.rsplit("/", 1)[-1]
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return ""
+    return name[dot:].lower()
+
@@ -1,11 +1,36 @@
 from __future__ import annotations
 
 """Filesystem scanner utilities."""
+import os
 from pathlib import Path
-from typing import Iterable, Set
+from typing import Iterable, Iterator, Set
 
 from app.core.logging import get_logger
 
+
+class ScanEntry:
+    """Lightweight walk entry backed by an ``os.DirEntry``."""
+
+    __slots__ = ("relative_path", "is_dir", "_entry")
+
+    def __init__(self, entry: os.DirEntry[str], relative_path: str, is_dir: bool) -> None:
+        self.relative_path = relative_path
+        self.is_dir = is_dir
+        self._entry = entry
+
+    @property
+    def name(self) -> str:
+        return self._entry.name
+
+    def stat(self) -> os.stat_result:
+        """Return the stat data cached on the underlying directory entry."""
+        return self._entry.stat()
+
+    def to_path(self) -> Path:
+        """Build a ``Path`` for this entry."""
+        return Path(self._entry.path)
+
+
 class FileSystemScanner:
     """Filesystem scanner with ignored directories support."""
     def __init__(self, root_path: Path, ignored_directories: Set[str]) -> None:
@@ -13,27 +38,42 @@ class FileSystemScanner:
         self.ignored_directories = ignored_directories
         self.logger = get_logger(__name__)
 
-    def scan_files(self) -> Iterable[Path]:
-        self.logger.debug("Scanning files root_path=%s", self.root_path)
-        for path in self.root_path.rglob("*"):
-            if not path.is_file():
+    def walk(self) -> Iterator[ScanEntry]:
+        """Yield entries under the root, pruning ignored directories before descending."""
+        self.logger.debug("Walking root_path=%s", self.root_path)
+        pending: list[tuple[str, str]] = [(os.fspath(self.root_path), "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = list(iterator)
+            except OSError as exc:
+                self.logger.debug("Skipping unreadable directory=%s error=%s", directory, exc)
                 continue
 
-            if any(part in self.ignored_directories for part in path.parts):
-                self.logger.debug("Skipping ignored path=%s", path)
-                continue
+            for entry in entries:
+                relative_path = prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in self.ignored_directories:
+                            self.logger.debug("Pruning ignored directory=%s", relative_path)
+                            continue
+                        yield ScanEntry(entry, relative_path, is_dir=True)
+                        pending.append((entry.path, relative_path + "/"))
+                    elif entry.is_file():
+                        yield ScanEntry(entry, relative_path, is_dir=False)
+                except OSError:
+                    continue
 
-            yield path
+    def scan_files(self) -> Iterable[Path]:
+        self.logger.debug("Scanning files root_path=%s", self.root_path)
+        for entry in self.walk():
+            if not entry.is_dir:
+                yield entry.to_path()
 
     def scan_directories(self) -> Iterable[Path]:
         """Yield directories under the root, excluding ignored paths."""
         self.logger.debug("Scanning directories root_path=%s", self.root_path)
-        for path in self.root_path.rglob("*"):
-            if not path.is_dir():
-                continue
-
-            if any(part in self.ignored_directories for part in path.parts):
-                self.logger.debug("Skipping ignored path=%s", path)
-                continue
-
-            yield path
+        for entry in self.walk():
+            if entry.is_dir:
+                yield entry.to_path()
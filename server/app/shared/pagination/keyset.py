@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+"""Opaque keyset cursors and cached totals for paginated listings."""
+
+import base64
+from datetime import datetime
+from functools import lru_cache
+import json
+from typing import Awaitable, Callable, Hashable
+import uuid
+
+from app.core.settings import PAGINATION_COUNT_CACHE_SECONDS, PAGINATION_COUNT_CACHE_SIZE
+from app.shared.cache.ttl_cache import TTLCache
+
+KeysetPosition = tuple[datetime, uuid.UUID]
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode the ``(created_at, id)`` of the last row on a page as a cursor."""
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> KeysetPosition:
+    """Decode a cursor produced by :func:`encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("invalid cursor") from exc
+
+
+@lru_cache(maxsize=1)
+def get_count_cache() -> TTLCache[int]:
+    """Return the process-wide cache of listing totals."""
+    return TTLCache(
+        maxsize=PAGINATION_COUNT_CACHE_SIZE,
+        ttl_seconds=PAGINATION_COUNT_CACHE_SECONDS,
+    )
+
+
+async def cached_total(key: Hashable, count: Callable[[], Awaitable[int]]) -> int:
+    """Return a recently computed total for ``key`` or run ``count`` and cache it."""
+    cache = get_count_cache()
+    total = cache.get(key)
+    if total is None:
+        total = await count()
+        cache.set(key, total)
+    return total
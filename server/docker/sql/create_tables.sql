@@ -42,6 +42,7 @@ CREATE TABLE
         description TEXT,
         source_type TEXT NOT NULL, -- 'github', 'gitlab', 'local'
         source_ref TEXT NOT NULL, -- repo url or local path
+        settings_json JSONB NOT NULL DEFAULT '{}'::jsonb, -- e.g. clone strategy
         created_at TIMESTAMPTZ NOT NULL DEFAULT now (),
         last_analysis_at TIMESTAMPTZ
     );
@@ -103,9 +104,35 @@ CREATE TABLE
         analysis_type TEXT NOT NULL DEFAULT 'generic',
         commit_hash TEXT,
         summary_json JSONB NOT NULL,
+        fingerprint TEXT,
         created_at TIMESTAMPTZ NOT NULL DEFAULT now ()
     );
 
+-- ==================================================
+-- SNAPSHOT OBSERVATIONS
+-- Re-analyses that reproduced the result of an existing snapshot
+-- ==================================================
+CREATE TABLE
+    snapshot_observations (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4 (),
+        snapshot_id UUID NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+        commit_hash TEXT,
+        observed_at TIMESTAMPTZ NOT NULL DEFAULT now ()
+    );
+
+-- ==================================================
+-- PROJECT LATEST SNAPSHOT
+-- Pointer to the newest snapshot per project and analysis type
+-- ==================================================
+CREATE TABLE
+    project_latest_snapshot (
+        project_id UUID NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+        analysis_type TEXT NOT NULL,
+        snapshot_id UUID NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+        created_at TIMESTAMPTZ NOT NULL,
+        PRIMARY KEY (project_id, analysis_type)
+    );
+
 -- ==================================================
 -- TIMELINE EVENTS
 -- Changes detected between snapshots
@@ -349,3 +376,75 @@ CREATE TABLE observation_conclusion (
     explanation TEXT NOT NULL,
     generated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
 );
+
+-- ==================================================
+-- ANALYSIS JOBS
+-- Queued analysis runs processed by background workers
+-- ==================================================
+CREATE TABLE
+    analysis_jobs (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4 (),
+        project_id UUID NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+        analysis_type TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'queued', -- 'queued', 'running', 'succeeded', 'failed'
+        requested_by UUID REFERENCES users (id) ON DELETE SET NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        result_json JSONB,
+        error TEXT,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT now (),
+        started_at TIMESTAMPTZ,
+        heartbeat_at TIMESTAMPTZ, -- refreshed by the worker while running
+        finished_at TIMESTAMPTZ
+    );
+
+-- ==================================================
+-- ANALYSIS RULES VERSION
+-- Bumped on every write to the rule and ignored-directory tables so
+-- processes can tell when their cached detectors are stale
+-- ==================================================
+CREATE TABLE
+    analysis_rules_version (
+        id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+        version BIGINT NOT NULL DEFAULT 0
+    );
+
+INSERT INTO
+    analysis_rules_version (id, version)
+VALUES
+    (TRUE, 0);
+
+CREATE FUNCTION bump_analysis_rules_version () RETURNS TRIGGER LANGUAGE plpgsql AS $$
+DECLARE
+    new_version BIGINT;
+BEGIN
+    UPDATE analysis_rules_version
+    SET version = version + 1
+    RETURNING version INTO new_version;
+    PERFORM pg_notify('analysis_rules_changed', new_version::TEXT);
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER analysis_ignored_directory_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_ignored_directory
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE TRIGGER analysis_language_rule_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_language_rule
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE TRIGGER analysis_framework_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_framework
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE TRIGGER analysis_framework_rule_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_framework_rule
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE TRIGGER analysis_infra_component_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_infra_component
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE TRIGGER analysis_infra_rule_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_infra_rule
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
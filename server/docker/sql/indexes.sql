@@ -15,6 +15,8 @@ CREATE INDEX idx_sessions_expires_at ON sessions (expires_at);
 
 CREATE INDEX idx_snapshots_project_id ON snapshots (project_id);
 CREATE INDEX idx_snapshots_project_type ON snapshots (project_id, analysis_type, created_at);
+CREATE INDEX idx_snapshots_project_created ON snapshots (project_id, created_at, id);
+CREATE INDEX idx_snapshot_observations_snapshot ON snapshot_observations (snapshot_id, observed_at);
 
 CREATE INDEX idx_timeline_events_project_id ON timeline_events (project_id);
 
@@ -54,7 +56,10 @@ CREATE INDEX idx_snapshot_infrastructure_snapshot_id ON snapshot_infrastructure
 -- ==================================================
 -- API ENDPOINTS INDEXES
 -- ==================================================
-CREATE INDEX idx_api_endpoints_snapshot ON api_endpoints (snapshot_id);
+-- Serves per-snapshot listings, method filters and (created_at, id) cursors
+CREATE INDEX idx_api_endpoints_snapshot_method ON api_endpoints (snapshot_id, http_method, created_at, id);
+
+CREATE INDEX idx_api_endpoints_snapshot_created ON api_endpoints (snapshot_id, created_at, id);
 
 CREATE INDEX idx_api_endpoints_signature ON api_endpoints (http_method, path);
 
@@ -90,3 +95,21 @@ CREATE INDEX idx_observation_tool_call_result_gin
 CREATE INDEX idx_observation_tool_call_args_gin
     ON observation_tool_call
     USING GIN (tool_arguments);
+
+-- ==================================================
+-- ANALYSIS JOBS INDEXES
+-- ==================================================
+-- At most one in-flight job per project and analysis type
+CREATE UNIQUE INDEX uq_analysis_jobs_in_flight
+    ON analysis_jobs (project_id, analysis_type)
+    WHERE status IN ('queued', 'running');
+
+CREATE INDEX idx_analysis_jobs_queued
+    ON analysis_jobs (created_at)
+    WHERE status = 'queued';
+
+CREATE INDEX idx_analysis_jobs_running
+    ON analysis_jobs (heartbeat_at)
+    WHERE status = 'running';
+
+CREATE INDEX idx_analysis_jobs_project ON analysis_jobs (project_id, created_at);
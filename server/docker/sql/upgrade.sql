@@ -0,0 +1,156 @@
+-- ==================================================
+-- UPGRADE
+-- Brings a database created from an older create_tables.sql up to date.
+-- Fresh databases get the full schema from init.sql and do not need it.
+-- Every statement is idempotent (PostgreSQL 14+), so the script can be re-run:
+--   psql -U iraobserver -d iraobserver -v ON_ERROR_STOP=1 -f docker/sql/upgrade.sql
+-- ==================================================
+
+-- ==================================================
+-- PROJECT LATEST SNAPSHOT
+-- ==================================================
+CREATE TABLE IF NOT EXISTS
+    project_latest_snapshot (
+        project_id UUID NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+        analysis_type TEXT NOT NULL,
+        snapshot_id UUID NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+        created_at TIMESTAMPTZ NOT NULL,
+        PRIMARY KEY (project_id, analysis_type)
+    );
+
+-- Points every project and analysis type at its newest existing snapshot
+INSERT INTO
+    project_latest_snapshot (project_id, analysis_type, snapshot_id, created_at)
+SELECT DISTINCT
+    ON (project_id, analysis_type) project_id,
+    analysis_type,
+    id,
+    created_at
+FROM
+    snapshots
+ORDER BY
+    project_id,
+    analysis_type,
+    created_at DESC
+ON CONFLICT DO NOTHING;
+
+-- ==================================================
+-- SNAPSHOT FINGERPRINTS AND OBSERVATIONS
+-- ==================================================
+ALTER TABLE snapshots ADD COLUMN IF NOT EXISTS fingerprint TEXT;
+
+CREATE TABLE IF NOT EXISTS
+    snapshot_observations (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4 (),
+        snapshot_id UUID NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+        commit_hash TEXT,
+        observed_at TIMESTAMPTZ NOT NULL DEFAULT now ()
+    );
+
+CREATE INDEX IF NOT EXISTS idx_snapshot_observations_snapshot ON snapshot_observations (snapshot_id, observed_at);
+
+-- ==================================================
+-- PROJECT SETTINGS
+-- ==================================================
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS settings_json JSONB NOT NULL DEFAULT '{}'::jsonb;
+
+-- ==================================================
+-- ANALYSIS JOBS
+-- ==================================================
+CREATE TABLE IF NOT EXISTS
+    analysis_jobs (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4 (),
+        project_id UUID NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+        analysis_type TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'queued', -- 'queued', 'running', 'succeeded', 'failed'
+        requested_by UUID REFERENCES users (id) ON DELETE SET NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        result_json JSONB,
+        error TEXT,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT now (),
+        started_at TIMESTAMPTZ,
+        heartbeat_at TIMESTAMPTZ,
+        finished_at TIMESTAMPTZ
+    );
+
+ALTER TABLE analysis_jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMPTZ;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_analysis_jobs_in_flight
+    ON analysis_jobs (project_id, analysis_type)
+    WHERE status IN ('queued', 'running');
+
+CREATE INDEX IF NOT EXISTS idx_analysis_jobs_queued
+    ON analysis_jobs (created_at)
+    WHERE status = 'queued';
+
+CREATE INDEX IF NOT EXISTS idx_analysis_jobs_running
+    ON analysis_jobs (heartbeat_at)
+    WHERE status = 'running';
+
+CREATE INDEX IF NOT EXISTS idx_analysis_jobs_project ON analysis_jobs (project_id, created_at);
+
+-- ==================================================
+-- SNAPSHOT KEYSET CURSORS
+-- ==================================================
+CREATE INDEX IF NOT EXISTS idx_snapshots_project_created ON snapshots (project_id, created_at, id);
+
+-- ==================================================
+-- SNAPSHOT-SCOPED ENDPOINT LISTINGS
+-- ==================================================
+CREATE INDEX IF NOT EXISTS idx_api_endpoints_snapshot_method ON api_endpoints (snapshot_id, http_method, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_api_endpoints_snapshot_created ON api_endpoints (snapshot_id, created_at, id);
+
+-- Covered by the composite indexes above
+DROP INDEX IF EXISTS idx_api_endpoints_snapshot;
+
+-- ==================================================
+-- ANALYSIS RULES VERSION
+-- ==================================================
+CREATE TABLE IF NOT EXISTS
+    analysis_rules_version (
+        id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+        version BIGINT NOT NULL DEFAULT 0
+    );
+
+INSERT INTO
+    analysis_rules_version (id, version)
+VALUES
+    (TRUE, 0)
+ON CONFLICT DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_analysis_rules_version () RETURNS TRIGGER LANGUAGE plpgsql AS $$
+DECLARE
+    new_version BIGINT;
+BEGIN
+    UPDATE analysis_rules_version
+    SET version = version + 1
+    RETURNING version INTO new_version;
+    PERFORM pg_notify('analysis_rules_changed', new_version::TEXT);
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE TRIGGER analysis_ignored_directory_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_ignored_directory
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE OR REPLACE TRIGGER analysis_language_rule_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_language_rule
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE OR REPLACE TRIGGER analysis_framework_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_framework
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE OR REPLACE TRIGGER analysis_framework_rule_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_framework_rule
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE OR REPLACE TRIGGER analysis_infra_component_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_infra_component
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
+
+CREATE OR REPLACE TRIGGER analysis_infra_rule_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON analysis_infra_rule
+FOR EACH STATEMENT EXECUTE FUNCTION bump_analysis_rules_version ();
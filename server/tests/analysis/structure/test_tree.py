@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from app.analysis.structure.tree import TreeIndex, build_project_tree, iter_project_tree
+
+
+class TestProjectTree(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        for relative in ("src/app/main.py", "src/README.md", "node_modules/x/index.js", "b.txt"):
+            target = self.root / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text("")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_depth_limits_nested_tree_and_marks_truncated_directories(self) -> None:
+        tree = build_project_tree(self.root, ["node_modules"], path="src", depth=1)
+
+        self.assertEqual(tree["path"], "src")
+        self.assertEqual(
+            tree["children"],
+            [
+                {"name": "app", "path": "src/app", "type": "dir", "truncated": True},
+                {"name": "README.md", "path": "src/README.md", "type": "file"},
+            ],
+        )
+
+    def test_iter_yields_flat_nodes_in_pre_order(self) -> None:
+        nodes = list(iter_project_tree(self.root, ["node_modules"]))
+
+        self.assertEqual(
+            [(node["path"], node["depth"]) for node in nodes],
+            [
+                (".", 0),
+                ("src", 1),
+                ("src/app", 2),
+                ("src/app/main.py", 3),
+                ("src/README.md", 2),
+                ("b.txt", 1),
+            ],
+        )
+
+    def test_rejects_paths_outside_or_ignored(self) -> None:
+        for path in ("../etc", "/etc", "node_modules/x", "missing"):
+            with self.assertRaises(ValueError):
+                iter_project_tree(self.root, ["node_modules"], path=path)
+
+
+class TestTreeIndex(unittest.TestCase):
+    def test_refresh_relists_only_changed_directories(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for relative in ("src/app/main.py", "src/old/util.py", "docs/index.md"):
+                (root / relative).parent.mkdir(parents=True, exist_ok=True)
+                (root / relative).write_text("")
+            index = TreeIndex.scan(root)
+            self.assertEqual(index.build(), build_project_tree(root))
+
+            (root / "src/old/util.py").unlink()
+            (root / "src/old").rmdir()
+            (root / "src/new/deep").mkdir(parents=True)
+            (root / "src/new/deep/mod.py").write_text("")
+            (root / "docs/guide.md").write_text("")
+
+            refreshed = index.refresh(["src/old/util.py", "src/new/deep/mod.py"])
+
+            # docs/ was not named by the change set, so it is not listed again.
+            expected = [
+                node
+                for node in iter_project_tree(root)
+                if node["path"] != "docs/guide.md"
+            ]
+            self.assertEqual(list(refreshed.iter_nodes()), expected)
+            self.assertEqual(
+                [node["path"] for node in index.iter_nodes("src", depth=1)],
+                ["src", "src/app", "src/old"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import unittest
+
+from app.domains.analysis.services.analysis_rule_cache import AnalysisRuleCache
+
+
+class TestAnalysisRuleCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.version = 1
+        self.version_reads = 0
+        self.loads = 0
+
+        async def read_version() -> int:
+            self.version_reads += 1
+            return self.version
+
+        self.cache = AnalysisRuleCache(read_version)
+
+    async def load(self) -> int:
+        self.loads += 1
+        return self.loads
+
+    async def test_reloads_when_the_version_counter_moves(self) -> None:
+        self.assertEqual(await self.cache.get("rules", self.load), 1)
+        self.assertEqual(await self.cache.get("rules", self.load), 1)
+
+        self.version = 2
+
+        self.assertEqual(await self.cache.get("rules", self.load), 2)
+        self.assertEqual(self.version_reads, 3)
+
+    async def test_skips_version_reads_while_listening(self) -> None:
+        self.cache.set_listening(True)
+        self.assertEqual(await self.cache.get("rules", self.load), 1)
+        self.assertEqual(await self.cache.get("rules", self.load), 1)
+
+        self.cache.notify("2")
+
+        self.assertEqual(await self.cache.get("rules", self.load), 2)
+        self.assertEqual(self.version_reads, 0)
+
+        self.cache.set_listening(False)
+        self.assertEqual(await self.cache.get("rules", self.load), 3)
+        self.assertEqual(self.version_reads, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
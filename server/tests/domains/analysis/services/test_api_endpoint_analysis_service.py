@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+from app.domains.analysis.models.endpoint_scope import EndpointScope
+from app.domains.analysis.services.api_endpoint_analysis_service import (
+    ApiEndpointAnalysisService,
+)
+from app.domains.analysis.services.project_dependency_analysis_service import (
+    ProjectDependencyAnalysisService,
+)
+from app.domains.projects.models.dto.project import ProjectPublic
+from app.domains.projects.models.snapshot_type import SnapshotType
+from app.domains.projects.services.snapshot_service import SnapshotService
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+from app.shared.cache.parse_cache import ParseCache
+
+
+class _FakeSnapshotRepository:
+    """Serves snapshots by id and the latest snapshot through a pointer map."""
+
+    def __init__(self) -> None:
+        self.snapshots: dict[uuid.UUID, Snapshot] = {}
+        self.latest: dict[tuple[uuid.UUID, str], uuid.UUID] = {}
+        self.latest_lookups: list[tuple[uuid.UUID, str]] = []
+
+    def add(self, snapshot: Snapshot, latest: bool = False) -> Snapshot:
+        self.snapshots[snapshot.id] = snapshot
+        if latest:
+            self.latest[(snapshot.project_id, snapshot.analysis_type)] = snapshot.id
+        return snapshot
+
+    async def get_by_id(self, snapshot_id: uuid.UUID) -> Snapshot | None:
+        return self.snapshots.get(snapshot_id)
+
+    async def get_latest_by_project_and_type(
+        self, project_id: uuid.UUID, analysis_type: str
+    ) -> Snapshot | None:
+        self.latest_lookups.append((project_id, analysis_type))
+        snapshot_id = self.latest.get((project_id, analysis_type))
+        return self.snapshots.get(snapshot_id) if snapshot_id else None
+
+
+class _FakeProjectService:
+    def __init__(self, *project_ids: uuid.UUID) -> None:
+        self.projects = {
+            project_id: ProjectPublic(
+                id=project_id,
+                name=str(project_id),
+                description=None,
+                source_type="local",
+                source_ref="/tmp",
+                created_at=datetime.now(timezone.utc),
+                last_analysis_at=None,
+            )
+            for project_id in project_ids
+        }
+
+    async def get_project(self, project_id: uuid.UUID) -> ProjectPublic | None:
+        return self.projects.get(project_id)
+
+
+class _FakeSnapshotApiEndpointService:
+    def __init__(self) -> None:
+        self.listings: list[dict[str, object]] = []
+
+    async def get_project_api_endpoints(self, **kwargs: object) -> list[object]:
+        self.listings.append(kwargs)
+        return []
+
+    async def count_project_api_endpoints(self, **kwargs: object) -> int:
+        return 0
+
+
+def _snapshot(
+    project_id: uuid.UUID, analysis_type: str, age: timedelta = timedelta()
+) -> Snapshot:
+    return Snapshot(
+        project_id=project_id,
+        analysis_type=analysis_type,
+        summary_json={},
+        created_at=datetime.now(timezone.utc) - age,
+    )
+
+
+class TestEndpointListingScope(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.project_id = uuid.uuid4()
+        self.other_project_id = uuid.uuid4()
+        self.repository = _FakeSnapshotRepository()
+        self.endpoints = _FakeSnapshotApiEndpointService()
+        project_service = _FakeProjectService(self.project_id, self.other_project_id)
+        self.service = ApiEndpointAnalysisService(
+            project_service=project_service,
+            ignored_directory_repository=None,
+            snapshot_service=SnapshotService(self.repository, project_service),
+            snapshot_api_endpoint_service=self.endpoints,
+        )
+
+    async def test_latest_scope_lists_the_pointed_snapshot(self) -> None:
+        endpoints = SnapshotType.API_ENDPOINTS.value
+        self.repository.add(_snapshot(self.project_id, endpoints, timedelta(days=1)))
+        current = self.repository.add(
+            _snapshot(self.project_id, endpoints, timedelta(hours=1)), latest=True
+        )
+        self.repository.add(
+            _snapshot(self.project_id, SnapshotType.LANGUAGES.value), latest=True
+        )
+
+        page = await self.service.list_project_api_endpoints(
+            self.project_id, scope=EndpointScope.LATEST
+        )
+
+        self.assertEqual(page.items, [])
+        self.assertEqual(self.repository.latest_lookups, [(self.project_id, endpoints)])
+        self.assertEqual(len(self.endpoints.listings), 1)
+        self.assertEqual(self.endpoints.listings[0]["snapshot_id"], current.id)
+
+    async def test_latest_scope_without_snapshot_returns_an_empty_page(self) -> None:
+        page = await self.service.list_project_api_endpoints(
+            self.project_id, scope=EndpointScope.LATEST
+        )
+
+        self.assertEqual((page.items, page.total), ([], 0))
+        self.assertEqual(self.endpoints.listings, [])
+
+    async def test_rejects_snapshot_of_another_project(self) -> None:
+        foreign = self.repository.add(
+            _snapshot(self.other_project_id, SnapshotType.API_ENDPOINTS.value),
+            latest=True,
+        )
+
+        with self.assertRaises(ValueError):
+            await self.service.list_project_api_endpoints(
+                self.project_id, snapshot_id=foreign.id
+            )
+        self.assertEqual(self.endpoints.listings, [])
+
+    async def test_rejects_snapshot_of_another_analysis_type(self) -> None:
+        languages = self.repository.add(
+            _snapshot(self.project_id, SnapshotType.LANGUAGES.value)
+        )
+
+        with self.assertRaises(ValueError):
+            await self.service.list_project_api_endpoints(
+                self.project_id, snapshot_id=languages.id
+            )
+        self.assertEqual(self.endpoints.listings, [])
+
+    async def test_lists_an_own_endpoint_snapshot(self) -> None:
+        older = self.repository.add(
+            _snapshot(self.project_id, SnapshotType.API_ENDPOINTS.value)
+        )
+
+        await self.service.list_project_api_endpoints(
+            self.project_id, snapshot_id=older.id
+        )
+
+        self.assertEqual(self.endpoints.listings[0]["snapshot_id"], older.id)
+        self.assertEqual(self.endpoints.listings[0]["project_id"], self.project_id)
+
+
+class TestCachedExtractionRoots(unittest.TestCase):
+    def test_source_files_are_relative_to_each_root(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / "svc").mkdir()
+            api = root / "svc" / "api.py"
+            api.write_text(
+                "from fastapi import APIRouter\n"
+                "router = APIRouter()\n\n"
+                "@router.get('/items')\n"
+                "def list_items():\n"
+                "    return []\n"
+            )
+            requirements = root / "svc" / "requirements.txt"
+            requirements.write_text("fastapi==0.110.0\n")
+            cache = ParseCache(root / "cache.sqlite3", max_bytes=1024 * 1024)
+            self.addCleanup(cache.close)
+            endpoints = ApiEndpointAnalysisService(None, None, None, None)
+            dependencies = ProjectDependencyAnalysisService(None, None, None, None)
+
+            for module in ("api_endpoint", "project_dependency"):
+                patcher = mock.patch(
+                    f"app.domains.analysis.services.{module}_analysis_service."
+                    "get_parse_cache",
+                    return_value=cache,
+                )
+                patcher.start()
+                self.addCleanup(patcher.stop)
+
+            for parse_root, expected in ((root, "svc/"), (root / "svc", "")):
+                with self.subTest(root=parse_root):
+                    found = endpoints._extract_files([api], parse_root)
+                    self.assertEqual(
+                        [item.source_file for item in found], [f"{expected}api.py"]
+                    )
+                    found = dependencies._extract_files([requirements], parse_root)
+                    self.assertEqual(
+                        [item.source_file for item in found],
+                        [f"{expected}requirements.txt"],
+                    )
+            self.assertEqual(cache.stats()["hits"], 0)
+
+            endpoints._extract_files([api], root / "svc")
+            self.assertEqual(cache.stats()["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import unittest
+
+from app.analysis.api_endpoints.models.endpoint import EndpointCandidate
+from app.domains.analysis.services.fingerprint import result_fingerprint
+
+
+def _endpoint(method: str, path: str) -> EndpointCandidate:
+    return EndpointCandidate(
+        http_method=method,
+        path=path,
+        framework="fastapi",
+        language="python",
+        source_file="app/main.py",
+    )
+
+
+class TestResultFingerprint(unittest.TestCase):
+    def test_ignores_row_order_but_not_content_or_context(self) -> None:
+        rows = [_endpoint("GET", "/items"), _endpoint("POST", "/items")]
+        fingerprint = result_fingerprint("api_endpoints", rows, "config")
+
+        self.assertEqual(
+            fingerprint, result_fingerprint("api_endpoints", rows[::-1], "config")
+        )
+        self.assertNotEqual(
+            fingerprint, result_fingerprint("api_endpoints", rows[:1], "config")
+        )
+        self.assertNotEqual(
+            fingerprint, result_fingerprint("api_endpoints", rows, "other-config")
+        )
+        self.assertNotEqual(
+            result_fingerprint("languages", {"Python": 3}.items()),
+            result_fingerprint("languages", {"Python": 4}.items()),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
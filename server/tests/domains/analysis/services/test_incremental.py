@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import subprocess
+import tempfile
+import unittest
+import uuid
+from pathlib import Path
+
+from app.domains.analysis.services.incremental import (
+    SCAN_CONFIG_KEY,
+    changes_since_snapshot,
+)
+from app.infrastructure.external.git.commits import get_clean_head_commit
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+
+
+def _git(root: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(root), *args], check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+def _snapshot(commit_hash: str | None) -> Snapshot:
+    return Snapshot(
+        project_id=uuid.uuid4(),
+        commit_hash=commit_hash,
+        summary_json={SCAN_CONFIG_KEY: "config"},
+    )
+
+
+class TestDirtyCheckoutSnapshots(unittest.IsolatedAsyncioTestCase):
+    async def test_dirty_then_clean_checkout(self) -> None:
+        ignored = frozenset({"node_modules"})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            _git(root, "init", "-q")
+            _git(root, "config", "user.email", "dev@example.com")
+            _git(root, "config", "user.name", "dev")
+            (root / ".gitignore").write_text("build/\nnode_modules/\n")
+            (root / "a.py").write_text("a\n")
+            _git(root, "add", "-A")
+            _git(root, "commit", "-qm", "base")
+            base = _git(root, "rev-parse", "HEAD")
+
+            (root / "b.py").write_text("untracked\n")
+            dirty_commit = get_clean_head_commit(root, ignored)
+            self.assertIsNone(dirty_commit)
+            # A snapshot of the dirty scan carries no commit, so the next run
+            # after a commit rescans everything instead of diffing from HEAD.
+            _git(root, "add", "-A")
+            _git(root, "commit", "-qm", "add b")
+            head = get_clean_head_commit(root, ignored)
+            self.assertEqual(head, _git(root, "rev-parse", "HEAD"))
+            self.assertIsNone(
+                await changes_since_snapshot(
+                    _snapshot(dirty_commit), root, head, "config", ignored
+                )
+            )
+            changes = await changes_since_snapshot(
+                _snapshot(base), root, head, "config", ignored
+            )
+            self.assertIsNotNone(changes)
+            self.assertEqual(changes.added, {"b.py"})
+
+            (root / "a.py").write_text("modified\n")
+            self.assertIsNone(get_clean_head_commit(root, ignored))
+            _git(root, "checkout", "--", "a.py")
+
+            (root / "build").mkdir()
+            (root / "build" / "out.py").write_text("generated\n")
+            self.assertIsNone(get_clean_head_commit(root, ignored))
+            (root / "build" / "out.py").unlink()
+            (root / "build").rmdir()
+
+            (root / "node_modules").mkdir()
+            (root / "node_modules" / "dep.js").write_text("dep\n")
+            self.assertEqual(get_clean_head_commit(root, ignored), head)
+
+
+if __name__ == "__main__":
+    unittest.main()
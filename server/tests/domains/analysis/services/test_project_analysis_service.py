@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from app.domains.analysis.models.dto.api_endpoint import ProjectApiEndpointAnalysis
+from app.domains.analysis.services.project_analysis_service import (
+    ProjectAnalysisService,
+)
+from app.domains.projects.models.dto.project import ProjectPublic
+from app.domains.projects.services.snapshot_service import SnapshotService
+
+
+class _FakeSnapshotRepository:
+    """Stages snapshot writes until commit, like a session would."""
+
+    def __init__(self) -> None:
+        self.pending: list[str] = []
+        self.stored: list[str] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+        self.stored.extend(self.pending)
+        self.pending.clear()
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+        self.pending.clear()
+
+
+class _FakeProjectService:
+    def __init__(self, project: ProjectPublic) -> None:
+        self.project = project
+        self.lookups = 0
+
+    async def get_project(self, project_id: uuid.UUID) -> ProjectPublic | None:
+        self.lookups += 1
+        return self.project if project_id == self.project.id else None
+
+
+class _FakeDetector:
+    def __init__(self, detected: object, indexes: list[object]) -> None:
+        self.detected = detected
+        self.indexes = indexes
+        self.rules: list[object] = []
+
+    def detect(self, index: object) -> object:
+        self.indexes.append(index)
+        return self.detected
+
+
+class _FakeAnalysis:
+    """Stands in for one per-type analysis service."""
+
+    def __init__(
+        self,
+        name: str,
+        repository: _FakeSnapshotRepository,
+        indexes: list[object],
+        fail: bool = False,
+    ) -> None:
+        self.name = name
+        self.repository = repository
+        self.indexes = indexes
+        self.fail = fail
+        self.store_calls: list[dict[str, object]] = []
+
+    async def build_detector(self) -> _FakeDetector:
+        detected = [] if self.name == "infrastructure" else {self.name: 1.0}
+        return _FakeDetector(detected, self.indexes)
+
+    def scan_config(self, detector: object, ignored_directories: frozenset[str]) -> str:
+        return "config"
+
+    def extract_endpoints(self, index: object, source_path: Path) -> list[object]:
+        self.indexes.append(index)
+        return []
+
+    extract_dependencies = extract_endpoints
+
+    async def store(self, project_id: uuid.UUID, result: object, **kwargs: object):
+        self.store_calls.append(kwargs)
+        if self.fail:
+            raise RuntimeError(f"{self.name} store failed")
+        self.repository.pending.append(self.name)
+        return SimpleNamespace(id=uuid.uuid4())
+
+    store_languages = store_frameworks = store_infrastructure = store
+    store_api_endpoints = store_dependencies = store
+
+    async def load_api_endpoints(
+        self, snapshot_id: uuid.UUID
+    ) -> ProjectApiEndpointAnalysis:
+        return ProjectApiEndpointAnalysis(endpoints=[])
+
+    async def load_dependencies(self, snapshot_id: uuid.UUID) -> list[object]:
+        return []
+
+
+class TestAnalyzeAll(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        (Path(tmp_dir.name) / "app.py").write_text("print('hi')\n")
+        self.project = ProjectPublic(
+            id=uuid.uuid4(),
+            name="demo",
+            description=None,
+            source_type="local",
+            source_ref=tmp_dir.name,
+            created_at=datetime.now(timezone.utc),
+            last_analysis_at=None,
+        )
+        self.repository = _FakeSnapshotRepository()
+        self.indexes: list[object] = []
+        ignored = mock.patch(
+            "app.domains.analysis.services.project_analysis_service."
+            "active_ignored_directories",
+            mock.AsyncMock(return_value=frozenset()),
+        )
+        ignored.start()
+        self.addCleanup(ignored.stop)
+
+    def build_service(self, failing: str | None = None) -> ProjectAnalysisService:
+        analyses = {
+            name: _FakeAnalysis(
+                name, self.repository, self.indexes, fail=name == failing
+            )
+            for name in (
+                "languages",
+                "frameworks",
+                "infrastructure",
+                "api_endpoints",
+                "dependencies",
+            )
+        }
+        self.analyses = analyses
+        self.project_service = project_service = _FakeProjectService(self.project)
+        return ProjectAnalysisService(
+            project_service=project_service,
+            ignored_directory_repository=None,
+            snapshot_service=SnapshotService(self.repository, project_service),
+            language_analysis_service=analyses["languages"],
+            framework_analysis_service=analyses["frameworks"],
+            infrastructure_analysis_service=analyses["infrastructure"],
+            api_endpoint_analysis_service=analyses["api_endpoints"],
+            project_dependency_analysis_service=analyses["dependencies"],
+        )
+
+    async def test_shares_one_scan_and_commits_once(self) -> None:
+        service = self.build_service()
+
+        result = await service.analyze_all(self.project.id)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(len(self.indexes), 5)
+        self.assertTrue(all(index is self.indexes[0] for index in self.indexes))
+        for analysis in self.analyses.values():
+            self.assertEqual(len(analysis.store_calls), 1)
+            self.assertIs(analysis.store_calls[0]["commit"], False)
+            self.assertIs(analysis.store_calls[0]["project_checked"], True)
+        self.assertEqual(self.project_service.lookups, 1)
+        self.assertEqual(self.repository.commits, 1)
+        self.assertEqual(self.repository.rollbacks, 0)
+        self.assertEqual(sorted(self.repository.stored), sorted(self.analyses))
+
+    async def test_rolls_back_every_type_when_one_store_fails(self) -> None:
+        service = self.build_service(failing="api_endpoints")
+
+        with self.assertRaises(RuntimeError):
+            await service.analyze_all(self.project.id)
+
+        self.assertEqual(self.repository.commits, 0)
+        self.assertEqual(self.repository.rollbacks, 1)
+        self.assertEqual(self.repository.stored, [])
+        self.assertEqual(self.repository.pending, [])
+
+    async def test_returns_none_for_unknown_project(self) -> None:
+        service = self.build_service()
+
+        self.assertIsNone(await service.analyze_all(uuid.uuid4()))
+        self.assertEqual(self.repository.commits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
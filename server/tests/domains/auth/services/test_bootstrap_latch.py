@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import unittest
+
+from app.domains.auth.services.bootstrap_latch import BootstrapLatch
+
+
+class TestBootstrapLatch(unittest.IsolatedAsyncioTestCase):
+    async def test_queries_until_an_admin_exists_then_only_on_recheck(self) -> None:
+        now = [0.0]
+        admin = [False]
+        queries = []
+
+        async def has_admin() -> bool:
+            queries.append(now[0])
+            return admin[0]
+
+        latch = BootstrapLatch(recheck_seconds=60, clock=lambda: now[0])
+
+        self.assertFalse(await latch.is_bootstrapped(has_admin))
+        self.assertFalse(await latch.is_bootstrapped(has_admin))
+        admin[0] = True
+        self.assertTrue(await latch.is_bootstrapped(has_admin))
+        now[0] = 59
+        self.assertTrue(await latch.is_bootstrapped(has_admin))
+        self.assertEqual(queries, [0.0, 0.0, 0.0])
+
+        admin[0] = False
+        now[0] = 61
+        self.assertFalse(await latch.is_bootstrapped(has_admin))
+        latch.set()
+        self.assertTrue(await latch.is_bootstrapped(has_admin))
+        self.assertEqual(queries, [0.0, 0.0, 0.0, 61])
+
+
+if __name__ == "__main__":
+    unittest.main()
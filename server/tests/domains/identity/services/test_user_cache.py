@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import unittest
+import uuid
+
+from app.domains.identity.services.user_cache import UserCache
+from app.infrastructure.persistence.postgres.identity.entities.user import User
+
+
+def _user(is_active: bool = True) -> User:
+    return User(
+        id=uuid.uuid4(),
+        display_name="ada",
+        password_hash="",
+        role="reader",
+        is_active=is_active,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+class TestUserCache(unittest.TestCase):
+    def test_caches_active_users_until_invalidated(self) -> None:
+        cache = UserCache(maxsize=10, ttl_seconds=60)
+        active, inactive = _user(), _user(is_active=False)
+
+        cache.set(active)
+        cache.set(inactive)
+        cached = cache.get(active.id)
+
+        self.assertIsNotNone(cached)
+        self.assertIsNot(cached, active)
+        self.assertEqual(cached.role, "reader")
+        self.assertIsNone(cache.get(inactive.id))
+
+        cache.invalidate(active.id)
+
+        self.assertIsNone(cache.get(active.id))
+        self.assertEqual(
+            cache.stats(), {"hits": 1, "misses": 2, "invalidations": 1, "size": 0}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+
+from app.domains.analysis.models.dto.language import ProjectLanguageAnalysis
+from app.domains.jobs.services.analysis_job_runner import (
+    SUPPORTED_ANALYSIS_TYPES,
+    run_analysis_job,
+)
+
+
+class _FakeAnalysisService:
+    async def analyze_and_store_languages(self, project_id: uuid.UUID):
+        return ProjectLanguageAnalysis(languages={"Python": 3})
+
+    async def analyze_and_store_dependencies(self, project_id: uuid.UUID):
+        return None
+
+
+class TestRunAnalysisJob(unittest.IsolatedAsyncioTestCase):
+    async def test_returns_json_result_for_analysis_type(self) -> None:
+        result = await run_analysis_job(
+            _FakeAnalysisService(), uuid.uuid4(), "languages"
+        )
+        self.assertEqual(result, {"languages": {"Python": 3}})
+
+    async def test_returns_none_when_project_is_missing(self) -> None:
+        result = await run_analysis_job(
+            _FakeAnalysisService(), uuid.uuid4(), "dependencies"
+        )
+        self.assertIsNone(result)
+        self.assertIn("api_endpoints", SUPPORTED_ANALYSIS_TYPES)
+
+
+if __name__ == "__main__":
+    unittest.main()
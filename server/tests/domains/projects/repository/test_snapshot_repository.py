@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.domains.projects.repository.snapshot_repository import SnapshotRepository
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.added: list[object] = []
+        self.statements: list[object] = []
+
+    def add(self, instance: object) -> None:
+        self.added.append(instance)
+
+    async def execute(self, statement: object) -> SimpleNamespace:
+        self.statements.append(statement)
+        return SimpleNamespace(scalar_one_or_none=lambda: None)
+
+
+def _sql(statement: object) -> str:
+    return " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+
+class TestPointLatest(unittest.IsolatedAsyncioTestCase):
+    async def test_older_snapshot_does_not_move_the_pointer(self) -> None:
+        session = _RecordingSession()
+        repository = SnapshotRepository(session)
+        project_id = uuid.uuid4()
+        now = datetime.now(timezone.utc)
+        newer = Snapshot(
+            project_id=project_id,
+            analysis_type="languages",
+            summary_json={},
+            created_at=now,
+        )
+        older = Snapshot(
+            project_id=project_id,
+            analysis_type="languages",
+            summary_json={},
+            created_at=now - timedelta(minutes=5),
+        )
+
+        await repository.create(newer, commit=False)
+        await repository.create(older, commit=False)
+
+        self.assertEqual(session.added, [newer, older])
+        self.assertEqual(len(session.statements), 2)
+        upsert = session.statements[1]
+        self.assertEqual(
+            upsert.compile(dialect=postgresql.dialect()).params["created_at"],
+            older.created_at,
+        )
+        # The pointer only moves to a row at least as new as the one it holds,
+        # so the out-of-order older snapshot leaves it on ``newer``.
+        self.assertIn(
+            "ON CONFLICT (project_id, analysis_type) DO UPDATE SET "
+            "snapshot_id = excluded.snapshot_id, created_at = excluded.created_at "
+            "WHERE project_latest_snapshot.created_at <= excluded.created_at",
+            _sql(upsert),
+        )
+
+
+class TestLatestLookup(unittest.IsolatedAsyncioTestCase):
+    async def test_latest_snapshot_is_read_through_the_pointer_table(self) -> None:
+        session = _RecordingSession()
+        repository = SnapshotRepository(session)
+
+        await repository.get_latest_by_project_and_type(uuid.uuid4(), "api_endpoints")
+
+        sql = _sql(session.statements[0])
+        self.assertIn(
+            "JOIN project_latest_snapshot "
+            "ON project_latest_snapshot.snapshot_id = snapshots.id",
+            sql,
+        )
+        self.assertNotIn("ORDER BY", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from app.core.settings import GIT_CLONE_SHALLOW_DEPTH
+from app.domains.projects.services.project_settings import (
+    clone_options,
+    load_project_settings,
+    resolve_project_settings,
+)
+
+_DEFAULT_STRATEGY = (
+    "app.domains.projects.services.project_settings.GIT_CLONE_DEFAULT_STRATEGY"
+)
+
+
+class TestCloneOptions(unittest.TestCase):
+    def test_shallow_single_branch_arguments(self) -> None:
+        settings = load_project_settings(
+            {"clone": {"strategy": "shallow", "single_branch": True, "branch": "main"}}
+        )
+
+        options = clone_options(settings)
+
+        self.assertEqual(
+            options.arguments(),
+            ["--depth", str(GIT_CLONE_SHALLOW_DEPTH), "--single-branch", "--branch", "main"],
+        )
+
+    def test_blobless_sparse_arguments(self) -> None:
+        settings = load_project_settings(
+            {"clone": {"strategy": "blobless", "sparse_paths": ["src", "api/v1"]}}
+        )
+
+        options = clone_options(settings)
+
+        self.assertEqual(options.arguments(), ["--filter=blob:none", "--sparse"])
+        self.assertEqual(options.sparse_paths, ("src", "api/v1"))
+
+    def test_rejects_inconsistent_settings(self) -> None:
+        for clone in (
+            {"strategy": "full", "sparse_paths": ["src"]},
+            {"strategy": "blobless", "depth": 5},
+            {"strategy": "blobless", "sparse_paths": ["../outside"]},
+            {"strategy": "blobless", "sparse_paths": ["--no-cone"]},
+        ):
+            with self.assertRaises(ValueError):
+                clone_options(load_project_settings({"clone": clone}))
+
+    def test_resolved_settings_survive_a_default_strategy_change(self) -> None:
+        with mock.patch(_DEFAULT_STRATEGY, "blobless"):
+            stored = resolve_project_settings(load_project_settings({})).model_dump(
+                mode="json"
+            )
+        self.assertEqual(stored["clone"]["strategy"], "blobless")
+
+        with mock.patch(_DEFAULT_STRATEGY, "full"):
+            options = clone_options(load_project_settings(stored))
+        self.assertTrue(options.blobless)
+
+    def test_settings_without_strategy_use_the_one_their_options_imply(self) -> None:
+        with mock.patch(_DEFAULT_STRATEGY, "blobless"):
+            options = clone_options(load_project_settings({"clone": {"depth": 3}}))
+        self.assertEqual(options.depth, 3)
+        self.assertFalse(options.blobless)
+
+
+if __name__ == "__main__":
+    unittest.main()
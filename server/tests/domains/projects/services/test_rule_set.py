@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import fnmatch
+import unittest
+
+from app.domains.projects.services.rule_set import CompiledRuleSet, GlobMatcher
+
+
+class TestGlobMatcher(unittest.TestCase):
+    def test_matches_like_fnmatch(self) -> None:
+        patterns = [
+            "dockerfile",
+            "*.tf",
+            "infra/*.tf",
+            "docker-compose*",
+            "*k8s*",
+            "chart?.yaml",
+            "*.y[a]ml",
+            "*",
+            "missing.txt",
+        ]
+        targets = {
+            "dockerfile",
+            "main.tf",
+            "infra/main.tf",
+            "docker-compose.override.yml",
+            "deploy/k8s/app.yaml",
+            "chart1.yaml",
+            "values.yml",
+        }
+        expected = {
+            pattern
+            for pattern in patterns
+            if any(fnmatch.fnmatch(target, pattern) for target in targets)
+        }
+
+        self.assertEqual(GlobMatcher(patterns).matches(targets), expected)
+        self.assertEqual(len(GlobMatcher(patterns)), len(patterns))
+
+
+class TestCompiledRuleSet(unittest.TestCase):
+    def test_scores_exact_and_glob_rules_in_rule_order(self) -> None:
+        rule_set = CompiledRuleSet(
+            [
+                ("Docker", "file", "compose.yaml", 1),
+                ("Terraform", "glob", "*.TF", 2),
+                ("Docker", "file", " Dockerfile ", 1),
+                ("Docker", "glob", "docker-compose*", 1),
+                ("Kubernetes", "directory", "k8s", 1),
+                ("Empty", "file", "  ", 5),
+            ]
+        )
+        signals = {"file": {"dockerfile"}, "directory": {"src"}}
+        targets = {"main.tf", "docker-compose.yml", "dockerfile"}
+
+        scores = rule_set.score(signals, glob_targets=targets)
+
+        self.assertEqual(scores, {"Terraform": 2, "Docker": 2})
+        self.assertEqual(list(scores), ["Terraform", "Docker"])
+        self.assertEqual(rule_set.score(signals), {"Docker": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.domains.projects.models.retention import RetentionPolicy
+from app.domains.projects.services.snapshot_retention import select_expired_snapshots
+
+NOW = datetime(2026, 3, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def _snapshots(*ages: timedelta) -> list[tuple[uuid.UUID, datetime]]:
+    return [(uuid.uuid4(), NOW - age) for age in ages]
+
+
+class TestSelectExpiredSnapshots(unittest.TestCase):
+    def test_keeps_last_n_daily_and_weekly_representatives(self) -> None:
+        snapshots = _snapshots(
+            timedelta(hours=1),
+            timedelta(hours=2),
+            timedelta(hours=3),
+            timedelta(days=1, hours=1),
+            timedelta(days=1, hours=2),
+            timedelta(days=60),
+            timedelta(days=60, hours=1),
+        )
+        policy = RetentionPolicy(keep_last=2, keep_daily_days=7, keep_weekly_weeks=None)
+
+        expired = select_expired_snapshots(snapshots, policy, NOW)
+
+        self.assertEqual(
+            expired, [snapshots[2][0], snapshots[4][0], snapshots[6][0]]
+        )
+
+    def test_always_keeps_newest_and_honours_weekly_window(self) -> None:
+        snapshots = _snapshots(timedelta(days=3), timedelta(days=30), timedelta(days=90))
+        policy = RetentionPolicy(keep_last=0, keep_daily_days=0, keep_weekly_weeks=8)
+
+        expired = select_expired_snapshots(snapshots, policy, NOW)
+
+        self.assertEqual(expired, [snapshots[2][0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from app.domains.projects.models.dto.project import ProjectPublic
+from app.domains.projects.services.snapshot_service import SnapshotService
+from app.infrastructure.persistence.postgres.projects.entities.snapshot import Snapshot
+
+
+class _FakeSnapshotRepository:
+    """Stages writes until commit, like a session would."""
+
+    def __init__(self) -> None:
+        self.pending: list[object] = []
+        self.stored: list[object] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def create(self, snapshot: Snapshot, commit: bool = True) -> Snapshot:
+        self.pending.append(snapshot)
+        if commit:
+            await self.commit()
+        return snapshot
+
+    async def commit(self) -> None:
+        self.commits += 1
+        self.stored.extend(self.pending)
+        self.pending.clear()
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+        self.pending.clear()
+
+
+class _FakeProjectService:
+    def __init__(self, project_id: uuid.UUID) -> None:
+        self.project = ProjectPublic(
+            id=project_id,
+            name="demo",
+            description=None,
+            source_type="local",
+            source_ref="/tmp",
+            created_at=datetime.now(timezone.utc),
+            last_analysis_at=None,
+        )
+        self.lookups = 0
+
+    async def get_project(self, project_id: uuid.UUID) -> ProjectPublic | None:
+        self.lookups += 1
+        return self.project if project_id == self.project.id else None
+
+
+class TestUnitOfWork(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.project_id = uuid.uuid4()
+        self.repository = _FakeSnapshotRepository()
+        self.project_service = _FakeProjectService(self.project_id)
+        self.service = SnapshotService(self.repository, self.project_service)
+
+    async def stage_snapshot_with_rows(self) -> Snapshot:
+        snapshot = await self.service.create_snapshot(
+            self.project_id, {"title": "demo"}, commit=False
+        )
+        self.repository.pending.extend(["row-1", "row-2"])
+        return snapshot
+
+    async def test_commits_snapshot_and_rows_together(self) -> None:
+        async with self.service.unit_of_work():
+            snapshot = await self.stage_snapshot_with_rows()
+            self.assertEqual(self.repository.stored, [])
+
+        self.assertEqual(self.repository.stored, [snapshot, "row-1", "row-2"])
+        self.assertEqual(self.repository.commits, 1)
+
+    async def test_exception_rolls_back_snapshot_and_rows(self) -> None:
+        with self.assertRaises(RuntimeError):
+            async with self.service.unit_of_work():
+                await self.stage_snapshot_with_rows()
+                raise RuntimeError("row insert failed")
+
+        self.assertEqual(self.repository.stored, [])
+        self.assertEqual(self.repository.pending, [])
+        self.assertEqual(self.repository.commits, 0)
+        self.assertEqual(self.repository.rollbacks, 1)
+
+    async def test_inner_unit_defers_to_the_outer_one(self) -> None:
+        async with self.service.unit_of_work():
+            async with self.service.unit_of_work(commit=False):
+                first = await self.stage_snapshot_with_rows()
+            self.assertEqual(self.repository.commits, 0)
+            async with self.service.unit_of_work(commit=False):
+                second = await self.stage_snapshot_with_rows()
+
+        self.assertEqual(self.repository.commits, 1)
+        self.assertEqual(
+            self.repository.stored, [first, "row-1", "row-2", second, "row-1", "row-2"]
+        )
+
+    async def test_inner_failure_rolls_back_the_outer_unit(self) -> None:
+        with self.assertRaises(RuntimeError):
+            async with self.service.unit_of_work():
+                async with self.service.unit_of_work(commit=False):
+                    await self.stage_snapshot_with_rows()
+                async with self.service.unit_of_work(commit=False):
+                    await self.stage_snapshot_with_rows()
+                    raise RuntimeError("second analysis failed")
+
+        self.assertEqual(self.repository.stored, [])
+        self.assertEqual(self.repository.commits, 0)
+        self.assertEqual(self.repository.rollbacks, 1)
+
+
+class TestCreateSnapshot(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.project_id = uuid.uuid4()
+        self.repository = _FakeSnapshotRepository()
+        self.project_service = _FakeProjectService(self.project_id)
+        self.service = SnapshotService(self.repository, self.project_service)
+
+    async def test_looks_up_the_project_unless_already_checked(self) -> None:
+        await self.service.create_snapshot(self.project_id, {})
+        await self.service.create_snapshot(self.project_id, {}, project_checked=True)
+
+        self.assertEqual(self.project_service.lookups, 1)
+        self.assertEqual(self.repository.commits, 2)
+
+    async def test_rejects_an_unknown_project(self) -> None:
+        with self.assertRaises(ValueError):
+            await self.service.create_snapshot(uuid.uuid4(), {})
+        self.assertEqual(self.repository.pending, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
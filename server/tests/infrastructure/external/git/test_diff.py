@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.infrastructure.external.git.diff import diff_name_status
+
+
+def _git(root: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(root), *args], check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+class TestDiffNameStatus(unittest.TestCase):
+    def test_reports_changes_between_commits_and_skips_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            _git(root, "init", "-q")
+            _git(root, "config", "user.email", "dev@example.com")
+            _git(root, "config", "user.name", "dev")
+            (root / "node_modules").mkdir()
+            (root / "keep.py").write_text("a\n")
+            (root / "edit.py").write_text("a\n")
+            (root / "gone.py").write_text("a\n")
+            _git(root, "add", "-A")
+            _git(root, "commit", "-qm", "base")
+            base = _git(root, "rev-parse", "HEAD")
+
+            (root / "edit.py").write_text("b\n")
+            (root / "gone.py").unlink()
+            (root / "new.py").write_text("a\n")
+            (root / "node_modules" / "dep.js").write_text("a\n")
+            _git(root, "add", "-A")
+            _git(root, "commit", "-qm", "change")
+            head = _git(root, "rev-parse", "HEAD")
+
+            changes = diff_name_status(root, base, head)
+            assert changes is not None
+            changes = changes.without_ignored({"node_modules"})
+            self.assertEqual(changes.added, {"new.py"})
+            self.assertEqual(changes.modified, {"edit.py"})
+            self.assertEqual(changes.deleted, {"gone.py"})
+
+            (root / "untracked.py").write_text("a\n")
+            self.assertIsNone(diff_name_status(root, base, head))
+
+    def test_sparse_checkout_requires_a_full_scan(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            origin = Path(tmp_dir) / "origin"
+            (origin / "svc").mkdir(parents=True)
+            (origin / "web").mkdir()
+            _git(origin, "init", "-q")
+            _git(origin, "config", "user.email", "dev@example.com")
+            _git(origin, "config", "user.name", "dev")
+            (origin / "svc" / "api.py").write_text("a\n")
+            (origin / "web" / "app.ts").write_text("a\n")
+            _git(origin, "add", "-A")
+            _git(origin, "commit", "-qm", "base")
+            base = _git(origin, "rev-parse", "HEAD")
+            (origin / "web" / "page.ts").write_text("a\n")
+            _git(origin, "add", "-A")
+            _git(origin, "commit", "-qm", "change")
+            head = _git(origin, "rev-parse", "HEAD")
+
+            checkout = Path(tmp_dir) / "checkout"
+            _git(
+                Path(tmp_dir), "clone", "-q", "--sparse", f"file://{origin}", str(checkout)
+            )
+            _git(checkout, "sparse-checkout", "set", "svc")
+
+            self.assertFalse((checkout / "web").exists())
+            self.assertIsNotNone(diff_name_status(origin, base, head))
+            self.assertIsNone(diff_name_status(checkout, base, head))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import subprocess
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from app.infrastructure.external.git.clone import checkout_lock
+from app.infrastructure.external.git.sync import sync_repository
+
+
+def _git(root: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(root), *args], check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+class TestSyncRepository(unittest.TestCase):
+    def test_fetches_and_resets_to_upstream_within_staleness_window(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            origin = Path(tmp_dir) / "origin"
+            origin.mkdir()
+            _git(origin, "init", "-q")
+            _git(origin, "config", "user.email", "dev@example.com")
+            _git(origin, "config", "user.name", "dev")
+            (origin / "a.py").write_text("a\n")
+            _git(origin, "add", "-A")
+            _git(origin, "commit", "-qm", "base")
+            checkout = Path(tmp_dir) / "checkout"
+            _git(Path(tmp_dir), "clone", "-q", str(origin), str(checkout))
+
+            (origin / "b.py").write_text("b\n")
+            _git(origin, "add", "-A")
+            _git(origin, "commit", "-qm", "change")
+            (checkout / "scratch.txt").write_text("local\n")
+
+            skipped = sync_repository(checkout, max_age_seconds=3600)
+            self.assertFalse(skipped.fetched)
+            self.assertFalse((checkout / "b.py").exists())
+
+            result = sync_repository(checkout)
+            self.assertTrue(result.fetched)
+            self.assertTrue(result.changed)
+            self.assertGreater(result.fetched_bytes, 0)
+            self.assertEqual(result.head_after, _git(origin, "rev-parse", "HEAD"))
+            self.assertTrue((checkout / "b.py").exists())
+            self.assertFalse((checkout / "scratch.txt").exists())
+
+    def test_waits_for_readers_of_the_checkout(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            origin = Path(tmp_dir) / "origin"
+            origin.mkdir()
+            _git(origin, "init", "-q")
+            _git(origin, "config", "user.email", "dev@example.com")
+            _git(origin, "config", "user.name", "dev")
+            (origin / "a.py").write_text("a\n")
+            _git(origin, "add", "-A")
+            _git(origin, "commit", "-qm", "base")
+            checkout = Path(tmp_dir) / "checkout"
+            _git(Path(tmp_dir), "clone", "-q", str(origin), str(checkout))
+            (origin / "b.py").write_text("b\n")
+            _git(origin, "add", "-A")
+            _git(origin, "commit", "-qm", "change")
+
+            with checkout_lock(checkout, shared=True):
+                head = _git(checkout, "rev-parse", "HEAD")
+                syncing = threading.Thread(target=sync_repository, args=(checkout,))
+                syncing.start()
+                syncing.join(timeout=0.5)
+                self.assertTrue(syncing.is_alive())
+                self.assertEqual(_git(checkout, "rev-parse", "HEAD"), head)
+                self.assertFalse((checkout / "b.py").exists())
+            syncing.join(timeout=30)
+
+            self.assertFalse(syncing.is_alive())
+            self.assertTrue((checkout / "b.py").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
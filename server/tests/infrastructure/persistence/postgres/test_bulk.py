@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from types import SimpleNamespace
+
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from app.infrastructure.persistence.postgres.analysis.entities.snapshot_language import (
+    SnapshotLanguage,
+)
+from app.infrastructure.persistence.postgres.bulk import insert_returning
+
+
+class _RecordingSession:
+    def __init__(self, dialect: object) -> None:
+        self.bind = SimpleNamespace(dialect=dialect)
+        self.calls: list[tuple[object, list[dict[str, object]]]] = []
+
+    async def scalars(self, statement: object, rows: list[dict[str, object]]):
+        self.calls.append((statement, rows))
+        loaded = [f"loaded-{index}" for index in range(len(rows))]
+        return SimpleNamespace(all=lambda: loaded)
+
+
+def _languages(count: int) -> list[SnapshotLanguage]:
+    snapshot_id = uuid.uuid4()
+    return [
+        SnapshotLanguage(
+            snapshot_id=snapshot_id, language=f"lang-{index}", weight=index
+        )
+        for index in range(count)
+    ]
+
+
+class TestInsertReturning(unittest.IsolatedAsyncioTestCase):
+    async def test_rows_omit_server_default_columns(self) -> None:
+        session = _RecordingSession(PGDialect_asyncpg())
+        entries = _languages(3)
+
+        loaded = await insert_returning(session, SnapshotLanguage, entries)
+
+        self.assertEqual(loaded, ["loaded-0", "loaded-1", "loaded-2"])
+        self.assertEqual(len(session.calls), 1)
+        statement, rows = session.calls[0]
+        self.assertEqual(
+            rows,
+            [
+                {
+                    "id": entry.id,
+                    "snapshot_id": entry.snapshot_id,
+                    "language": entry.language,
+                    "weight": entry.weight,
+                }
+                for entry in entries
+            ],
+        )
+        sql = str(statement.compile(dialect=PGDialect_asyncpg()))
+        self.assertIn("INSERT INTO snapshot_languages", sql)
+        self.assertIn("RETURNING", sql)
+        self.assertIn("snapshot_languages.created_at", sql.split("RETURNING", 1)[1])
+
+    async def test_pages_fill_the_bind_parameter_limit(self) -> None:
+        # Each SnapshotLanguage row binds four parameters.
+        for max_parameters, count, expected_pages in (
+            (20, 12, [5, 5, 2]),
+            (20, 5, [5]),
+            (7, 3, [1, 1, 1]),
+        ):
+            with self.subTest(max_parameters=max_parameters, count=count):
+                session = _RecordingSession(
+                    SimpleNamespace(insertmanyvalues_max_parameters=max_parameters)
+                )
+
+                await insert_returning(session, SnapshotLanguage, _languages(count))
+
+                statement, rows = session.calls[0]
+                page_size = statement.get_execution_options()[
+                    "insertmanyvalues_page_size"
+                ]
+                pages = [
+                    len(rows[start : start + page_size])
+                    for start in range(0, len(rows), page_size)
+                ]
+                self.assertEqual(pages, expected_pages)
+
+    async def test_page_size_uses_the_asyncpg_limit(self) -> None:
+        session = _RecordingSession(PGDialect_asyncpg())
+
+        await insert_returning(session, SnapshotLanguage, _languages(3))
+
+        statement, _rows = session.calls[0]
+        self.assertEqual(
+            statement.get_execution_options()["insertmanyvalues_page_size"],
+            PGDialect_asyncpg.insertmanyvalues_max_parameters // 4,
+        )
+
+    async def test_empty_input_skips_the_round_trip(self) -> None:
+        session = _RecordingSession(PGDialect_asyncpg())
+
+        self.assertEqual(await insert_returning(session, SnapshotLanguage, []), [])
+        self.assertEqual(session.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
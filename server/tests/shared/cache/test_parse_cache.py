@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.shared.cache.parse_cache import ParseCache
+
+
+class TestParseCache(unittest.TestCase):
+    def test_reparses_only_changed_files_and_evicts_least_recently_used(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root_path = Path(tmp_dir)
+            first = root_path / "first.py"
+            second = root_path / "second.py"
+            first.write_text("import os\n")
+            second.write_text("import sys\n")
+            parsed: list[Path] = []
+
+            def parse(paths: list[Path]) -> list[set[str]]:
+                parsed.extend(paths)
+                return [{path.read_text().split()[1]} for path in paths]
+
+            cache = ParseCache(root_path / "cache" / "parse.sqlite3", max_bytes=1024)
+            paths = [first, second]
+            self.assertEqual(
+                cache.parse_many("imports", 1, paths, parse, sorted, set),
+                [{"os"}, {"sys"}],
+            )
+            self.assertEqual(
+                cache.parse_many("imports", 1, paths, parse, sorted, set),
+                [{"os"}, {"sys"}],
+            )
+            self.assertEqual(parsed, [first, second])
+
+            second.write_text("import json\n")
+            os.utime(second, ns=(0, 1))
+            self.assertEqual(
+                cache.parse_many("imports", 1, paths, parse, sorted, set),
+                [{"os"}, {"json"}],
+            )
+            cache.parse_many("imports", 2, [first], parse, sorted, set)
+            self.assertEqual(parsed, [first, second, second, first])
+            self.assertEqual(cache.stats(), {"hits": 3, "misses": 4, "evictions": 0})
+
+            cache.max_bytes = 8
+            cache.parse_many("other", 1, [first], parse, sorted, set)
+            self.assertEqual(cache.stats()["evictions"], 3)
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+
+from app.shared.concurrency.executor import BlockingExecutor
+
+
+class TestBlockingExecutor(unittest.IsolatedAsyncioTestCase):
+    async def test_blocking_call_does_not_stall_event_loop(self) -> None:
+        executor = BlockingExecutor("test", max_workers=1)
+        self.addCleanup(executor.shutdown)
+        release = threading.Event()
+
+        def blocking_work(value: int) -> int:
+            release.wait(timeout=5)
+            return value * 2
+
+        task = asyncio.create_task(executor.run(blocking_work, 21))
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertFalse(task.done())
+
+        release.set()
+        self.assertEqual(await task, 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from app.shared.concurrency.file_lock import async_file_lock, file_lock
+
+
+class TestFileLock(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = Path(tmp_dir.name) / ".locks" / "checkout.lock"
+
+    async def test_shared_holders_keep_the_exclusive_holder_waiting(self) -> None:
+        order: list[str] = []
+
+        async def writer() -> None:
+            async with async_file_lock(self.path):
+                order.append("writer")
+
+        async with async_file_lock(self.path, shared=True):
+            async with async_file_lock(self.path, shared=True):
+                waiting = asyncio.create_task(writer())
+                await asyncio.sleep(0.05)
+                order.append("readers")
+        await waiting
+
+        self.assertEqual(order, ["readers", "writer"])
+
+    async def test_waiting_does_not_block_the_event_loop(self) -> None:
+        released = threading.Event()
+
+        def hold() -> None:
+            with file_lock(self.path):
+                released.wait()
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        self.addCleanup(holder.join)
+        self.addCleanup(released.set)
+        while not self.path.exists():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+
+        reader = asyncio.create_task(self._read())
+        await asyncio.sleep(0.05)
+        self.assertFalse(reader.done())
+        released.set()
+        self.assertEqual(await asyncio.wait_for(reader, timeout=5), "read")
+
+    async def _read(self) -> str:
+        async with async_file_lock(self.path, shared=True):
+            return "read"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.domains.projects.services.framework_detector import _parse_imports
+from app.shared.concurrency.parse_pool import ParsePool
+
+_MODULES = ("fastapi", "django", "flask", "sqlalchemy", "pydantic", "celery")
+
+
+class TestParsePool(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.paths = []
+        for index in range(23):
+            path = Path(tmp_dir.name) / f"module_{index}.py"
+            first = _MODULES[index % len(_MODULES)]
+            second = _MODULES[(index * 5) % len(_MODULES)]
+            path.write_text(f"import {first}\nfrom {second}.sub import name\n")
+            self.paths.append(path)
+
+    def build_pool(self) -> ParsePool:
+        pool = ParsePool(max_workers=2, chunk_size=4, min_files=10)
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def test_small_inputs_are_parsed_inline(self) -> None:
+        pool = self.build_pool()
+
+        results = pool.parse_each(_parse_imports, self.paths[:9])
+
+        self.assertIsNone(pool._executor)
+        self.assertEqual(results, [_parse_imports(path) for path in self.paths[:9]])
+
+    def test_large_inputs_match_the_serial_path(self) -> None:
+        pool = self.build_pool()
+        serial = [_parse_imports(path) for path in self.paths]
+        self.assertEqual(set().union(*serial), set(_MODULES))
+
+        results = pool.parse_each(_parse_imports, self.paths)
+
+        self.assertIsNotNone(pool._executor)
+        self.assertEqual(results, serial)
+        self.assertEqual(
+            pool.parse_tokens(_parse_imports, self.paths), set().union(*serial)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
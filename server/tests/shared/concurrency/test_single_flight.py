@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from app.shared.concurrency.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        flights: SingleFlight[int] = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def clone() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return calls
+
+        waiters = [asyncio.create_task(flights.run("project", clone)) for _ in range(5)]
+        await asyncio.sleep(0)
+        waiters[0].cancel()
+        release.set()
+        results = await asyncio.gather(*waiters[1:])
+
+        self.assertEqual(results, [1, 1, 1, 1])
+        self.assertEqual(len(flights), 0)
+        self.assertEqual(await flights.run("project", clone), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.shared.filesystem.scan_index import ScanIndex
+
+
+class TestScanIndex(unittest.TestCase):
+    def test_indexes_files_and_directories_once_skipping_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root_path = Path(tmp_dir)
+            (root_path / "app" / "api").mkdir(parents=True)
+            (root_path / "node_modules" / "react").mkdir(parents=True)
+            (root_path / "app" / "main.py").write_text("import fastapi\n")
+            (root_path / "app" / "api" / "routes.PY").write_text("")
+            (root_path / "requirements.txt").write_text("fastapi\n")
+            (root_path / "node_modules" / "react" / "index.js").write_text("")
+
+            index = ScanIndex.build(root_path, {"node_modules"})
+
+            self.assertEqual(
+                set(index.relative_files()),
+                {"app/main.py", "app/api/routes.PY", "requirements.txt"},
+            )
+            self.assertEqual(set(index.relative_directories()), {"app", "app/api"})
+            self.assertEqual(index.suffix_counts(), {".py": 2, ".txt": 1})
+            self.assertEqual(
+                sorted(path.name for path in index.files_with_suffix(".py")),
+                ["main.py", "routes.PY"],
+            )
+            self.assertEqual(
+                [path for path in index.files_named("requirements.txt")],
+                [root_path / "requirements.txt"],
+            )
+            self.assertEqual(len(index), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.shared.filesystem.scanner import FileSystemScanner
+
+
+class TestFileSystemScanner(unittest.TestCase):
+    def test_walk_prunes_ignored_directories_before_descending(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root_path = Path(tmp_dir)
+            (root_path / "src" / "pkg").mkdir(parents=True)
+            (root_path / "src" / "pkg" / "module.py").write_text("")
+            (root_path / "src" / ".git" / "objects").mkdir(parents=True)
+            (root_path / "src" / ".git" / "objects" / "blob").write_text("")
+            (root_path / "node_modules" / "react").mkdir(parents=True)
+            (root_path / "node_modules" / "react" / "index.js").write_text("")
+
+            scanner = FileSystemScanner(root_path, {".git", "node_modules"})
+            entries = {entry.relative_path: entry.is_dir for entry in scanner.walk()}
+
+            self.assertEqual(
+                entries,
+                {"src": True, "src/pkg": True, "src/pkg/module.py": False},
+            )
+            self.assertEqual(
+                list(scanner.scan_files()), [root_path / "src" / "pkg" / "module.py"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
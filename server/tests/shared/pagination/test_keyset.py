@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from app.shared.pagination.keyset import decode_cursor, encode_cursor
+
+
+class TestKeysetCursor(unittest.TestCase):
+    def test_round_trips_position_and_rejects_garbage(self) -> None:
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+        row_id = uuid.uuid4()
+
+        cursor = encode_cursor(created_at, row_id)
+
+        self.assertNotIn("=", cursor)
+        self.assertEqual(decode_cursor(cursor), (created_at, row_id))
+        for garbage in ("", "not-a-cursor", encode_cursor(created_at, row_id)[:-4]):
+            with self.assertRaises(ValueError):
+                decode_cursor(garbage)
+
+
+if __name__ == "__main__":
+    unittest.main()